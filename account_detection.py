@@ -0,0 +1,84 @@
+"""
+Account Detection
+Finds the logged-in account name in Game.log without reading the whole file
+"""
+
+import mmap
+import re
+
+ACCOUNT_MARKER = b"<AccountLoginCharacterStatus_Character>"
+
+# Tried in order until one of them extracts the name
+ACCOUNT_NAME_PATTERNS = [
+    re.compile(r'- name ([^\s-]+) -'),  # Match: - name Voisys -
+    re.compile(r'- name ([^\s-]+)\s'),  # Match: - name Voisys (space)
+    re.compile(r' name ([^\s-]+) -'),   # Match: name Voisys -
+    re.compile(r' name ([^\s-]+)\s'),   # Match: name Voisys (space)
+]
+
+
+def parse_account_name(line):
+    """
+    Parse account name from log line
+
+    Example line:
+    <2025-10-26T18:45:08.760Z> [Notice] <AccountLoginCharacterStatus_Character> Character: createdAt 1760624040745 - updatedAt 1760624048129 - geid 201996731201 - accountId 4624674 - name Voisys - state STATE_CURRENT [Team_GameServices][Login]
+
+    Args:
+        line: Decoded log line
+
+    Returns:
+        Account name if found, None otherwise
+    """
+    if "<AccountLoginCharacterStatus_Character>" in line:
+        for pattern in ACCOUNT_NAME_PATTERNS:
+            match = pattern.search(line)
+            if match:
+                name = match.group(1)
+                print(f"[Debug] Account name detected with pattern '{pattern.pattern}': {name}")
+                return name
+
+        # Debug: print the line if no pattern matched
+        print(f"[Debug] Could not extract name from line: {line[:200]}")
+    return None
+
+
+def find_account_name(path):
+    """
+    Find the most recent account name in a log file
+
+    The file is memory-mapped and searched backwards for the raw login marker,
+    so only the matching lines are ever decoded.
+
+    Args:
+        path: Path to the log file
+
+    Returns:
+        Account name if found, None otherwise
+    """
+    with open(path, 'rb') as file:
+        try:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return None
+
+    with data:
+        end = len(data)
+        while True:
+            marker_pos = data.rfind(ACCOUNT_MARKER, 0, end)
+            if marker_pos < 0:
+                return None
+
+            line_start = data.rfind(b"\n", 0, marker_pos) + 1
+            line_end = data.find(b"\n", marker_pos)
+            if line_end < 0:
+                line_end = len(data)
+
+            line = data[line_start:line_end].decode('utf-8', errors='ignore')
+            name = parse_account_name(line + "\n")
+            if name:
+                return name
+
+            # Keep looking further back if this login line could not be parsed
+            end = line_start
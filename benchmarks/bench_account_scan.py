@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Account Detection Benchmark
+Compares the reverse mmap search against the old full line-by-line scan
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import account_detection
+from account_detection import find_account_name, parse_account_name
+from test_log_generator import generate_random_log_line
+
+LOGIN_LINE = ("<2025-10-26T18:45:08.760Z> [Notice] <AccountLoginCharacterStatus_Character> Character: "
+              "createdAt 1760624040745 - updatedAt 1760624048129 - geid 201996731201 - accountId 4624674 "
+              "- name {name} - state STATE_CURRENT [Team_GameServices][Login]\n")
+
+
+def write_synthetic_log(path, size_mb, login_positions, seed=1234):
+    """
+    Write a synthetic log with login lines at the given relative positions
+
+    Args:
+        path: Output file path
+        size_mb: Approximate size of the log in megabytes
+        login_positions: Positions between 0.0 and 1.0 where a login line is written
+        seed: Random seed so every run uses the same content
+    """
+    random.seed(seed)
+    block = "".join(f"{generate_random_log_line()}\n" for _ in range(20000)).encode("utf-8")
+    block_count = max(1, (size_mb * 1024 * 1024) // len(block))
+    login_blocks = {min(block_count - 1, int(position * block_count)): index
+                    for index, position in enumerate(login_positions)}
+
+    with open(path, "wb") as file:
+        for block_index in range(block_count):
+            file.write(block)
+            if block_index in login_blocks:
+                name = f"Login{login_blocks[block_index]}"
+                file.write(LOGIN_LINE.format(name=name).encode("utf-8"))
+
+
+def full_scan(path):
+    """Scan every line of the file the way monitor_log_file used to"""
+    with open(path, 'r', encoding='utf-8', errors='ignore') as file:
+        for line in file:
+            detected_name = parse_account_name(line)
+            if detected_name:
+                return detected_name
+    return None
+
+
+SCENARIOS = {
+    "login_at_start": [0.0],
+    "relog_near_end": [0.0, 0.99],
+    "login_at_end": [1.0],
+    "no_login": [],
+}
+
+
+def run_benchmark(size_mb=500):
+    """
+    Run the account detection benchmark
+
+    Args:
+        size_mb: Size of the synthetic logs in megabytes
+
+    Returns:
+        Dictionary with timings for both approaches in every scenario
+    """
+    # Keep the benchmark output readable
+    account_detection.print = lambda *args, **kwargs: None
+
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "Game.log")
+        for scenario, login_positions in SCENARIOS.items():
+            write_synthetic_log(path, size_mb, login_positions)
+
+            results[scenario] = {"size_mb": os.path.getsize(path) / 1e6}
+            for name, scan in (("full_scan", full_scan), ("reverse_mmap", find_account_name)):
+                began = time.perf_counter()
+                account = scan(path)
+                results[scenario][name] = {"seconds": time.perf_counter() - began, "account": account}
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark account name detection on a large log")
+    parser.add_argument("--size-mb", type=int, default=500, help="Size of the synthetic log in megabytes")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.size_mb)
+    for scenario, result in results.items():
+        print(f"{scenario} ({result['size_mb']:.0f} MB)")
+        for name in ("full_scan", "reverse_mmap"):
+            r = result[name]
+            print(f"  {name:<13} {r['seconds'] * 1000:>10.1f} ms  account: {r['account']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Backfill Benchmark
+Compares the parallel range backfill against reading the same logs line by line in one process
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import event_store
+import log_backfill
+from death_event import create_death_event
+from death_parser import parse_death_line
+from event_store import EventStore
+from log_backfill import BACKUP_DIR_NAME, backfill, find_history_logs
+from test_log_generator import generate_random_log_line
+
+
+def log_block(line_count, death_percent):
+    """Build a block of generated log lines with roughly the given share of death lines"""
+    lines = []
+    while len(lines) < line_count:
+        line = generate_random_log_line()
+        # The generator writes about 20% death lines; real sessions have far fewer
+        if "<Actor Death>" in line and random.random() * 20 >= death_percent:
+            continue
+        lines.append(f"{line}\n")
+    return "".join(lines).encode("utf-8")
+
+
+def write_history(log_dir, size_mb, backups, death_percent=1.0, seed=1234):
+    """
+    Write a Game.log and a logbackups folder of synthetic logs
+
+    Args:
+        log_dir: Folder that receives Game.log and logbackups
+        size_mb: Approximate size of each log in megabytes
+        backups: Number of backup logs of previous sessions
+        death_percent: Share of death lines in the logs, in percent
+        seed: Random seed so every run uses the same content
+
+    Returns:
+        Path of the current Game.log
+    """
+    random.seed(seed)
+    backup_dir = log_dir / BACKUP_DIR_NAME
+    backup_dir.mkdir(parents=True, exist_ok=True)
+
+    paths = [backup_dir / f"Game Build(0) session {index}.log" for index in range(backups)]
+    paths.append(log_dir / "Game.log")
+    for index, path in enumerate(paths):
+        block = log_block(20000, death_percent)
+        with open(path, "wb") as file:
+            for _ in range(max(1, (size_mb * 1024 * 1024) // len(block))):
+                file.write(block)
+        # Backups are ordered by modification time
+        os.utime(path, (1700000000 + index, 1700000000 + index))
+    return paths[-1]
+
+
+def sequential_scan(paths):
+    """Read every line of every log in one process and parse the death lines"""
+    deaths = 0
+    for path in paths:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as file:
+            for line in file:
+                if "<Actor Death>" in line:
+                    parse_death_line(line.strip())
+                    deaths += 1
+    return deaths
+
+
+def run_benchmark(size_mb=100, backups=4, workers=None, death_percent=1.0):
+    """
+    Run the backfill benchmark
+
+    Args:
+        size_mb: Size of each synthetic log in megabytes
+        backups: Number of backup logs next to Game.log
+        workers: Worker processes for the parallel run; None uses every core
+        death_percent: Share of death lines in the logs, in percent
+
+    Returns:
+        Dictionary with MB/second of the sequential scan and both backfill modes
+    """
+    # Keep the benchmark output readable
+    event_store.print = lambda *args, **kwargs: None
+    log_backfill.print = lambda *args, **kwargs: None
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        logs = find_history_logs(write_history(Path(temp_dir), size_mb, backups, death_percent))
+        total_mb = sum(path.stat().st_size for path in logs) / (1024 * 1024)
+
+        began = time.perf_counter()
+        expected = sequential_scan(logs)
+        sequential_seconds = time.perf_counter() - began
+
+        results = {
+            "files": len(logs),
+            "total_mb": total_mb,
+            "cores": os.cpu_count(),
+            "sequential_mb_per_second": total_mb / sequential_seconds,
+        }
+        for name, worker_count in (("inline", 1), ("parallel", workers)):
+            store = CountingStore()
+            summary = backfill(logs, store, lambda line, parsed: parsed, workers=worker_count, chunk_size=16 * 1024 * 1024)
+            if summary.deaths != expected:
+                raise AssertionError(f"{name}: found {summary.deaths} deaths, expected {expected}")
+            results[f"{name}_mb_per_second"] = total_mb / summary.seconds
+            results[f"{name}_seconds"] = summary.seconds
+        results["deaths"] = expected
+
+        # The real store skips deaths it already holds, so importing again stores nothing
+        store = EventStore(":memory:")
+        first = backfill(logs[-1:], store, timestamped_event, workers=1)
+        second = backfill(logs[-1:], store, timestamped_event, workers=1)
+        results["repeat_stored"] = second.stored
+        results["first_stored"] = first.stored
+        store.close()
+    return results
+
+
+class CountingStore:
+    """Stand-in store that only counts appended events, so the timings cover parsing and merging"""
+
+    def append(self, events, keys=None):
+        return len(events)
+
+
+def timestamped_event(line, parsed):
+    """Build a DeathEvent without resolving names"""
+    return create_death_event(line, parsed, lambda weapon: weapon, lambda location: location)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the parallel log history backfill")
+    parser.add_argument("--size-mb", type=int, default=100, help="Size of each synthetic log")
+    parser.add_argument("--backups", type=int, default=4, help="Number of backup logs")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--death-percent", type=float, default=1.0, help="Share of death lines in percent")
+    args = parser.parse_args()
+
+    r = run_benchmark(args.size_mb, args.backups, args.workers, args.death_percent)
+    print(f"{r['files']} logs, {r['total_mb']:.0f} MB, {r['deaths']:,} deaths, {r['cores']} cores")
+    print(f"  sequential line scan  {r['sequential_mb_per_second']:>8.1f} MB/s")
+    print(f"  backfill inline       {r['inline_mb_per_second']:>8.1f} MB/s")
+    print(f"  backfill parallel     {r['parallel_mb_per_second']:>8.1f} MB/s")
+    print(f"  second backfill of Game.log stored {r['repeat_stored']} of {r['first_stored']} deaths again")
+    if r["repeat_stored"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
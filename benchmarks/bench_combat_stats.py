@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Combat Statistics Benchmark
+Feeds synthetic death events to CombatStats and checks its counters against a full recount
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_event_store import build_templates, synthetic_events
+from combat_stats import BUCKET_SECONDS, CombatStats, event_time
+
+ACCOUNT = "BenchPilot"
+
+
+def account_events(templates, count, seed=7):
+    """Yield synthetic events where the account is the killer, victim or a suicide in some of them"""
+    rng = random.Random(seed)
+    for event in synthetic_events(templates, count):
+        roll = rng.random()
+        if roll < 0.2:
+            yield event._replace(killer=ACCOUNT)
+        elif roll < 0.3:
+            yield event._replace(actor=ACCOUNT)
+        elif roll < 0.32:
+            yield event._replace(actor=ACCOUNT, killer=ACCOUNT, damage="Suicide")
+        else:
+            yield event
+
+
+def recount(templates, count, windows, now):
+    """
+    Count the same events from scratch
+
+    Returns:
+        Dictionary with kills, deaths, suicides, best_streak and windows like CombatStats.snapshot()
+    """
+    kills = deaths = suicides = streak = best = 0
+    own = []  # (bucket, kind) of every event involving the account
+    for event in account_events(templates, count):
+        if event.actor == ACCOUNT:
+            if event.killer == ACCOUNT or event.damage == "Suicide":
+                suicides += 1
+                kind = "suicides"
+            else:
+                deaths += 1
+                kind = "deaths"
+            streak = 0
+        elif event.killer == ACCOUNT:
+            kills += 1
+            streak += 1
+            best = max(best, streak)
+            kind = "kills"
+        else:
+            continue
+        own.append((int(event_time(event) // BUCKET_SECONDS), kind))
+
+    current = int(now // BUCKET_SECONDS)
+    totals = {}
+    for minutes in windows:
+        first = current - minutes * 60 // BUCKET_SECONDS + 1
+        counts = {"kills": 0, "deaths": 0, "suicides": 0}
+        for bucket, kind in own:
+            if first <= bucket <= current:
+                counts[kind] += 1
+        totals[minutes] = counts
+    return {"kills": kills, "deaths": deaths, "suicides": suicides, "best_streak": best, "windows": totals}
+
+
+def run_benchmark(event_count=1000000, batch_size=200, verify=True):
+    """
+    Run the combat statistics benchmark
+
+    Args:
+        event_count: Number of events fed to the statistics
+        batch_size: Events per add_events() call, like a queue batch
+        verify: Recount every event from scratch and compare
+
+    Returns:
+        Dictionary with events per second, snapshot latency and whether the counters matched
+    """
+    templates = build_templates()
+    stats = CombatStats()
+
+    # Only the add_events() calls are timed, not building the events
+    feed_seconds = 0.0
+    batch = []
+    last = None
+    for event in account_events(templates, event_count):
+        batch.append(event)
+        if len(batch) >= batch_size:
+            began = time.perf_counter()
+            stats.add_events(batch, ACCOUNT)
+            feed_seconds += time.perf_counter() - began
+            last = batch[-1]
+            batch = []
+    if batch:
+        began = time.perf_counter()
+        stats.add_events(batch, ACCOUNT)
+        feed_seconds += time.perf_counter() - began
+        last = batch[-1]
+
+    now = event_time(last)
+    began = time.perf_counter()
+    for _ in range(100):
+        snapshot = stats.snapshot(now)
+    snapshot_ms = (time.perf_counter() - began) / 100 * 1000
+
+    results = {
+        "events": event_count,
+        "events_per_second": event_count / feed_seconds,
+        "snapshot_ms": snapshot_ms,
+        "snapshot": snapshot,
+    }
+    if verify:
+        expected = recount(templates, event_count, stats.windows, now)
+        actual = {key: snapshot[key] for key in expected}
+        results["matches"] = actual == expected
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the incremental combat statistics")
+    parser.add_argument("--events", type=int, default=1000000, help="Events to feed")
+    parser.add_argument("--batch", type=int, default=200, help="Events per add_events() call")
+    parser.add_argument("--no-verify", action="store_true", help="Skip the full recount")
+    args = parser.parse_args()
+
+    r = run_benchmark(args.events, args.batch, not args.no_verify)
+    s = r["snapshot"]
+    print(f"{r['events']:,} events  {r['events_per_second']:>10,.0f} events/s  snapshot {r['snapshot_ms']:.3f} ms")
+    print(f"  kills {s['kills']:,}  deaths {s['deaths']:,}  suicides {s['suicides']:,}  "
+          f"K/D {s['kd']:.2f}  best streak {s['best_streak']}")
+    for minutes, counts in s["windows"].items():
+        print(f"  last {minutes:>2} min  {counts['kills']} kills, {counts['deaths']} deaths, {counts['suicides']} suicides")
+    if "matches" in r:
+        print(f"  matches full recount: {r['matches']}")
+        if not r["matches"]:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
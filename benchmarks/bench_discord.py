@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Discord Sender Benchmark
+Measures how fast a burst of kills drains through DiscordWebhook against the local rate-limited stub
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import requests
+
+import discord_webhook
+from discord_stub import DiscordStubServer
+from discord_webhook import DiscordWebhook
+from bench_event_store import build_templates
+
+# The old worker slept this long after every single embed
+LEGACY_SECONDS_PER_EMBED = 2.0
+
+
+def time_connections(requests_count=200):
+    """
+    Compare a new connection per request with the pooled session
+
+    Returns:
+        Dictionary with average milliseconds per request and connections opened for both
+    """
+    results = {}
+    payload = {"embeds": [{"title": "latency"}]}
+    for name in ("per_request", "session"):
+        stub = DiscordStubServer(limit=10 ** 9).start()
+        session = requests.Session() if name == "session" else None
+        post = session.post if session else requests.post
+        try:
+            began = time.perf_counter()
+            for _ in range(requests_count):
+                post(stub.url, json=payload, timeout=10)
+            elapsed = time.perf_counter() - began
+        finally:
+            if session:
+                session.close()
+            stub.stop()
+        results[name] = {"ms_per_request": elapsed / requests_count * 1000, "connections": stub.connections}
+    return results
+
+
+def run_benchmark(kills=60, limit=5, window=2.0, bucket_headers=True, fail_requests=0, timeout=120.0):
+    """
+    Run the Discord sender benchmark
+
+    Args:
+        kills: Number of kills queued at once
+        limit: Requests the stub allows per window
+        window: Length of the stub's rate limit window in seconds
+        bucket_headers: Whether the stub sends X-RateLimit-* headers or only 429s
+        fail_requests: Number of first requests the stub answers with 503
+        timeout: Seconds to wait for the queue to drain
+
+    Returns:
+        Dictionary with drain time, requests made and 429 responses
+    """
+    # Keep the benchmark output readable
+    discord_webhook.print = lambda *args, **kwargs: None
+
+    stub = DiscordStubServer(limit, window, send_bucket_headers=bucket_headers,
+                             fail_requests=fail_requests).start()
+    webhook = DiscordWebhook(stub.url)
+    events = build_templates(kills)
+    try:
+        webhook.start()
+        began = time.perf_counter()
+        for event in events:
+            webhook.send_death_record(event)
+        while stub.embeds_received < kills and time.perf_counter() - began < timeout:
+            time.sleep(0.01)
+        elapsed = time.perf_counter() - began
+    finally:
+        webhook.stop()
+        stub.stop()
+
+    return {
+        "kills": kills,
+        "delivered": stub.embeds_received,
+        "seconds": elapsed,
+        "requests": stub.accepted + stub.rate_limited,
+        "messages": stub.accepted,
+        "rate_limited": stub.rate_limited,
+        "failed": stub.failed,
+        "connections": stub.connections,
+        "client": webhook.get_stats(),
+        "keep_alive": time_connections(),
+        "legacy_seconds": kills * LEGACY_SECONDS_PER_EMBED,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the batched Discord sender against a rate-limited stub")
+    parser.add_argument("--kills", type=int, default=60, help="Kills queued at once")
+    parser.add_argument("--limit", type=int, default=5, help="Requests per rate limit window")
+    parser.add_argument("--window", type=float, default=2.0, help="Rate limit window in seconds")
+    parser.add_argument("--no-bucket-headers", action="store_true",
+                        help="Let the stub announce the rate limit only through 429 responses")
+    parser.add_argument("--fail-requests", type=int, default=0,
+                        help="Number of first requests the stub answers with 503")
+    args = parser.parse_args()
+
+    r = run_benchmark(args.kills, args.limit, args.window, not args.no_bucket_headers, args.fail_requests)
+    print(f"Delivered {r['delivered']}/{r['kills']} kills in {r['seconds']:.2f}s "
+          f"using {r['messages']} messages ({r['rate_limited']} requests rate limited)")
+    print(f"The one-embed-per-request worker with a fixed 2s sleep needs {r['legacy_seconds']:.0f}s")
+    c = r["client"]
+    print(f"Client: {c['sent']} sent, {c['retried']} retried, {c['dropped']} dropped over {c['requests']} requests "
+          f"and {r['connections']} connections; latency p50 {c['p50_ms']:.1f} ms, p99 {c['p99_ms']:.1f} ms")
+    for name, k in r["keep_alive"].items():
+        print(f"  {name:<12} {k['ms_per_request']:.2f} ms/request, {k['connections']} connections")
+
+
+if __name__ == "__main__":
+    main()
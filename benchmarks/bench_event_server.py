@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Event Server Load Test
+Connects a hundred local WebSocket clients, a few of which never read, and measures
+delivery latency, dropped frames and how long publish() holds up the queue worker
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import socket
+import statistics
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_event_store import build_templates, synthetic_events
+from event_server import EventServer, websocket_accept
+
+# Receive buffer of the clients that never read, so their backlog reaches the server quickly
+SLOW_CLIENT_RCVBUF = 4096
+
+
+class LoadClient:
+    def __init__(self, port, slow=False):
+        """
+        Initialize a test client
+
+        Args:
+            port: Port of the event server
+            slow: Never read until the test is over
+        """
+        self.port = port
+        self.slow = slow
+        self.arrivals = []  # perf_counter time each frame arrived
+        self.first_payload = None
+        self.reader = None
+        self.writer = None
+
+    async def connect(self):
+        """Open the connection and complete the WebSocket handshake"""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        if self.slow:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SLOW_CLIENT_RCVBUF)
+        sock.setblocking(False)
+        await asyncio.get_running_loop().sock_connect(sock, ("127.0.0.1", self.port))
+        self.reader, self.writer = await asyncio.open_connection(sock=sock, limit=1024 * 1024)
+
+        key = base64.b64encode(os.urandom(16)).decode('ascii')
+        self.writer.write(
+            f"GET /events HTTP/1.1\r\nHost: 127.0.0.1:{self.port}\r\nUpgrade: websocket\r\n"
+            f"Connection: Upgrade\r\nSec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n".encode('ascii')
+        )
+        head = await self.reader.readuntil(b"\r\n\r\n")
+        if f"Sec-WebSocket-Accept: {websocket_accept(key)}".encode('ascii') not in head:
+            raise RuntimeError("Handshake failed")
+
+    async def receive(self, stop):
+        """Count frames until stop is set; a slow client only starts reading then"""
+        if self.slow:
+            # StreamReader would keep filling its own buffer, so stop reading the socket itself
+            self.writer.transport.pause_reading()
+            await stop.wait()
+            self.writer.transport.resume_reading()
+        buffer = bytearray()
+        while True:
+            try:
+                chunk = await asyncio.wait_for(self.reader.read(65536), 0.2)
+            except asyncio.TimeoutError:
+                if stop.is_set():
+                    break
+                continue
+            if not chunk:
+                break
+            now = time.perf_counter()
+            buffer += chunk
+            offset = 0
+            while len(buffer) - offset >= 2:
+                length = buffer[offset + 1] & 0x7F
+                header = 2
+                if length == 126:
+                    if len(buffer) - offset < 4:
+                        break
+                    length, = struct.unpack_from("!H", buffer, offset + 2)
+                    header = 4
+                if len(buffer) - offset < header + length:
+                    break
+                if self.first_payload is None:
+                    self.first_payload = bytes(buffer[offset + header:offset + header + length])
+                self.arrivals.append(now)
+                offset += header + length
+            del buffer[:offset]
+
+    def close(self):
+        """Drop the connection without a close frame, like a closed browser tab"""
+        self.writer.close()
+
+
+def publish_events(server, events, batch_size, rate, sent_at, publish_times):
+    """Publish events in batches at rate events per second, recording when each batch went out"""
+    interval = batch_size / rate
+    began = time.perf_counter()
+    for start in range(0, len(events), batch_size):
+        due = began + start / batch_size * interval
+        delay = due - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+        batch = events[start:start + batch_size]
+        before = time.perf_counter()
+        server.publish(batch)
+        after = time.perf_counter()
+        publish_times.append(after - before)
+        sent_at.extend([before] * len(batch))
+
+
+def fetch_recent(port, limit):
+    """Fetch /recent with a plain socket; returns (seconds, records)"""
+    began = time.perf_counter()
+    with socket.create_connection(("127.0.0.1", port)) as sock:
+        sock.sendall(f"GET /recent?limit={limit} HTTP/1.1\r\nHost: localhost:{port}\r\n\r\n".encode('ascii'))
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    seconds = time.perf_counter() - began
+    return seconds, json.loads(b"".join(chunks).split(b"\r\n\r\n", 1)[1])
+
+
+async def run_clients(server, client_count, slow_count, events, batch_size, rate):
+    """Connect the clients, publish from a worker thread and collect what every client received"""
+    clients = [LoadClient(server.port, slow=index < slow_count) for index in range(client_count)]
+    await asyncio.gather(*(client.connect() for client in clients))
+
+    stop = asyncio.Event()
+    receivers = [asyncio.ensure_future(client.receive(stop)) for client in clients]
+    # Let the server register every subscriber before the first event
+    await asyncio.sleep(0.2)
+
+    sent_at, publish_times = [], []
+    publisher = threading.Thread(target=publish_events,
+                                 args=(server, events, batch_size, rate, sent_at, publish_times))
+    began = time.perf_counter()
+    publisher.start()
+    fast = clients[slow_count:]
+    while publisher.is_alive() or any(len(client.arrivals) < len(events) for client in fast):
+        await asyncio.sleep(0.05)
+        if time.perf_counter() - began > 60:
+            break
+    seconds = time.perf_counter() - began
+    publisher.join()
+
+    stop.set()
+    await asyncio.gather(*receivers)
+    for client in clients:
+        client.close()
+    return clients, sent_at, publish_times, seconds
+
+
+def percentile(values, fraction):
+    """Return the value below which fraction of the values fall"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def run_benchmark(client_count=100, slow_count=5, event_count=5000, batch_size=10, rate=1000.0):
+    """
+    Run the load test
+
+    Args:
+        client_count: WebSocket clients connected
+        slow_count: Clients among them that never read while events are published
+        event_count: Events published
+        batch_size: Events per publish() call, like a queue batch
+        rate: Events published per second
+
+    Returns:
+        Dictionary with delivery latency, publish() cost, frames received and dropped, and /recent timing
+    """
+    templates = build_templates()
+    events = list(synthetic_events(templates, event_count))
+
+    server = EventServer(port=0)
+    server.start()
+    try:
+        clients, sent_at, publish_times, seconds = asyncio.run(
+            run_clients(server, client_count, slow_count, events, batch_size, rate))
+        recent_seconds, recent = fetch_recent(server.port, 50)
+        stats = server.stats()
+    finally:
+        server.stop()
+
+    fast = clients[slow_count:]
+    slow = clients[:slow_count]
+    latencies = [arrival - sent for client in fast for arrival, sent in zip(client.arrivals, sent_at)]
+
+    return {
+        "clients": client_count,
+        "slow_clients": slow_count,
+        "events": event_count,
+        "seconds": seconds,
+        "fast_complete": all(len(client.arrivals) == event_count for client in fast),
+        "frames_delivered": sum(len(client.arrivals) for client in clients),
+        "slow_received": [len(client.arrivals) for client in slow],
+        "dropped": stats["dropped"],
+        "latency_p50_ms": statistics.median(latencies) * 1000,
+        "latency_p99_ms": percentile(latencies, 0.99) * 1000,
+        "publish_p50_us": statistics.median(publish_times) * 1e6,
+        "publish_max_us": max(publish_times) * 1e6,
+        "recent_ms": recent_seconds * 1000,
+        "recent_ok": len(recent) == 50 and recent[-1]["timestamp"] == events[-1].timestamp,
+        "payload_ok": json.loads(fast[0].first_payload)["timestamp"] == events[0].timestamp,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the local WebSocket event server")
+    parser.add_argument("--clients", type=int, default=100, help="WebSocket clients")
+    parser.add_argument("--slow", type=int, default=5, help="Clients that never read while events are published")
+    parser.add_argument("--events", type=int, default=5000, help="Events published")
+    parser.add_argument("--batch", type=int, default=10, help="Events per publish() call")
+    parser.add_argument("--rate", type=float, default=1000.0, help="Events published per second")
+    args = parser.parse_args()
+
+    r = run_benchmark(args.clients, args.slow, args.events, args.batch, args.rate)
+    print(f"{r['events']:,} events to {r['clients']} clients in {r['seconds']:.2f}s  "
+          f"{r['frames_delivered']:,} frames delivered")
+    print(f"  delivery latency p50 {r['latency_p50_ms']:.2f} ms  p99 {r['latency_p99_ms']:.2f} ms")
+    print(f"  publish() p50 {r['publish_p50_us']:.1f} us  max {r['publish_max_us']:.1f} us")
+    print(f"  slow clients received {r['slow_received']} of {r['events']:,}  {r['dropped']:,} frames dropped")
+    print(f"  /recent?limit=50 in {r['recent_ms']:.2f} ms  ok: {r['recent_ok']}")
+    print(f"  every fast client got every event: {r['fast_complete']}")
+    if not (r["fast_complete"] and r["recent_ok"] and r["payload_ok"]):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
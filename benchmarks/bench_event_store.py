@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Event Store Benchmark
+Inserts synthetic death events into a SQLite EventStore and measures throughput, paging and memory
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from death_event import TIMESTAMP_FORMAT, create_death_event
+from death_parser import parse_death_line
+from event_store import EventStore
+from test_log_generator import generate_actor_death_line
+
+
+def build_templates(count=2000):
+    """Parse generated death lines once to get realistic event field values"""
+    random.seed(42)
+    templates = []
+    for _ in range(count):
+        line = generate_actor_death_line()
+        parsed = parse_death_line(line)
+        templates.append(create_death_event(line, parsed, lambda w: w, lambda l: l))
+    return templates
+
+
+def synthetic_events(templates, count, first=0):
+    """Yield count events with unique, increasing log timestamps starting at event number first"""
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    for index in range(first, first + count):
+        timestamp = (start + timedelta(milliseconds=index * 250)).strftime(TIMESTAMP_FORMAT)
+        yield templates[index % len(templates)]._replace(timestamp=timestamp)
+
+
+def time_page(store, offset, limit=40, repeat=50):
+    """Return the average milliseconds to fetch one viewport of rows"""
+    began = time.perf_counter()
+    for _ in range(repeat):
+        store.page(offset, limit)
+    return (time.perf_counter() - began) / repeat * 1000
+
+
+def insert_events(store, events, batch_size):
+    """Append events in batches and return the number stored"""
+    inserted = 0
+    batch = []
+    for event in events:
+        batch.append(event)
+        if len(batch) >= batch_size:
+            inserted += store.append(batch)
+            batch = []
+    return inserted + store.append(batch)
+
+
+def run_benchmark(event_count=1000000, batch_size=500, db_path=None, memory_events=20000):
+    """
+    Run the event store benchmark
+
+    Args:
+        event_count: Number of events to insert
+        batch_size: Events per append() transaction
+        db_path: Database file to use; a temporary file is used if None
+        memory_events: Events appended to the full store while tracing memory
+
+    Returns:
+        Dictionary with insert throughput, page and query latency and peak memory
+    """
+    templates = build_templates()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = db_path or Path(temp_dir) / "bench_records.db"
+        store = EventStore(path)
+        store.clear()
+
+        began = time.perf_counter()
+        inserted = insert_events(store, synthetic_events(templates, event_count), batch_size)
+        insert_seconds = time.perf_counter() - began
+
+        # Memory is traced in a separate pass because tracemalloc slows inserts
+        # down several times; appending to the full store shows it stays flat
+        tracemalloc.start()
+        insert_events(store, synthetic_events(templates, memory_events, event_count), batch_size)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # Appending the same events again must not create duplicates
+        duplicates = store.append(list(synthetic_events(templates, min(event_count, 1000))))
+
+        killer = templates[0].killer
+        began = time.perf_counter()
+        found = store.find(killer=killer, limit=100)
+        query_ms = (time.perf_counter() - began) * 1000
+
+        began = time.perf_counter()
+        exported = sum(1 for _ in store.iter_events(batch_size=5000))
+        iterate_seconds = time.perf_counter() - began
+
+        results = {
+            "events": event_count,
+            "inserted": inserted,
+            "duplicates_stored": duplicates,
+            "insert_seconds": insert_seconds,
+            "inserts_per_second": inserted / insert_seconds,
+            "peak_memory_mb": peak / (1024 * 1024),
+            "page_first_ms": time_page(store, 0),
+            "page_middle_ms": time_page(store, store.count() // 2),
+            "page_last_ms": time_page(store, max(0, store.count() - 40)),
+            "find_by_killer_ms": query_ms,
+            "find_by_killer_rows": len(found),
+            "iterate_per_second": exported / iterate_seconds if iterate_seconds else 0.0,
+            "db_size_mb": Path(path).stat().st_size / (1024 * 1024),
+        }
+        store.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the SQLite event store")
+    parser.add_argument("--events", type=int, default=1000000, help="Number of events to insert")
+    parser.add_argument("--batch-size", type=int, default=500, help="Events per transaction")
+    parser.add_argument("--db", type=Path, default=None, help="Database file (default: temporary)")
+    args = parser.parse_args()
+
+    r = run_benchmark(args.events, args.batch_size, args.db)
+    print(f"Inserted {r['inserted']:,} events in {r['insert_seconds']:.1f}s "
+          f"({r['inserts_per_second']:,.0f} events/s), duplicates stored: {r['duplicates_stored']}")
+    print(f"Peak Python memory appending to the full store: {r['peak_memory_mb']:.1f} MB, database: {r['db_size_mb']:.0f} MB")
+    print(f"Page of 40 rows: first {r['page_first_ms']:.2f} ms, middle {r['page_middle_ms']:.2f} ms, "
+          f"last {r['page_last_ms']:.2f} ms")
+    print(f"find(killer=...): {r['find_by_killer_rows']} rows in {r['find_by_killer_ms']:.2f} ms")
+    print(f"Full iteration: {r['iterate_per_second']:,.0f} events/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Export Benchmark
+Measures rows/second of the streaming RecordExporter for each format against the old per-row export
+"""
+
+import argparse
+import csv
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from event_store import EventStore
+from record_exporter import CSV_HEADER, RecordExporter
+from bench_event_store import build_templates, insert_events, synthetic_events
+
+FORMATS = ("records.csv", "records.csv.gz", "records.ndjson", "records.ndjson.gz", "records.txt")
+
+
+def legacy_export_csv(events, path):
+    """The old synchronous export: one writerow call per record with the default file buffer"""
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(CSV_HEADER)
+        for event in events:
+            writer.writerow([
+                event.timestamp or '',
+                event.actor,
+                event.killer,
+                event.weapon_display,
+                event.damage,
+                event.location_display
+            ])
+
+
+def run_benchmark(event_count=200000):
+    """
+    Run the export benchmark
+
+    Args:
+        event_count: Number of records in the store being exported
+
+    Returns:
+        Dictionary with rows/second and output size per format
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_dir = Path(temp_dir)
+        store = EventStore(":memory:")
+        insert_events(store, synthetic_events(build_templates(), event_count), 1000)
+
+        began = time.perf_counter()
+        legacy_export_csv(store.iter_events(), temp_dir / "legacy.csv")
+        elapsed = time.perf_counter() - began
+        results["legacy.csv"] = {
+            "rows_per_second": event_count / elapsed,
+            "size_mb": (temp_dir / "legacy.csv").stat().st_size / (1024 * 1024),
+        }
+
+        for name in FORMATS:
+            path = temp_dir / name
+            progress_calls = []
+            exporter = RecordExporter(store.iter_events(), path, total=event_count,
+                                      on_progress=lambda written, total: progress_calls.append(written))
+            began = time.perf_counter()
+            exporter.start()
+            exporter.thread.join()
+            elapsed = time.perf_counter() - began
+            if exporter.written != event_count:
+                raise AssertionError(f"{name}: exported {exporter.written} of {event_count} records")
+            results[name] = {
+                "rows_per_second": event_count / elapsed,
+                "size_mb": path.stat().st_size / (1024 * 1024),
+                "progress_updates": len(progress_calls),
+            }
+
+        # Cancelling stops after the current chunk and leaves no file behind
+        path = temp_dir / "cancelled.csv"
+        exporter = RecordExporter(store.iter_events(), path, total=event_count,
+                                  on_progress=lambda written, total: exporter.cancel())
+        exporter.run()
+        results["cancel"] = {"written": exporter.written, "file_left": path.exists()}
+        store.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the streaming record exporter")
+    parser.add_argument("--events", type=int, default=200000, help="Number of records to export")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.events)
+    cancel = results.pop("cancel")
+    for name, r in results.items():
+        print(f"{name:<20} {r['rows_per_second']:>12,.0f} rows/s  {r['size_mb']:>8.1f} MB")
+    print(f"Cancel after first chunk: {cancel['written']} rows written, file left behind: {cancel['file_left']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Headless Monitor Benchmark
+Runs headless_monitor.py over a synthetic Game.log and measures events per second and peak RSS
+"""
+
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from bench_backfill import log_block
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Modules the headless entry point must never load
+UI_MODULES = ("tkinter", "pystray", "PIL")
+
+
+def ui_modules_loaded():
+    """Return the UI modules loaded by importing headless_monitor in a fresh interpreter"""
+    script = f"import sys, headless_monitor; print(','.join(m for m in {UI_MODULES!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", script], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    return [name for name in result.stdout.strip().split(",") if name]
+
+
+def write_log(path, line_count, death_percent):
+    """Write a synthetic Game.log by repeating one generated block; returns its death line count"""
+    block = log_block(20000, death_percent)
+    repeats = max(1, line_count // 20000)
+    with open(path, "wb") as file:
+        for _ in range(repeats):
+            file.write(block)
+    return block.count(b"<Actor Death>") * repeats
+
+
+def run_benchmark(line_count=1000000, death_percent=20.0):
+    """
+    Run the headless benchmark
+
+    Args:
+        line_count: Lines in the synthetic log
+        death_percent: Share of death lines in the log, in percent
+
+    Returns:
+        Dictionary with events written, seconds, events per second, peak RSS and UI modules loaded
+    """
+    loaded = ui_modules_loaded()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        folder = Path(temp_dir)
+        log_path = folder / "Game.log"
+        output_path = folder / "events.ndjson"
+        deaths = write_log(log_path, line_count, death_percent)
+
+        began = time.perf_counter()
+        subprocess.run(
+            [sys.executable, str(REPO_ROOT / "headless_monitor.py"), str(log_path), "--once",
+             "--output", str(output_path), "--state-dir", str(folder / "state")],
+            cwd=REPO_ROOT, capture_output=True, check=True
+        )
+        seconds = time.perf_counter() - began
+
+        with open(output_path, "rb") as file:
+            written = sum(1 for _ in file)
+
+    # Every child so far was a bare import, so the largest one is the headless run
+    peak_kb = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss if resource else None
+    if peak_kb and sys.platform == "darwin":
+        peak_kb //= 1024
+
+    return {
+        "deaths": deaths,
+        "written": written,
+        "seconds": seconds,
+        "events_per_second": written / seconds,
+        "peak_rss_kb": peak_kb,
+        "ui_modules_loaded": loaded,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the headless NDJSON monitor")
+    parser.add_argument("--lines", type=int, default=1000000, help="Lines in the synthetic log")
+    parser.add_argument("--death-percent", type=float, default=20.0, help="Share of death lines in percent")
+    args = parser.parse_args()
+
+    r = run_benchmark(args.lines, args.death_percent)
+    print(f"{r['written']:,} of {r['deaths']:,} deaths written in {r['seconds']:.2f}s  "
+          f"{r['events_per_second']:>10,.0f} events/s")
+    if r["peak_rss_kb"]:
+        print(f"  peak RSS {r['peak_rss_kb'] / 1024:.1f} MB")
+    print(f"  UI modules loaded: {', '.join(r['ui_modules_loaded']) or 'none'}")
+    if r["written"] != r["deaths"] or r["ui_modules_loaded"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
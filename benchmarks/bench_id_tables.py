@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+ID Table Benchmark
+Compares loading weapon_ids.json and location_ids.json with json.load against the compiled cache
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from id_table_cache import load_table
+
+# Run in a fresh interpreter so the import cost and memory of each path are measured on their own
+COLD_LOAD_SCRIPT = """
+import sys, time
+sys.path.insert(0, sys.argv[4])
+def rss_kb():
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * 4
+    except OSError:
+        return 0
+
+mode, json_path, cache_path = sys.argv[1:4]
+before = rss_kb()
+began = time.perf_counter()
+if mode == "json":
+    import json
+    with open(json_path, 'r', encoding='utf-8') as file:
+        table = json.load(file)
+else:
+    from id_table_cache import load_table
+    table = load_table(json_path, cache_path)
+elapsed = time.perf_counter() - began
+print(elapsed, rss_kb() - before, len(table))
+"""
+
+
+def write_tables(folder, scale):
+    """
+    Copy the shipped tables, enlarged scale times with renamed keys
+
+    Args:
+        folder: Folder that receives the copies
+        scale: How many times each table is repeated
+
+    Returns:
+        List of JSON paths
+    """
+    paths = []
+    for name in ("weapon_ids.json", "location_ids.json"):
+        with open(REPO_ROOT / name, 'r', encoding='utf-8') as file:
+            table = json.load(file)
+        enlarged = {}
+        for copy in range(scale):
+            for key, value in table.items():
+                enlarged[f"{key}_v{copy}" if copy else key] = value
+        path = folder / name
+        with open(path, 'w', encoding='utf-8') as file:
+            json.dump(enlarged, file, indent=2, ensure_ascii=False)
+        paths.append(path)
+    return paths
+
+
+def load_json(path):
+    """Load a table the way the app did before the cache"""
+    with open(path, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+def time_loads(load, repeats):
+    """Return the median milliseconds of repeated in-process loads"""
+    times = []
+    for _ in range(repeats):
+        began = time.perf_counter()
+        load()
+        times.append((time.perf_counter() - began) * 1000)
+    return statistics.median(times)
+
+
+def cold_load(mode, json_path, cache_path):
+    """
+    Load one table in a fresh interpreter
+
+    Returns:
+        Tuple of (milliseconds, RSS growth in KB, or 0 where /proc is unavailable)
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", COLD_LOAD_SCRIPT, mode, str(json_path), str(cache_path), str(REPO_ROOT)],
+        capture_output=True, text=True, check=True
+    )
+    seconds, rss_kb, _ = result.stdout.split()
+    return float(seconds) * 1000, int(rss_kb)
+
+
+def run_benchmark(scale=1, repeats=200, cold_runs=5):
+    """
+    Run the ID table benchmark
+
+    Args:
+        scale: How many times the shipped tables are enlarged
+        repeats: In-process loads per measurement
+        cold_runs: Fresh interpreters per cold measurement; the median is reported
+
+    Returns:
+        Dictionary with per-table results for the json and cache paths
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        folder = Path(temp_dir)
+        for json_path in write_tables(folder, scale):
+            cache_path = folder / f"{json_path.stem}.cache"
+            if load_table(json_path, cache_path) != load_json(json_path):
+                raise AssertionError(f"{json_path.name}: cached table differs from the JSON")
+
+            table = {"entries": len(load_json(json_path)),
+                     "json_kb": json_path.stat().st_size / 1024,
+                     "cache_kb": cache_path.stat().st_size / 1024}
+            for mode, load in (("json", lambda: load_json(json_path)),
+                               ("cache", lambda: load_table(json_path, cache_path))):
+                cold = [cold_load(mode, json_path, cache_path) for _ in range(cold_runs)]
+                table[mode] = {
+                    "warm_ms": time_loads(load, repeats),
+                    "cold_ms": statistics.median(ms for ms, _ in cold),
+                    "rss_kb": statistics.median(kb for _, kb in cold),
+                }
+            results[json_path.name] = table
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark loading the ID tables from JSON and from the cache")
+    parser.add_argument("--scale", type=int, default=1, help="Enlarge the shipped tables this many times")
+    parser.add_argument("--repeats", type=int, default=200, help="In-process loads per measurement")
+    parser.add_argument("--cold-runs", type=int, default=5, help="Fresh interpreters per cold measurement")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.scale, args.repeats, args.cold_runs)
+    for name, r in results.items():
+        print(f"{name}: {r['entries']} entries, JSON {r['json_kb']:.0f} KB, cache {r['cache_kb']:.0f} KB")
+        for mode in ("json", "cache"):
+            m = r[mode]
+            print(f"  {mode:<6} warm {m['warm_ms']:>8.3f} ms  cold {m['cold_ms']:>8.3f} ms  "
+                  f"RSS +{m['rss_kb']:>6.0f} KB")
+
+
+if __name__ == "__main__":
+    main()
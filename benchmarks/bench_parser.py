@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Death Parser Benchmark
+Measures lines/second of the byte pre-filter and compiled parser against the old per-line path
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from death_parser import is_death_line, parse_death_line
+from test_log_generator import generate_random_log_line
+
+
+def legacy_parse_death_line(line):
+    """The six separate re.search calls parse_death_line used to make"""
+    timestamp_match = re.search(r"<(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z)>", line)
+    actor_match = re.search(r"'([^']+)'\s+\[\d+\]", line)
+    killed_by_match = re.search(r"killed by '([^']+)'", line)
+    weapon_match = re.search(r"using '([^']+)'", line)
+    damage_match = re.search(r"damage type '([^']+)'", line)
+    location_match = re.search(r"in zone '([^']+)'", line)
+    return {
+        "timestamp": timestamp_match.group(1) if timestamp_match else None,
+        "actor": actor_match.group(1) if actor_match else "Unknown",
+        "killer": killed_by_match.group(1) if killed_by_match else "Unknown",
+        "weapon": weapon_match.group(1) if weapon_match else None,
+        "damage": damage_match.group(1) if damage_match else "Unknown",
+        "location": location_match.group(1) if location_match else "Unknown",
+    }
+
+
+def legacy_pipeline(raw_lines):
+    """Decode, filter and parse every line the way the monitor used to"""
+    parsed = 0
+    for raw_line in raw_lines:
+        line = raw_line.decode('utf-8', errors='ignore')
+        if line.strip().startswith("<Actor Death>") or "<Actor Death>" in line:
+            legacy_parse_death_line(line.strip())
+            parsed += 1
+    return parsed
+
+
+def new_pipeline(raw_lines):
+    """Filter on bytes and decode and parse only the death lines"""
+    parsed = 0
+    for raw_line in raw_lines:
+        if is_death_line(raw_line):
+            parse_death_line(raw_line.decode('utf-8', errors='ignore').strip())
+            parsed += 1
+    return parsed
+
+
+def check_parity(raw_lines):
+    """Make sure the new parser extracts the same fields as the old one"""
+    for raw_line in raw_lines:
+        if not is_death_line(raw_line):
+            continue
+        line = raw_line.decode('utf-8')
+        expected = legacy_parse_death_line(line)
+        actual = parse_death_line(line)._asdict()
+        for key, value in expected.items():
+            if actual[key] != value:
+                raise AssertionError(f"Parser mismatch for {key}: {actual[key]!r} != {value!r} in {line}")
+
+
+def run_benchmark(line_count=200000, repeat=3, seed=1234):
+    """
+    Run the parser benchmark
+
+    Args:
+        line_count: Number of generated log lines
+        repeat: Number of timed passes, the fastest one is reported
+        seed: Random seed so every run uses the same corpus
+
+    Returns:
+        Dictionary with lines/second for both pipelines
+    """
+    random.seed(seed)
+    raw_lines = [generate_random_log_line().encode("utf-8") for _ in range(line_count)]
+    check_parity(raw_lines)
+
+    results = {"lines": line_count}
+    for name, pipeline in (("legacy", legacy_pipeline), ("compiled", new_pipeline)):
+        best = None
+        for _ in range(repeat):
+            began = time.perf_counter()
+            deaths = pipeline(raw_lines)
+            elapsed = time.perf_counter() - began
+            best = elapsed if best is None else min(best, elapsed)
+        results[name] = {"lines_per_second": line_count / best, "death_lines": deaths}
+
+    deaths = [raw_line.decode('utf-8') for raw_line in raw_lines if is_death_line(raw_line)]
+    began = time.perf_counter()
+    for line in deaths:
+        parse_death_line(line)
+    results["parse_only_per_second"] = len(deaths) / (time.perf_counter() - began)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark death line filtering and parsing")
+    parser.add_argument("--lines", type=int, default=200000, help="Number of generated log lines")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.lines)
+    print(f"Corpus: {results['lines']} lines")
+    for name in ("legacy", "compiled"):
+        r = results[name]
+        print(f"  {name:<9} {r['lines_per_second']:>12,.0f} lines/s  ({r['death_lines']} death lines)")
+    print(f"  parse_death_line alone: {results['parse_only_per_second']:,.0f} death lines/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Render Benchmark
+Measures overlay updates and records table refreshes on a hidden Tk root
+"""
+
+import argparse
+import sys
+import time
+import tkinter as tk
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bench_event_store import build_templates, synthetic_events
+from overlay_renderer import OverlayRenderer
+from records_view import RecordsView, record_values
+
+# Rows the records viewport shows, about what the default window fits
+VIEWPORT_ROWS = 25
+
+
+def time_overlay(text_widget, events, lines):
+    """
+    Slide a window of lines events over the list, one new event per update
+
+    Returns:
+        Tuple of (incremental updates per second, full redraws per second)
+    """
+    renderer = OverlayRenderer(text_widget)
+    renderer.render(events[:lines])
+    began = time.perf_counter()
+    for start in range(1, len(events) - lines + 1):
+        renderer.render(events[start:start + lines])
+    incremental = (len(events) - lines) / (time.perf_counter() - began)
+
+    began = time.perf_counter()
+    for start in range(0, len(events) - lines + 1, lines):
+        renderer.reset()
+        renderer.render(events[start:start + lines])
+    redraws = len(range(0, len(events) - lines + 1, lines)) / (time.perf_counter() - began)
+    return incremental, redraws
+
+
+def time_legacy_records(root, events, appends):
+    """
+    Rebuild a Listbox of every record after each append, the way the records window used to
+
+    Returns:
+        Refreshes per second
+    """
+    listbox = tk.Listbox(root)
+    listbox.pack()
+    records = list(events[:-appends])
+    began = time.perf_counter()
+    for event in events[-appends:]:
+        records.append(event)
+        listbox.delete(0, tk.END)
+        for record in records:
+            listbox.insert(tk.END, f"[{record.display_datetime}] {record.actor} killed by {record.killer} "
+                                   f"- {record.damage} @ {record.location_display}")
+    refreshes = appends / (time.perf_counter() - began)
+    listbox.destroy()
+    return refreshes
+
+
+def time_records(root, events, appends):
+    """
+    Append records one at a time while following the newest, then page through all of them
+
+    Returns:
+        Tuple of (follow refreshes per second, page scrolls per second)
+    """
+    frame = tk.Frame(root)
+    frame.pack()
+    records = list(events[:-appends])
+    view = RecordsView(frame, lambda: len(records), lambda offset, limit: records[offset:offset + limit])
+    # A withdrawn root never gets a <Configure>, so size the item pool directly
+    view._on_resize(SimpleNamespace(height=(VIEWPORT_ROWS + 1) * view.row_height))
+
+    began = time.perf_counter()
+    for event in events[-appends:]:
+        records.append(event)
+        view.refresh()
+    refreshes = appends / (time.perf_counter() - began)
+
+    # Start cold so paging formats every row instead of hitting the cache
+    record_values.cache_clear()
+    view._move_to(0)
+    pages = 0
+    began = time.perf_counter()
+    while not view.follow:
+        view.yview("scroll", 1, "pages")
+        pages += 1
+    scrolls = pages / (time.perf_counter() - began) if pages else 0.0
+    frame.destroy()
+    return refreshes, scrolls
+
+
+def run_benchmark(event_count=20000, lines=5, appends=2000, legacy_appends=10):
+    """
+    Run the render benchmark
+
+    Args:
+        event_count: Synthetic events rendered and held as records
+        lines: Events visible in the overlay at once
+        appends: Records appended one at a time while the table follows the newest
+        legacy_appends: Appends timed with the old rebuild-everything records list
+
+    Returns:
+        Dictionary with updates per second and the speedups over full redraws and
+        rebuilds, or an empty dictionary if no display is available
+    """
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"Skipping render benchmark, no display available: {e}")
+        return {}
+
+    root.withdraw()
+    events = list(synthetic_events(build_templates(), event_count))
+    text_widget = tk.Text(root, height=lines, width=100)
+    text_widget.pack()
+
+    try:
+        incremental, redraws = time_overlay(text_widget, events, lines)
+        refreshes, scrolls = time_records(root, events, min(appends, event_count // 2))
+        legacy_refreshes = time_legacy_records(root, events, min(legacy_appends, event_count // 2))
+    finally:
+        root.destroy()
+
+    return {
+        "events": event_count,
+        "overlay_updates_per_second": incremental,
+        "overlay_redraws_per_second": redraws,
+        "overlay_speedup": incremental / redraws,
+        "records_refreshes_per_second": refreshes,
+        "records_legacy_refreshes_per_second": legacy_refreshes,
+        "records_speedup": refreshes / legacy_refreshes,
+        "records_pages_per_second": scrolls,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the overlay renderer and the records table")
+    parser.add_argument("--events", type=int, default=20000, help="Synthetic events rendered")
+    parser.add_argument("--lines", type=int, default=5, help="Events visible in the overlay")
+    args = parser.parse_args()
+
+    r = run_benchmark(args.events, args.lines)
+    if not r:
+        return
+    print(f"Overlay: {r['overlay_updates_per_second']:,.0f} incremental updates/s, "
+          f"{r['overlay_redraws_per_second']:,.0f} full redraws/s")
+    print(f"Records: {r['records_refreshes_per_second']:,.0f} follow refreshes/s, "
+          f"{r['records_pages_per_second']:,.0f} page scrolls/s")
+    print(f"  incremental overlay {r['overlay_speedup']:.1f}x a full redraw, "
+          f"virtual table {r['records_speedup']:.0f}x a full Listbox rebuild")
+
+
+if __name__ == "__main__":
+    main()
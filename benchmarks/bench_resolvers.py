@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Resolver Benchmark
+Measures the ID resolvers against the old linear-scan lookups; tests/test_resolvers.py checks they agree
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "tests"))
+
+from legacy_resolvers import legacy_expand_weapon_ids, legacy_get_location_name, legacy_get_weapon_name
+from location_resolver import LocationResolver
+from test_log_generator import LOCATIONS, WEAPONS
+from weapon_resolver import WeaponResolver
+
+
+def time_calls(function, queries, repeat):
+    """Return calls per second for function over the queries"""
+    began = time.perf_counter()
+    for _ in range(repeat):
+        for query in queries:
+            function(query)
+    return len(queries) * repeat / (time.perf_counter() - began)
+
+
+def run_benchmark(repeat=20):
+    """
+    Run the resolver benchmark
+
+    Args:
+        repeat: Number of passes over the log-like query mix
+
+    Returns:
+        Dictionary with lookups/second for each resolver
+    """
+    with open(ROOT / "location_ids.json", 'r', encoding='utf-8') as file:
+        location_ids = json.load(file)
+    with open(ROOT / "weapon_ids.json", 'r', encoding='utf-8') as file:
+        weapon_ids = json.load(file)
+
+    # Real logs repeat a handful of zones with different instance suffixes
+    random.seed(42)
+    log_queries = [f"{random.choice(LOCATIONS).rsplit('_', 1)[0]}_{random.randint(1, 50)}" for _ in range(2000)]
+
+    # Each weapon instance keeps its ID for the whole session
+    random.seed(43)
+    instances = [f"{weapon.rsplit('_', 1)[0]}_{random.randint(10 ** 11, 10 ** 13)}"
+                 for weapon in WEAPONS for _ in range(50)]
+    weapon_log_queries = [random.choice(instances) for _ in range(2000)]
+
+    resolver = LocationResolver(location_ids)
+    expanded = legacy_expand_weapon_ids(weapon_ids)
+    weapon_resolver = WeaponResolver(weapon_ids)
+    results = {
+        "location": {
+            "legacy_per_second": time_calls(lambda q: legacy_get_location_name(location_ids, q), log_queries, 1),
+            "uncached_per_second": time_calls(resolver._resolve, log_queries, 1),
+            "resolver_per_second": time_calls(resolver.resolve, log_queries, repeat),
+            "keys_checked": len(location_ids),
+        },
+        "weapon": {
+            "legacy_per_second": time_calls(lambda q: legacy_get_weapon_name(expanded, q), weapon_log_queries, repeat),
+            "uncached_per_second": time_calls(weapon_resolver._resolve, weapon_log_queries, repeat),
+            "resolver_per_second": time_calls(weapon_resolver.resolve, weapon_log_queries, repeat),
+            "keys_checked": len(weapon_ids),
+        },
+    }
+    results["weapon"]["cache"] = weapon_resolver.cache_info()._asdict()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the weapon and location resolvers")
+    parser.add_argument("--repeat", type=int, default=20, help="Passes over the query mix")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.repeat)
+    for name, r in results.items():
+        print(f"{name}:")
+        print(f"  legacy    {r['legacy_per_second']:>12,.0f} lookups/s")
+        print(f"  uncached  {r['uncached_per_second']:>12,.0f} lookups/s")
+        print(f"  resolver  {r['resolver_per_second']:>12,.0f} lookups/s")
+        if "cache" in r:
+            print(f"  cache     {r['cache']['hits']} hits, {r['cache']['misses']} misses")
+
+
+if __name__ == "__main__":
+    main()
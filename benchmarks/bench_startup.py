@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark
+Measures the import time of game_log_monitor and the wall-clock time until the main window is drawn,
+and fails when either exceeds its budget
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Modules game_log_monitor must not load at import; they are imported when first needed
+DEFERRED_MODULES = ("pystray", "PIL", "requests", "ctypes", "multiprocessing", "concurrent.futures", "asyncio")
+
+IMPORT_SCRIPT = (
+    "import sys, game_log_monitor; "
+    f"print(','.join(name for name in {DEFERRED_MODULES!r} if name in sys.modules))"
+)
+
+FIRST_FRAME_SCRIPT = """
+import sys
+import tkinter as tk
+import game_log_monitor
+root = tk.Tk()
+app = game_log_monitor.LogMonitorApp(root)
+root.update()
+print("first-frame", flush=True)
+import os
+os._exit(0)
+"""
+
+
+def parse_importtime(stderr):
+    """
+    Read the output of python -X importtime
+
+    Args:
+        stderr: Text written to stderr by the interpreter
+
+    Returns:
+        Tuple of (cumulative microseconds of game_log_monitor, list of (self microseconds, module))
+    """
+    total = None
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules.append((int(self_us), name.strip()))
+        if name.rstrip() == " game_log_monitor":
+            total = int(cumulative_us)
+    return total, modules
+
+
+def measure_import():
+    """
+    Import game_log_monitor in a fresh interpreter
+
+    Returns:
+        Tuple of (milliseconds, deferred modules that were loaded, list of (self microseconds, module))
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", IMPORT_SCRIPT],
+        cwd=REPO_ROOT, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing game_log_monitor failed:\n{result.stderr[-2000:]}")
+    total_us, modules = parse_importtime(result.stderr)
+    loaded = [name for name in result.stdout.strip().split(",") if name]
+    return total_us / 1000, loaded, modules
+
+
+def measure_first_frame(home):
+    """
+    Start the app in a fresh interpreter and wait until its main window is drawn
+
+    Args:
+        home: Folder used as the user's home, so no real settings are read or written
+
+    Returns:
+        Milliseconds from process start to the first frame, or None if no display is available
+    """
+    env = dict(os.environ, HOME=str(home), USERPROFILE=str(home),
+               LOCALAPPDATA=str(home / "AppData" / "Local"), PROGRAMFILES=str(home / "Program Files"))
+    began = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-c", FIRST_FRAME_SCRIPT], cwd=REPO_ROOT, env=env,
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+    )
+    for line in process.stdout:
+        if line.strip() == "first-frame":
+            elapsed = (time.perf_counter() - began) * 1000
+            process.wait()
+            return elapsed
+    process.wait()
+    error = process.stderr.read()
+    if "TclError" in error:
+        return None
+    raise RuntimeError(f"Starting the app failed:\n{error[-2000:]}")
+
+
+def run_benchmark(runs=5):
+    """
+    Run the startup benchmark
+
+    Args:
+        runs: Number of fresh interpreters per measurement; the median is reported
+
+    Returns:
+        Dictionary with median import and first frame times in milliseconds, the deferred
+        modules loaded at import and the heaviest imports
+    """
+    import_times = []
+    loaded = []
+    modules = []
+    for _ in range(runs):
+        milliseconds, loaded, modules = measure_import()
+        import_times.append(milliseconds)
+
+    frame_times = []
+    with tempfile.TemporaryDirectory() as temp_dir:
+        home = Path(temp_dir)
+        (home / "AppData" / "Local").mkdir(parents=True)
+        for _ in range(runs):
+            milliseconds = measure_first_frame(home)
+            if milliseconds is None:
+                break
+            frame_times.append(milliseconds)
+
+    return {
+        "import_ms": statistics.median(import_times),
+        "first_frame_ms": statistics.median(frame_times) if frame_times else None,
+        "deferred_loaded": loaded,
+        "heaviest_imports": sorted(modules, reverse=True)[:5],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark application startup against a time budget")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per measurement")
+    parser.add_argument("--import-budget-ms", type=float, default=100.0,
+                        help="Maximum median import time of game_log_monitor")
+    parser.add_argument("--frame-budget-ms", type=float, default=1500.0,
+                        help="Maximum median time from process start to the first frame")
+    args = parser.parse_args()
+
+    r = run_benchmark(args.runs)
+    failures = []
+
+    print(f"import game_log_monitor  {r['import_ms']:>8.1f} ms  (budget {args.import_budget_ms:.0f} ms)")
+    if r["import_ms"] > args.import_budget_ms:
+        failures.append("import time over budget")
+
+    if r["first_frame_ms"] is None:
+        print("first frame              skipped, no display available")
+    else:
+        print(f"first frame              {r['first_frame_ms']:>8.1f} ms  (budget {args.frame_budget_ms:.0f} ms)")
+        if r["first_frame_ms"] > args.frame_budget_ms:
+            failures.append("first frame over budget")
+
+    if r["deferred_loaded"]:
+        failures.append(f"loaded at import: {', '.join(r['deferred_loaded'])}")
+
+    print("heaviest imports (self time):")
+    for self_us, name in r["heaviest_imports"]:
+        print(f"  {self_us / 1000:>8.1f} ms  {name}")
+
+    if failures:
+        print(f"FAILED: {'; '.join(failures)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Tailer Throughput Benchmark
+Compares LogTailer against the old open/seek/readlines loop on a growing log
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from log_tailer import LogTailer
+from monitor_pipeline import DEATH_MARKERS
+from test_log_generator import generate_random_log_line
+
+
+def build_corpus(line_count, seed=1234):
+    """
+    Build a list of synthetic log lines
+
+    Args:
+        line_count: Number of lines to generate
+        seed: Random seed so every run uses the same corpus
+
+    Returns:
+        List of encoded lines including line endings
+    """
+    random.seed(seed)
+    return [f"{generate_random_log_line()}\n".encode("utf-8") for _ in range(line_count)]
+
+
+def legacy_read(path, file_position):
+    """Read new lines the way monitor_log_file used to"""
+    current_size = path.stat().st_size
+    if current_size < file_position:
+        file_position = 0
+
+    count = 0
+    if current_size > file_position:
+        with open(path, 'r', encoding='utf-8', errors='ignore') as file:
+            file.seek(file_position)
+            for line in file.readlines():
+                if line.strip().startswith("<Actor Death>") or "<Actor Death>" in line:
+                    count += 1
+        file_position = current_size
+    return file_position, count
+
+
+def tailer_read(tailer):
+    """Read new death lines through LogTailer, the way MonitorPipeline does once the account is known"""
+    # The tailer only yields the lines holding a death marker
+    count = 0
+    for _ in tailer.read_lines(DEATH_MARKERS):
+        count += 1
+    return count
+
+
+def drive(corpus, batch_lines, reader, trace_memory=False):
+    """
+    Append the corpus to a fresh log in batches and let the reader catch up
+
+    Args:
+        corpus: Encoded lines to append
+        batch_lines: Number of lines appended between reads
+        reader: Factory returning a callable that reads the new lines
+        trace_memory: Track peak allocations instead of timing
+
+    Returns:
+        Tuple of (seconds spent reading, peak traced memory in bytes, death lines seen)
+    """
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / "Game.log"
+        path.write_bytes(b"")
+        read_new = reader(path)
+
+        elapsed = 0.0
+        deaths = 0
+        if trace_memory:
+            tracemalloc.start()
+        with open(path, "ab", buffering=0) as log:
+            for start in range(0, len(corpus), batch_lines):
+                log.write(b"".join(corpus[start:start + batch_lines]))
+                began = time.perf_counter()
+                deaths += read_new()
+                elapsed += time.perf_counter() - began
+        peak = 0
+        if trace_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        return elapsed, peak, deaths
+
+
+def run_benchmark(line_count=200000, batch_lines=5000, repeat=3):
+    """
+    Run the tailer benchmark
+
+    Args:
+        line_count: Total number of lines written to the log
+        batch_lines: Number of lines appended between reads
+        repeat: Timed runs per reader, alternating between them; the fastest is kept
+
+    Returns:
+        Dictionary of results for both readers
+    """
+    corpus = build_corpus(line_count)
+    total_bytes = sum(len(line) for line in corpus)
+
+    def legacy_reader(path):
+        state = {"position": 0}
+
+        def read_new():
+            state["position"], count = legacy_read(path, state["position"])
+            return count
+        return read_new
+
+    def tailer_reader(path):
+        tailer = LogTailer(path, start_at_end=False)
+        return lambda: tailer_read(tailer)
+
+    readers = (("legacy", legacy_reader), ("tailer", tailer_reader))
+    timings = {name: [] for name, _ in readers}
+    for _ in range(repeat):
+        for name, reader in readers:
+            timings[name].append(drive(corpus, batch_lines, reader))
+
+    results = {"lines": line_count, "bytes": total_bytes}
+    for name, reader in readers:
+        elapsed, _, deaths = min(timings[name])
+        _, peak, _ = drive(corpus, batch_lines, reader, trace_memory=True)
+        results[name] = {
+            "seconds": elapsed,
+            "lines_per_second": line_count / elapsed if elapsed else 0.0,
+            "mb_per_second": total_bytes / elapsed / 1e6 if elapsed else 0.0,
+            "peak_memory_kb": peak / 1024,
+            "death_lines": deaths,
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the log tailer read path")
+    parser.add_argument("--lines", type=int, default=200000, help="Total lines written to the log")
+    parser.add_argument("--batch", type=int, default=5000, help="Lines appended between reads")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per reader, the fastest is kept")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.lines, args.batch, max(1, args.repeat))
+    print(f"Corpus: {results['lines']} lines, {results['bytes'] / 1e6:.1f} MB")
+    for name in ("legacy", "tailer"):
+        r = results[name]
+        print(f"  {name:<7} {r['lines_per_second']:>12,.0f} lines/s  {r['mb_per_second']:>8.1f} MB/s  "
+              f"peak {r['peak_memory_kb']:>8.0f} KB  deaths {r['death_lines']}")
+
+
+if __name__ == "__main__":
+    main()
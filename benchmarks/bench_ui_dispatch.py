@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+UI Dispatch Benchmark
+Measures UI-thread time per second spent applying death events at different event rates
+"""
+
+import argparse
+import sys
+import threading
+import time
+import tkinter as tk
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ui_dispatcher import UIDispatcher
+
+RATES = (1, 10, 100)
+
+
+def render_overlay(text_widget, lines):
+    """Redraw a Text widget the way the overlay does"""
+    text_widget.config(state=tk.NORMAL)
+    text_widget.delete(1.0, tk.END)
+    for line in lines:
+        text_widget.insert(tk.END, f"[{line[0]}] ", "time_tag")
+        text_widget.insert(tk.END, f"{line[1]} ", "player_tag")
+        text_widget.insert(tk.END, "☠ by ", "symbol_tag")
+        text_widget.insert(tk.END, f"{line[2]}", "killer_tag")
+        text_widget.insert(tk.END, "\n")
+    text_widget.config(state=tk.DISABLED)
+
+
+def measure_rate(root, text_widget, rate, seconds):
+    """
+    Publish events from a background thread at a fixed rate and measure UI-thread time
+
+    Returns:
+        Dictionary with UI milliseconds per second, flushes per second and mean latency
+    """
+    dispatcher = UIDispatcher(root)
+    visible = []
+    latencies = []
+
+    def on_events(events, detected_at):
+        visible.extend(events)
+        del visible[:-5]
+        render_overlay(text_widget, visible)
+        if detected_at is not None:
+            latencies.append(time.perf_counter() - detected_at)
+
+    dispatcher.set_event_handler(on_events)
+    stop = threading.Event()
+
+    def producer():
+        interval = 1.0 / rate
+        next_time = time.perf_counter()
+        count = 0
+        while not stop.is_set():
+            count += 1
+            dispatcher.publish_events([("12:00:00", f"Player{count}", "Killer")], time.perf_counter())
+            dispatcher.post('status', lambda n=count: None)
+            next_time += interval
+            delay = next_time - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+    thread = threading.Thread(target=producer, daemon=True)
+    began = time.perf_counter()
+    thread.start()
+    while time.perf_counter() - began < seconds:
+        root.update()
+        time.sleep(0.001)
+    stop.set()
+    thread.join()
+    elapsed = time.perf_counter() - began
+
+    return {
+        "ui_ms_per_second": dispatcher.busy_seconds * 1000 / elapsed,
+        "flushes_per_second": dispatcher.flush_count / elapsed,
+        "mean_latency_ms": sum(latencies) * 1000 / len(latencies) if latencies else 0.0,
+    }
+
+
+def run_benchmark(seconds=3.0):
+    """
+    Run the dispatch benchmark at 1, 10 and 100 events/s
+
+    Args:
+        seconds: Duration of each rate
+
+    Returns:
+        Dictionary keyed by rate, or an empty dictionary if no display is available
+    """
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"Skipping UI dispatch benchmark, no display available: {e}")
+        return {}
+
+    root.withdraw()
+    text_widget = tk.Text(root, height=5, width=60)
+    text_widget.pack()
+
+    results = {}
+    try:
+        for rate in RATES:
+            results[str(rate)] = measure_rate(root, text_widget, rate, seconds)
+    finally:
+        root.destroy()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark UI-thread time spent on published events")
+    parser.add_argument("--seconds", type=float, default=3.0, help="Duration of each event rate")
+    args = parser.parse_args()
+
+    for rate, r in run_benchmark(args.seconds).items():
+        print(f"{rate:>4} events/s: {r['ui_ms_per_second']:6.2f} ms UI time per second, "
+              f"{r['flushes_per_second']:5.1f} flushes/s, mean latency {r['mean_latency_ms']:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
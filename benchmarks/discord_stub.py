@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Discord Webhook Stub
+Local stand-in for a Discord webhook that enforces a rate limit bucket and answers with Discord's headers
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class DiscordStubServer:
+    def __init__(self, limit=5, window=2.0, host="127.0.0.1", port=0, send_bucket_headers=True,
+                 fail_requests=0, failure_status=503):
+        """
+        Initialize the stub
+
+        Every webhook shares one bucket of limit requests that refills window
+        seconds after its first request. Requests beyond the limit get a 429
+        with retry_after, the way Discord answers.
+
+        Args:
+            limit: Requests allowed per window
+            window: Length of the rate limit window in seconds
+            host: Interface to listen on
+            port: Port to listen on; 0 picks a free port
+            send_bucket_headers: Send X-RateLimit-* headers on successful requests;
+                                 without them clients only learn of the limit through 429s
+            fail_requests: Number of first requests answered with failure_status, to simulate an outage
+            failure_status: Status code of the simulated outage
+        """
+        self.limit = limit
+        self.window = window
+        self.send_bucket_headers = send_bucket_headers
+        self.fail_requests = fail_requests
+        self.failure_status = failure_status
+
+        self.lock = threading.Lock()
+        self.window_started = None
+        self.window_count = 0
+
+        # Statistics
+        self.messages = []  # Payloads accepted, in order
+        self.accepted = 0
+        self.rate_limited = 0
+        self.failed = 0
+        self.connections = 0  # TCP connections accepted; lower than requests when clients keep alive
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep connections open between requests like Discord does
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                with stub.lock:
+                    stub.connections += 1
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length)
+                status, headers, reply = stub.handle(body)
+
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                if reply is not None:
+                    data = json.dumps(reply).encode("utf-8")
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("Content-Length", str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                else:
+                    # 204 responses carry no body and no Content-Length
+                    self.end_headers()
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.thread = None
+
+    @property
+    def url(self):
+        """Webhook URL to give to DiscordWebhook"""
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/api/webhooks/1/stub"
+
+    @property
+    def embeds_received(self):
+        """Total number of embeds in all accepted messages"""
+        return sum(len(message.get("embeds", [])) for message in self.messages)
+
+    def start(self):
+        """Serve requests on a daemon thread"""
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        """Shut the server down"""
+        self.server.shutdown()
+        self.server.server_close()
+
+    def handle(self, body):
+        """
+        Apply the rate limit to one request
+
+        Args:
+            body: Raw request body
+
+        Returns:
+            Tuple of (status, headers, JSON reply or None)
+        """
+        with self.lock:
+            if self.failed < self.fail_requests:
+                self.failed += 1
+                return self.failure_status, {}, {"message": "Service unavailable"}
+
+            now = time.monotonic()
+            if self.window_started is None or now - self.window_started >= self.window:
+                self.window_started = now
+                self.window_count = 0
+
+            reset_after = max(0.0, self.window - (now - self.window_started))
+            headers = {
+                "X-RateLimit-Limit": str(self.limit),
+                "X-RateLimit-Reset-After": f"{reset_after:.3f}",
+                "X-RateLimit-Bucket": "stub",
+            }
+
+            if self.window_count >= self.limit:
+                self.rate_limited += 1
+                headers["X-RateLimit-Remaining"] = "0"
+                headers["Retry-After"] = str(int(reset_after) + 1)
+                reply = {"message": "You are being rate limited.", "retry_after": round(reset_after, 3), "global": False}
+                return 429, headers, reply
+
+            self.window_count += 1
+            headers["X-RateLimit-Remaining"] = str(self.limit - self.window_count)
+            try:
+                payload = json.loads(body or b"{}")
+            except ValueError:
+                return 400, headers, {"message": "Cannot send an empty message", "code": 50006}
+
+            embeds = payload.get("embeds", [])
+            if not embeds or len(embeds) > 10:
+                return 400, headers, {"message": "Invalid Form Body", "code": 50035}
+
+            self.messages.append(payload)
+            self.accepted += 1
+            return 204, headers if self.send_bucket_headers else {}, None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a local Discord webhook stand-in")
+    parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+    parser.add_argument("--limit", type=int, default=5, help="Requests per window")
+    parser.add_argument("--window", type=float, default=2.0, help="Window length in seconds")
+    parser.add_argument("--no-bucket-headers", action="store_true",
+                        help="Only announce the rate limit through 429 responses")
+    args = parser.parse_args()
+
+    stub = DiscordStubServer(args.limit, args.window, port=args.port,
+                             send_bucket_headers=not args.no_bucket_headers)
+    print(f"Discord stub listening on {stub.url}")
+    try:
+        stub.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"Accepted {stub.accepted} messages with {stub.embeds_received} embeds, "
+              f"rate limited {stub.rate_limited} requests")
+
+
+if __name__ == "__main__":
+    main()
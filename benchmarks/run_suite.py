@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Benchmark Suite
+Runs the tail, pipeline, parse, resolve, render and webhook benchmarks on fixed synthetic corpora,
+writes their numbers to JSON and fails if a stage lost its speedup over the implementation it replaced
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent))
+sys.path.insert(0, str(BENCH_DIR))
+
+import bench_discord
+import bench_headless
+import bench_parser
+import bench_render
+import bench_resolvers
+import bench_tailer
+
+# Lowest speedup each stage may show over the old implementation timed in the same run.
+# Both sides share the machine and its load, so these hold on any host; each floor sits
+# well below what a quiet single core measures (noted after it) to stay clear of noise.
+SPEEDUP_FLOORS = {
+    "tail.tailer_speedup": 1.0,  # 1.2-1.7x, death lines are found with bytes.find instead of line by line
+    "parse.compiled_speedup": 1.1,  # 1.4-1.8x
+    "resolve.location_speedup": 50.0,  # 210-245x
+    "resolve.location_uncached_speedup": 4.0,  # 10-13x
+    "resolve.weapon_speedup": 3.0,  # 8-10x
+    "resolve.weapon_uncached_speedup": 1.3,  # 2.1-3.4x
+    "render.overlay_speedup": 1.2,
+    "render.records_speedup": 10.0,
+    "webhook.drain_speedup": 10.0,  # about 60x, bound by the stub's rate limit
+}
+
+# Allowed loss of a speedup against a results file passed as --baseline, as a fraction
+DEFAULT_THRESHOLD = 0.3
+
+
+def tail_stage():
+    """LogTailer against the old readlines loop while the log grows"""
+    r = bench_tailer.run_benchmark(line_count=400000, batch_lines=5000)
+    return {
+        "lines_per_second": r["tailer"]["lines_per_second"],
+        "tailer_speedup": r["tailer"]["lines_per_second"] / r["legacy"]["lines_per_second"],
+    }
+
+
+def pipeline_stage():
+    """Death events per second from a log through MonitorPipeline into NDJSON"""
+    r = bench_headless.run_benchmark(line_count=200000, death_percent=20.0)
+    if r["written"] != r["deaths"]:
+        raise RuntimeError(f"Pipeline wrote {r['written']} of {r['deaths']} deaths")
+    return {"events_per_second": r["events_per_second"]}
+
+
+def parse_stage():
+    """The death line filter and parse_death_line against the old regex pipeline"""
+    r = bench_parser.run_benchmark(line_count=100000, repeat=3, seed=1234)
+    return {
+        "lines_per_second": r["compiled"]["lines_per_second"],
+        "compiled_speedup": r["compiled"]["lines_per_second"] / r["legacy"]["lines_per_second"],
+    }
+
+
+def resolve_stage():
+    """Weapon and location resolvers, with and without the cache, against the old linear lookups"""
+    r = bench_resolvers.run_benchmark(repeat=20)
+    metrics = {}
+    for name in ("location", "weapon"):
+        legacy = r[name]["legacy_per_second"]
+        metrics[f"{name}_per_second"] = r[name]["resolver_per_second"]
+        metrics[f"{name}_speedup"] = r[name]["resolver_per_second"] / legacy
+        metrics[f"{name}_uncached_speedup"] = r[name]["uncached_per_second"] / legacy
+    return metrics
+
+
+def render_stage():
+    """Incremental overlay and virtual records table against full redraws on a hidden Tk root"""
+    r = bench_render.run_benchmark(event_count=20000, lines=5, appends=2000)
+    return {key: value for key, value in r.items() if key != "events"}
+
+
+def webhook_stage():
+    """A burst of kills through DiscordWebhook into the rate-limited stub against one embed per 2s"""
+    r = bench_discord.run_benchmark(kills=60, limit=5, window=2.0)
+    if r["delivered"] != r["kills"]:
+        raise RuntimeError(f"Webhook delivered {r['delivered']} of {r['kills']} kills")
+    return {
+        "drain_seconds": r["seconds"],
+        "drain_speedup": r["legacy_seconds"] / r["seconds"],
+    }
+
+
+# Stage name and the function returning its metrics; an empty result means the stage was skipped
+STAGES = (
+    ("tail", tail_stage),
+    ("pipeline", pipeline_stage),
+    ("parse", parse_stage),
+    ("resolve", resolve_stage),
+    ("render", render_stage),
+    ("webhook", webhook_stage),
+)
+
+
+def run_suite(stages, repeat=3):
+    """
+    Run the given stages and collect their metrics
+
+    Args:
+        stages: Names of the stages to run, in STAGES order
+        repeat: Runs per stage; the median of each metric is kept
+
+    Returns:
+        Dictionary of "stage.metric" to value
+    """
+    metrics = {}
+    for name, stage in STAGES:
+        if name not in stages:
+            continue
+        print(f"[Suite] Running {name}...")
+        began = time.perf_counter()
+        runs = {}
+        for _ in range(repeat):
+            for metric, value in stage().items():
+                runs.setdefault(f"{name}.{metric}", []).append(value)
+        for key, values in runs.items():
+            metrics[key] = statistics.median(values)
+        print(f"[Suite] {name} finished in {time.perf_counter() - began:.1f}s")
+    return metrics
+
+
+def check(metrics, baseline=None, threshold=DEFAULT_THRESHOLD):
+    """
+    Check every speedup against its floor, and against a baseline if one is given
+
+    Args:
+        metrics: Dictionary of "stage.metric" to value from this run
+        baseline: Dictionary of "stage.metric" to value from an earlier run on the same machine, or None
+        threshold: Allowed loss of a speedup against the baseline, as a fraction of the baseline value
+
+    Returns:
+        List of (metric, value, required, regressed) tuples, one per speedup measured
+    """
+    rows = []
+    for key, value in metrics.items():
+        if not key.endswith("_speedup"):
+            continue
+        required = SPEEDUP_FLOORS.get(key, 0.0)
+        if baseline and baseline.get(key):
+            required = max(required, baseline[key] * (1 - threshold))
+        rows.append((key, value, required, value < required))
+    return rows
+
+
+def load_results(path):
+    """Read the metrics of a results file written by this script"""
+    with open(path, 'r', encoding='utf-8') as file:
+        return json.load(file)["metrics"]
+
+
+def save_results(path, metrics):
+    """Write the metrics along with the machine they were measured on"""
+    results = {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "metrics": metrics,
+    }
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the benchmark suite and check every stage's speedup")
+    parser.add_argument("--stages", nargs="+", choices=[name for name, _ in STAGES],
+                        default=[name for name, _ in STAGES], help="Stages to run")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per stage, the median is kept")
+    parser.add_argument("--output", type=Path, help="Write this run's results to a JSON file")
+    parser.add_argument("--baseline", type=Path,
+                        help="Results file of an earlier run on this machine; speedups may not drop below it "
+                             "by more than --threshold")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed loss of a speedup against --baseline, e.g. 0.3 for 30%%")
+    parser.add_argument("--require-all", action="store_true",
+                        help="Fail if a stage was skipped, e.g. render without a display")
+    args = parser.parse_args()
+
+    metrics = run_suite(args.stages, max(1, args.repeat))
+    skipped = [name for name in args.stages if not any(key.startswith(f"{name}.") for key in metrics)]
+
+    if args.output:
+        save_results(args.output, metrics)
+        print(f"[Suite] Results written to {args.output}")
+
+    baseline = load_results(args.baseline) if args.baseline else None
+    rows = check(metrics, baseline, args.threshold)
+
+    print()
+    print(f"{'Speedup':<40} {'Measured':>10} {'Required':>10}")
+    for key, value, required, regressed in rows:
+        print(f"{key:<40} {value:>9.2f}x {required:>9.2f}x{'  REGRESSION' if regressed else ''}")
+    for key, value in metrics.items():
+        if not key.endswith("_speedup"):
+            print(f"{key:<40} {value:>14,.2f}")
+    for name in skipped:
+        print(f"{name:<40} {'SKIPPED':>10}")
+
+    regressions = [row for row in rows if row[3]]
+    if regressions:
+        print(f"\n{len(regressions)} stage speedup(s) below the required value")
+        sys.exit(1)
+    if skipped:
+        print(f"\n{len(skipped)} stage(s) skipped and not checked: {', '.join(skipped)}")
+        if args.require_all:
+            sys.exit(1)
+        print("Every stage that ran kept its speedup")
+        return
+    print("\nEvery stage kept its speedup")
+
+
+if __name__ == "__main__":
+    main()
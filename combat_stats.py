@@ -0,0 +1,261 @@
+"""
+Combat Statistics
+Running kill, death and streak counters for the detected account, updated in constant time per event
+"""
+
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+
+# Rolling windows reported by snapshot(), in minutes
+WINDOW_MINUTES = (5, 15, 60)
+
+# Width of one ring bucket; window edges are exact to this many seconds
+BUCKET_SECONDS = 10
+
+# Entries returned for each tally in a snapshot
+TOP_ENTRIES = 5
+
+
+def event_time(event):
+    """
+    Get the time of an event in seconds since the epoch
+
+    Args:
+        event: DeathEvent
+
+    Returns:
+        Log timestamp as epoch seconds, or the current time for events without one
+    """
+    timestamp = event.timestamp
+    if timestamp:
+        try:
+            # Whole seconds are enough for the buckets and fromisoformat is much faster than strptime
+            logged = datetime.fromisoformat(timestamp[:19]).replace(tzinfo=timezone.utc)
+            return logged.timestamp()
+        except ValueError:
+            pass
+    return time.time()
+
+
+class BucketRing:
+    def __init__(self, span_seconds, bucket_seconds=BUCKET_SECONDS):
+        """
+        Initialize a ring of time buckets covering span_seconds
+
+        Each slot holds the counts of one bucket_seconds period. A slot is
+        reused for a later period once the ring has wrapped around, so
+        adding an event never scans older buckets.
+
+        Args:
+            span_seconds: Longest window the ring must answer for
+            bucket_seconds: Width of one bucket
+        """
+        self.bucket_seconds = bucket_seconds
+        self.size = -(-span_seconds // bucket_seconds) + 1
+        self._periods = [None] * self.size
+        self._counts = [[0, 0, 0] for _ in range(self.size)]  # kills, deaths, suicides
+
+    def add(self, when, kind):
+        """
+        Count an event
+
+        Args:
+            when: Event time in epoch seconds
+            kind: 0 for a kill, 1 for a death, 2 for a suicide
+        """
+        period = int(when // self.bucket_seconds)
+        slot = period % self.size
+        if self._periods[slot] != period:
+            if self._periods[slot] is not None and self._periods[slot] > period:
+                # Older than anything the ring still covers
+                return
+            self._periods[slot] = period
+            self._counts[slot] = [0, 0, 0]
+        self._counts[slot][kind] += 1
+
+    def totals(self, now, seconds):
+        """
+        Sum the buckets of the last seconds
+
+        Args:
+            now: Current time in epoch seconds
+            seconds: Length of the window
+
+        Returns:
+            List of [kills, deaths, suicides]
+        """
+        current = int(now // self.bucket_seconds)
+        first = current - seconds // self.bucket_seconds + 1
+        totals = [0, 0, 0]
+        for period, counts in zip(self._periods, self._counts):
+            if period is not None and first <= period <= current:
+                totals[0] += counts[0]
+                totals[1] += counts[1]
+                totals[2] += counts[2]
+        return totals
+
+    def clear(self):
+        """Forget every bucket"""
+        self._periods = [None] * self.size
+        self._counts = [[0, 0, 0] for _ in range(self.size)]
+
+
+class CombatStats:
+    def __init__(self, windows=WINDOW_MINUTES, bucket_seconds=BUCKET_SECONDS):
+        """
+        Initialize empty statistics
+
+        Events are fed by the queue worker and snapshots are read by the UI
+        thread, so both go through one lock. Kills, deaths, suicides and
+        streaks are counted for one account; they restart when the account
+        changes, since earlier events were not classified for it. Events
+        seen before any account was detected stay in the event, damage type
+        and location tallies, but are not counted as kills or deaths: they
+        are not kept, so they cannot be classified once the account is known.
+
+        Args:
+            windows: Rolling windows in minutes reported by snapshot()
+            bucket_seconds: Width of the buckets the windows are summed from
+        """
+        self.windows = tuple(windows)
+        self._lock = threading.Lock()
+        self._ring = BucketRing(max(self.windows) * 60, bucket_seconds)
+        self.account_name = None
+        self.reset()
+
+    def reset(self):
+        """Clear every counter"""
+        with self._lock:
+            self._clear()
+
+    def _clear(self):
+        """Clear every counter; caller must hold the lock"""
+        self.events = 0
+        self.kills = 0
+        self.deaths = 0
+        self.suicides = 0
+        self.current_streak = 0
+        self.best_streak = 0
+        self.kill_weapons = Counter()  # Weapons of the account's kills
+        self.death_weapons = Counter()  # Weapons that killed the account
+        self.damage_types = Counter()  # Damage types of every event
+        self.locations = Counter()  # Locations of every event
+        self._ring.clear()
+
+    def add_events(self, events, account_name):
+        """
+        Count a batch of events
+
+        Args:
+            events: DeathEvents in log order
+            account_name: Account the kills and deaths are counted for, or None if not detected yet;
+                          None only counts the events and keeps the counters of the current account
+        """
+        with self._lock:
+            # Checked under the lock so a snapshot never sees one account's counters under another's name
+            if account_name and account_name != self.account_name:
+                # Before the first account nothing account specific was counted
+                if self.account_name:
+                    self._clear()
+                self.account_name = account_name
+
+            for event in events:
+                self._add(event, account_name)
+
+    def _add(self, event, account_name):
+        """Count one event; caller must hold the lock"""
+        self.events += 1
+        self.damage_types[event.damage] += 1
+        self.locations[event.location_display or event.location] += 1
+
+        if not account_name:
+            return
+
+        weapon = event.weapon_display or event.weapon
+        if event.actor == account_name:
+            if event.killer == account_name or event.damage == "Suicide":
+                self.suicides += 1
+                kind = 2
+            else:
+                self.deaths += 1
+                self.death_weapons[weapon] += 1
+                kind = 1
+            self.current_streak = 0
+        elif event.killer == account_name:
+            self.kills += 1
+            self.kill_weapons[weapon] += 1
+            self.current_streak += 1
+            if self.current_streak > self.best_streak:
+                self.best_streak = self.current_streak
+            kind = 0
+        else:
+            return
+
+        self._ring.add(event_time(event), kind)
+
+    def snapshot(self, now=None):
+        """
+        Get a consistent copy of the statistics
+
+        Args:
+            now: Epoch seconds the rolling windows end at; defaults to the current time
+
+        Returns:
+            Dictionary with the account, event count, kills, deaths, suicides, kd,
+            current_streak, best_streak, windows (minutes -> kills, deaths, suicides)
+            and the top entries of each tally
+        """
+        if now is None:
+            now = time.time()
+
+        with self._lock:
+            windows = {}
+            for minutes in self.windows:
+                kills, deaths, suicides = self._ring.totals(now, minutes * 60)
+                windows[minutes] = {"kills": kills, "deaths": deaths, "suicides": suicides}
+
+            return {
+                "account": self.account_name,
+                "events": self.events,
+                "kills": self.kills,
+                "deaths": self.deaths,
+                "suicides": self.suicides,
+                "kd": self.kills / self.deaths if self.deaths else float(self.kills),
+                "current_streak": self.current_streak,
+                "best_streak": self.best_streak,
+                "windows": windows,
+                "kill_weapons": self.kill_weapons.most_common(TOP_ENTRIES),
+                "death_weapons": self.death_weapons.most_common(TOP_ENTRIES),
+                "damage_types": self.damage_types.most_common(TOP_ENTRIES),
+                "locations": self.locations.most_common(TOP_ENTRIES),
+            }
+
+
+def format_stats(snapshot):
+    """
+    Format a snapshot as the short summary shown above the records table
+
+    Args:
+        snapshot: Dictionary returned by CombatStats.snapshot()
+
+    Returns:
+        Summary text
+    """
+    if not snapshot["account"]:
+        return f"Session: {snapshot['events']} deaths seen - account not detected yet"
+
+    lines = [
+        f"Session: {snapshot['kills']} kills, {snapshot['deaths']} deaths, {snapshot['suicides']} suicides"
+        f" - K/D {snapshot['kd']:.2f} - streak {snapshot['current_streak']} (best {snapshot['best_streak']})"
+    ]
+
+    recent = [f"{minutes} min {counts['kills']}/{counts['deaths']}"
+              for minutes, counts in snapshot["windows"].items()]
+    lines.append(f"Recent K/D: {', '.join(recent)}")
+
+    if snapshot["kill_weapons"]:
+        weapon, count = snapshot["kill_weapons"][0]
+        lines[-1] += f" - favorite weapon: {weapon} ({count} kills)"
+    return "\n".join(lines)
@@ -0,0 +1,85 @@
+"""
+Death Event
+Immutable record of a parsed death with its display strings resolved once
+"""
+
+from datetime import datetime, timezone
+from typing import NamedTuple, Optional
+
+from log_sources import DEFAULT_CHANNEL
+
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+
+class DeathEvent(NamedTuple):
+    """A death event shared by the overlay, records window, exporter and Discord sender"""
+    timestamp: Optional[str]  # ISO UTC timestamp from the log
+    actor: str
+    killer: str
+    weapon: Optional[str]
+    damage: str
+    location: str
+    weapon_display: Optional[str]
+    location_display: Optional[str]
+    display_time: str  # Local time as HH:MM:SS for the overlay
+    display_datetime: str  # Local date and time for the records window
+    raw_line: str
+    source: str = DEFAULT_CHANNEL  # Game channel whose log the event was read from
+
+    def get(self, key, default=None):
+        """Dictionary-style access so existing consumers can read events like dicts"""
+        return getattr(self, key, default)
+
+
+def create_death_event(line, parsed, get_weapon_name, get_location_name, source=DEFAULT_CHANNEL):
+    """
+    Build a DeathEvent from a parsed death line
+
+    Args:
+        line: Raw log line the event was parsed from
+        parsed: ParsedDeath returned by death_parser.parse_death_line
+        get_weapon_name: Callable resolving a weapon ID to a display name
+        get_location_name: Callable resolving a zone ID to a display name
+        source: Game channel whose log the line was read from
+
+    Returns:
+        DeathEvent with weapon, location and time already formatted
+    """
+    display_time, display_datetime = format_local_time(parsed.timestamp)
+
+    return DeathEvent(
+        timestamp=parsed.timestamp,
+        actor=parsed.actor,
+        killer=parsed.killer,
+        weapon=parsed.weapon,
+        damage=parsed.damage,
+        location=parsed.location,
+        weapon_display=get_weapon_name(parsed.weapon),
+        location_display=get_location_name(parsed.location),
+        display_time=display_time,
+        display_datetime=display_datetime,
+        raw_line=line,
+        source=source,
+    )
+
+
+def format_local_time(timestamp):
+    """
+    Convert a log timestamp to local display strings
+
+    Args:
+        timestamp: ISO UTC timestamp from the log, or None
+
+    Returns:
+        Tuple of (HH:MM:SS, YYYY-MM-DD HH:MM:SS) in the local timezone
+    """
+    if not timestamp:
+        return datetime.now().strftime("%H:%M:%S"), "Unknown"
+
+    try:
+        utc_time = datetime.strptime(timestamp, TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc)
+    except ValueError:
+        return datetime.now().strftime("%H:%M:%S"), timestamp
+
+    local_time = utc_time.astimezone()
+    return local_time.strftime("%H:%M:%S"), local_time.strftime("%Y-%m-%d %H:%M:%S")
@@ -0,0 +1,121 @@
+"""
+Death Line Parser
+Extracts death event details from Game.log lines in a single regex pass
+"""
+
+import re
+from typing import NamedTuple, Optional, Tuple
+
+DEATH_MARKER = b"<Actor Death>"
+
+# New format:
+# <2025-04-25T18:02:17.301Z> [Notice] <Actor Death> CActor::Kill: 'Voisys' [201996731201] in zone 'AEGS_Gladius_2984839923201'
+# killed by 'Lsync' [201964490332] using 'KLWE_LaserRepeater_S3_2984839923407' [Class unknown] with damage type 'VehicleDestruction'
+# from direction x: 0.000000, y: 0.000000, z: 0.000000 [Team_ActorTech][Actor]
+NEW_FORMAT_PATTERN = re.compile(
+    r"<(?P<timestamp>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z)>[^<]*"
+    r"<Actor Death> CActor::Kill: '(?P<actor>[^']+)' \[(?P<actor_id>\d+)\] "
+    r"in zone '(?P<location>[^']+)' "
+    r"killed by '(?P<killer>[^']+)' \[(?P<killer_id>\d+)\] "
+    r"using '(?P<weapon>[^']+)' \[(?P<weapon_class>[^\]]*)\] "
+    r"with damage type '(?P<damage>[^']+)'"
+    r"(?: from direction x: (?P<dir_x>-?\d+(?:\.\d+)?), y: (?P<dir_y>-?\d+(?:\.\d+)?), z: (?P<dir_z>-?\d+(?:\.\d+)?))?"
+)
+
+# Old format:
+# <Actor Death> 'Player' [12345] in zone 'Location' killed by 'Killer' with damage type 'Type'
+OLD_FORMAT_PATTERN = re.compile(
+    r"<Actor Death> '(?P<actor>[^']+)' \[(?P<actor_id>\d+)\] "
+    r"in zone '(?P<location>[^']+)' "
+    r"killed by '(?P<killer>[^']+)'(?: \[(?P<killer_id>\d+)\])?"
+    r"(?: using '(?P<weapon>[^']+)'(?: \[(?P<weapon_class>[^\]]*)\])?)? "
+    r"with damage type '(?P<damage>[^']+)'"
+)
+
+# Field-by-field fallback for lines that match neither known format
+TIMESTAMP_PATTERN = re.compile(r"<(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z)>")
+ACTOR_PATTERN = re.compile(r"'([^']+)'\s+\[(\d+)\]")
+KILLER_PATTERN = re.compile(r"killed by '([^']+)'")
+WEAPON_PATTERN = re.compile(r"using '([^']+)'")
+DAMAGE_PATTERN = re.compile(r"damage type '([^']+)'")
+LOCATION_PATTERN = re.compile(r"in zone '([^']+)'")
+
+
+class ParsedDeath(NamedTuple):
+    """Fields extracted from a single death line"""
+    timestamp: Optional[str]
+    actor: str
+    actor_id: Optional[str]
+    killer: str
+    killer_id: Optional[str]
+    weapon: Optional[str]
+    weapon_class: Optional[str]
+    damage: str
+    location: str
+    direction: Optional[Tuple[float, float, float]]
+
+
+def is_death_line(raw_line):
+    """
+    Check a raw log line for the death marker without decoding it
+
+    Args:
+        raw_line: Undecoded log line
+
+    Returns:
+        True if the line reports an actor death
+    """
+    return DEATH_MARKER in raw_line
+
+
+def parse_death_line(line):
+    """
+    Parse a death line to extract useful information
+
+    Args:
+        line: Decoded log line
+
+    Returns:
+        ParsedDeath with "Unknown" for any field that could not be found
+    """
+    if "CActor::Kill" in line:
+        match = NEW_FORMAT_PATTERN.search(line)
+        if match:
+            (timestamp, actor, actor_id, location, killer, killer_id,
+             weapon, weapon_class, damage, x, y, z) = match.groups()
+            direction = (float(x), float(y), float(z)) if x is not None else None
+            return ParsedDeath(timestamp, actor, actor_id, killer, killer_id, weapon, weapon_class,
+                               damage, location, direction)
+    else:
+        match = OLD_FORMAT_PATTERN.search(line)
+        if match:
+            actor, actor_id, location, killer, killer_id, weapon, weapon_class, damage = match.groups()
+            timestamp_match = TIMESTAMP_PATTERN.match(line)
+            timestamp = timestamp_match.group(1) if timestamp_match else None
+            return ParsedDeath(timestamp, actor, actor_id, killer, killer_id, weapon, weapon_class,
+                               damage, location, None)
+
+    return _parse_fields(line)
+
+
+def _parse_fields(line):
+    """Extract each field separately for lines in an unrecognised layout"""
+    timestamp_match = TIMESTAMP_PATTERN.search(line)
+    actor_match = ACTOR_PATTERN.search(line)
+    killer_match = KILLER_PATTERN.search(line)
+    weapon_match = WEAPON_PATTERN.search(line)
+    damage_match = DAMAGE_PATTERN.search(line)
+    location_match = LOCATION_PATTERN.search(line)
+
+    return ParsedDeath(
+        timestamp=timestamp_match.group(1) if timestamp_match else None,
+        actor=actor_match.group(1) if actor_match else "Unknown",
+        actor_id=actor_match.group(2) if actor_match else None,
+        killer=killer_match.group(1) if killer_match else "Unknown",
+        killer_id=None,
+        weapon=weapon_match.group(1) if weapon_match else None,
+        weapon_class=None,
+        damage=damage_match.group(1) if damage_match else "Unknown",
+        location=location_match.group(1) if location_match else "Unknown",
+        direction=None,
+    )
@@ -0,0 +1,252 @@
+"""
+Discord Outbox
+Append-only journal of death records waiting to be posted, so queued kills survive restarts and crashes
+"""
+
+import json
+import os
+import threading
+import uuid
+from collections import OrderedDict, deque
+
+from event_store import event_key
+
+# Keys of delivered records remembered to recognise a kill queued again after a restart
+DONE_KEYS_KEPT = 2000
+
+# Journal lines appended since the last rewrite before the file is compacted again
+COMPACT_AFTER_LINES = 500
+
+
+def outbox_record(record):
+    """
+    Convert a DeathEvent or dictionary into the plain dictionary stored in the journal
+
+    Args:
+        record: DeathEvent or dictionary containing death information
+
+    Returns:
+        JSON-serializable dictionary
+    """
+    if hasattr(record, '_asdict'):
+        return dict(record._asdict())
+    return dict(record)
+
+
+class DiscordOutbox:
+    def __init__(self, path=None):
+        """
+        Open the outbox and replay its journal
+
+        Each line of the journal is a JSON object: {"add": key, "record": {...}}
+        when a record is queued and {"done": key} once it has been sent or
+        given up on. Replaying the lines in order gives back every record that
+        was still pending when the app stopped.
+
+        Args:
+            path: Journal file path, or None to keep the outbox in memory only
+        """
+        self.path = str(path) if path else None
+        self._condition = threading.Condition()
+        self._pending = OrderedDict()  # key -> record, oldest first
+        self._done_keys = set()
+        self._done_order = deque()
+        self._journal = None
+        self._journal_lines = 0
+        self._compacted_lines = 0  # Journal length right after the last compaction
+        self._damaged = False
+        self._journal_error = None  # Last journal write error reported, so it is not repeated
+
+        if self.path:
+            self._replay()
+            self._journal = open(self.path, 'a', encoding='utf-8')
+            if self._damaged:
+                # Rewrite so new entries are not appended to the end of a broken line
+                self._compact()
+            if self._pending:
+                print(f"[Discord] Outbox has {len(self._pending)} unsent death records from a previous run")
+
+    def __len__(self):
+        with self._condition:
+            return len(self._pending)
+
+    def add(self, record):
+        """
+        Queue a record, writing it to the journal before it is handed to the sender
+
+        Args:
+            record: DeathEvent or dictionary containing death information
+
+        Returns:
+            True if queued, False if a record with the same event key is already pending or was sent
+        """
+        data = outbox_record(record)
+        key = event_key(data)
+        with self._condition:
+            if key is None:
+                # Without a timestamp the record cannot be recognised later, so it gets a unique key
+                key = f"unkeyed|{uuid.uuid4().hex}"
+            elif key in self._pending or key in self._done_keys:
+                return False
+
+            self._write({"add": key, "record": data})
+            self._pending[key] = data
+            self._condition.notify()
+        return True
+
+    def peek(self, limit, timeout=None):
+        """
+        Get the oldest pending records without removing them
+
+        Args:
+            limit: Maximum number of records to return
+            timeout: Seconds to wait for a record if none is pending
+
+        Returns:
+            List of (key, record) tuples, oldest first; empty if the wait timed out
+        """
+        with self._condition:
+            if not self._pending and timeout:
+                self._condition.wait(timeout)
+            items = []
+            for item in self._pending.items():
+                if len(items) >= limit:
+                    break
+                items.append(item)
+            return items
+
+    def ack(self, keys):
+        """
+        Mark records as finished, sent or dropped, so they are not posted again
+
+        Args:
+            keys: Keys returned by peek()
+        """
+        with self._condition:
+            for key in keys:
+                if self._pending.pop(key, None) is None:
+                    continue
+                self._write({"done": key})
+                self._remember_done(key)
+            self._flush()
+
+            if self._journal_lines - self._compacted_lines >= COMPACT_AFTER_LINES:
+                self._compact()
+
+    def close(self):
+        """Close the journal file; pending records stay on disk for the next run"""
+        with self._condition:
+            if self._journal:
+                self._journal.close()
+                self._journal = None
+
+    def _remember_done(self, key):
+        """Keep the key of a finished record, forgetting the oldest beyond DONE_KEYS_KEPT"""
+        if key.startswith("unkeyed|") or key in self._done_keys:
+            return
+        self._done_keys.add(key)
+        self._done_order.append(key)
+        while len(self._done_order) > DONE_KEYS_KEPT:
+            self._done_keys.discard(self._done_order.popleft())
+
+    def _write(self, entry):
+        """Append one entry to the journal and make sure it reached the disk"""
+        if not self._journal:
+            return
+        try:
+            self._journal.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        except OSError as e:
+            self._report_journal_error(e)
+            return
+        self._journal_lines += 1
+        if "add" in entry:
+            self._flush()
+
+    def _flush(self):
+        """Flush the journal to disk"""
+        if not self._journal:
+            return
+        try:
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+        except OSError as e:
+            self._report_journal_error(e)
+            return
+        self._journal_error = None
+
+    def _report_journal_error(self, error):
+        """
+        Report a failed journal write once; the record stays queued in memory
+
+        A full disk or a locked file must never stop deaths from reaching the
+        overlay and the event store, so the outbox keeps working without
+        persistence until the journal can be written again.
+        """
+        message = str(error)
+        if message != self._journal_error:
+            self._journal_error = message
+            print(f"[Discord] Could not write the outbox journal, queued kills are kept in memory only: {error}")
+
+    def _replay(self):
+        """Rebuild the pending records and finished keys from the journal"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as journal:
+                for line in journal:
+                    self._journal_lines += 1
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # A line cut short by a crash; everything before it is intact
+                        print("[Discord] Skipping damaged outbox journal line")
+                        self._damaged = True
+                        continue
+                    if "add" in entry:
+                        self._pending[entry["add"]] = entry["record"]
+                    elif "done" in entry:
+                        self._pending.pop(entry["done"], None)
+                        self._remember_done(entry["done"])
+        except FileNotFoundError:
+            pass
+
+    def _compact(self):
+        """Rewrite the journal with only the finished keys still remembered and the pending records"""
+        if not self._journal:
+            return
+
+        temp_path = self.path + ".tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as journal:
+                for key in self._done_order:
+                    journal.write(json.dumps({"done": key}, ensure_ascii=False) + "\n")
+                for key, data in self._pending.items():
+                    journal.write(json.dumps({"add": key, "record": data}, ensure_ascii=False) + "\n")
+                journal.flush()
+                os.fsync(journal.fileno())
+        except OSError as e:
+            self._report_journal_error(e)
+            # Not retried on every ack; the next attempt waits for another COMPACT_AFTER_LINES lines
+            self._compacted_lines = self._journal_lines
+            return
+
+        # Windows cannot replace a file that is still open
+        self._journal.close()
+        replaced = False
+        try:
+            os.replace(temp_path, self.path)
+            replaced = True
+        except OSError as e:
+            self._report_journal_error(e)
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+        finally:
+            try:
+                self._journal = open(self.path, 'a', encoding='utf-8')
+            except OSError as e:
+                self._journal = None
+                self._report_journal_error(e)
+
+        if replaced:
+            self._journal_lines = len(self._done_order) + len(self._pending)
+        self._compacted_lines = self._journal_lines
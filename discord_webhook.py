@@ -3,27 +3,184 @@ Discord Webhook Integration
 Sends death records to a Discord channel via webhook
 """
 
-import requests
 import json
+import random
+from collections import deque
 from datetime import datetime, timezone
 import threading
-import queue
 import time
+from discord_outbox import DiscordOutbox
+
+# Discord accepts up to 10 embeds per message and 6000 characters across them
+MAX_EMBEDS_PER_MESSAGE = 10
+MAX_MESSAGE_EMBED_CHARS = 6000
+
+# Seconds to wait when Discord rate limits without saying for how long
+DEFAULT_RETRY_AFTER = 2.0
+
+# Attempts per message before it is dropped, for 5xx responses and network errors
+MAX_SEND_ATTEMPTS = 5
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 30.0
+
+# Consecutive failures that open the circuit, and how long it stays open
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_RESET_SECONDS = 30.0
+
+# Number of recent request latencies kept for the percentiles
+LATENCY_SAMPLES = 1000
+
+
+def _header_seconds(value, default):
+    """
+    Read a number of seconds from a rate limit header
+
+    Args:
+        value: Header value or None
+        default: Seconds to use if the header is missing or malformed
+
+    Returns:
+        Seconds as a float
+    """
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return default
+
+
+def backoff_delay(attempt):
+    """
+    Get the wait before a retry using exponential backoff with full jitter
+
+    Args:
+        attempt: Number of failed attempts so far, starting at 1
+
+    Returns:
+        Seconds to wait, random between 0 and the exponential cap
+    """
+    return random.uniform(0, min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)))
+
+
+def _percentile(sorted_values, percent):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    index = max(0, min(len(sorted_values) - 1, int(round(percent / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold=CIRCUIT_FAILURE_THRESHOLD, reset_seconds=CIRCUIT_RESET_SECONDS):
+        """
+        Initialize the breaker in the closed state
+
+        After failure_threshold consecutive failures the circuit opens and no
+        request is allowed for reset_seconds. Then a single trial request is
+        let through: success closes the circuit, failure opens it again.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_seconds: Seconds the circuit stays open before a trial request
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at = None
+
+    @property
+    def is_open(self):
+        """True while requests are being held back"""
+        return self.opened_at is not None
+
+    def retry_in(self):
+        """Seconds until a trial request is allowed; 0 if requests may go out now"""
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.opened_at + self.reset_seconds - time.monotonic())
+
+    def record_success(self):
+        """Close the circuit after a successful request"""
+        if self.opened_at is not None:
+            print("[Discord] Webhook reachable again, circuit closed")
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self):
+        """Count a failed request and open the circuit if there were too many in a row"""
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            if self.opened_at is None:
+                print(f"[Discord] {self.failures} failures in a row, pausing sends for {self.reset_seconds:.0f}s")
+            self.opened_at = time.monotonic()
+
+
+class WebhookStats:
+    def __init__(self):
+        """Initialize the delivery counters"""
+        self._lock = threading.Lock()
+        self.sent = 0  # Records delivered
+        self.retried = 0  # Records scheduled for another attempt
+        self.dropped = 0  # Records given up on
+        self.requests = 0
+        self._latencies = deque(maxlen=LATENCY_SAMPLES)
+
+    def record_request(self, seconds):
+        """Remember the latency of one HTTP request"""
+        with self._lock:
+            self.requests += 1
+            self._latencies.append(seconds)
+
+    def add(self, sent=0, retried=0, dropped=0):
+        """Add to the record counters"""
+        with self._lock:
+            self.sent += sent
+            self.retried += retried
+            self.dropped += dropped
+
+    def snapshot(self):
+        """
+        Get a consistent copy of the counters
+
+        Returns:
+            Dictionary with sent, retried, dropped, requests and p50/p90/p99 latency in milliseconds
+        """
+        with self._lock:
+            latencies = sorted(self._latencies)
+            stats = {
+                "sent": self.sent,
+                "retried": self.retried,
+                "dropped": self.dropped,
+                "requests": self.requests,
+            }
+        for percent in (50, 90, 99):
+            value = _percentile(latencies, percent)
+            stats[f"p{percent}_ms"] = value * 1000 if value is not None else None
+        return stats
 
 
 class DiscordWebhook:
-    def __init__(self, webhook_url=None):
+    def __init__(self, webhook_url=None, outbox_path=None):
         """
         Initialize Discord webhook sender
 
         Args:
             webhook_url: Discord webhook URL
+            outbox_path: Journal file for records waiting to be sent, so they
+                         survive restarts; None keeps them in memory only
         """
         self.webhook_url = webhook_url
         self.enabled = bool(webhook_url and webhook_url.strip())
-        self.message_queue = queue.Queue()
+        self.outbox = DiscordOutbox(outbox_path)
         self.worker_thread = None
         self.running = False
+        self.next_send_at = 0.0  # time.monotonic() before which Discord must not be called
+        self.failed_attempts = 0  # Failed attempts of the batch being sent
+        self.circuit = CircuitBreaker()
+        self.stats = WebhookStats()
+
+        # Created on the first request, so requests is not imported at startup
+        self.session = None
+        self.session_lock = threading.Lock()
         print(f"[Discord] Webhook initialized - enabled: {self.enabled}")
 
     def set_webhook_url(self, url):
@@ -44,82 +201,259 @@ class DiscordWebhook:
         self.running = False
         if self.worker_thread:
             self.worker_thread.join(timeout=2)
-        print("[Discord] Webhook sender stopped")
+        stats = self.stats.snapshot()
+        print(f"[Discord] Webhook sender stopped - sent {stats['sent']}, retried {stats['retried']}, "
+              f"dropped {stats['dropped']}")
+
+    def close(self):
+        """Stop sending and release the connection pool and outbox journal"""
+        self.stop()
+        with self.session_lock:
+            if self.session is not None:
+                self.session.close()
+                self.session = None
+        self.outbox.close()
 
     def send_death_record(self, death_data):
         """
         Queue a death record to be sent to Discord
 
         Args:
-            death_data: Dictionary containing death information
+            death_data: DeathEvent or dictionary containing death information
         """
         if not self.enabled:
             print("[Discord] Webhook not enabled, skipping send")
             return
 
-        self.message_queue.put(death_data)
-        print(f"[Discord] Queued death record for {death_data.get('actor', 'Unknown')}")
+        if self.outbox.add(death_data):
+            print(f"[Discord] Queued death record for {death_data.get('actor', 'Unknown')}")
+        else:
+            print(f"[Discord] Already queued or sent, skipping death record for {death_data.get('actor', 'Unknown')}")
+
+    def send_kills(self, events, account_name):
+        """
+        Queue the events in which the account is the killer
+
+        Args:
+            events: DeathEvents in log order
+            account_name: Detected account name, or None if not known yet
+        """
+        for event in events:
+            # Only post if I (account_name) am the killer
+            if account_name and event.killer == account_name:
+                print(f"[Discord] Posting kill: {account_name} killed {event.actor}")
+                self.send_death_record(event)
+            else:
+                print(f"[Debug] Skipping Discord - Killer: {event.killer}, Victim: {event.actor}, My account: {account_name}")
 
     def _worker(self):
-        """Worker thread that processes the message queue"""
+        """Worker thread that packs queued records into as few requests as the rate limit allows"""
+        pending = []
         while self.running:
             try:
-                # Get message from queue with timeout
-                death_data = self.message_queue.get(timeout=1)
-
-                # Send to Discord
-                self._send_to_discord(death_data)
+                # Oldest unsent records; they stay in the outbox until acknowledged
+                pending = self.outbox.peek(MAX_EMBEDS_PER_MESSAGE, timeout=1)
+                if not pending:
+                    continue
+
+                # Sleep until the rate limit bucket has room and the circuit
+                # allows requests, waking up to notice stop()
+                delay = max(self.next_send_at - time.monotonic(), self.circuit.retry_in())
+                if delay > 0:
+                    time.sleep(min(delay, 1.0))
+                    continue
+
+                done = self._send_to_discord([record for _, record in pending])
+                if done:
+                    self.outbox.ack([key for key, _ in pending[:done]])
 
-                # Rate limiting - Discord allows 30 requests per minute
-                time.sleep(2)  # Wait 2 seconds between messages
-
-            except queue.Empty:
-                continue
             except Exception as e:
+                # Drop the batch so a record that keeps failing cannot block the outbox
                 print(f"[Discord] Error in worker thread: {e}")
+                self.stats.add(dropped=len(pending))
+                try:
+                    self.outbox.ack([key for key, _ in pending])
+                except OSError as e:
+                    print(f"[Discord] Error updating outbox: {e}")
 
-    def _send_to_discord(self, death_data):
+    def _send_to_discord(self, records):
         """
-        Send a formatted death record to Discord
+        Send as many records as fit in one message as a single request
 
         Args:
-            death_data: Dictionary containing death information
+            records: DeathEvents or dictionaries in the order they were queued
+
+        Returns:
+            Number of records that are done with (sent or dropped); 0 if they should be retried
         """
         if not self.webhook_url:
-            return
+            return len(records)
+
+        import requests
+
+        embeds = self._pack_embeds(records)
+        count = len(embeds)
 
         try:
-            # Format the embed
-            embed = self._create_embed(death_data)
+            response = self._post({"embeds": embeds})
+        except requests.exceptions.RequestException as e:
+            print(f"[Discord] Network error sending webhook: {e}")
+            return self._handle_failure(count)
 
-            payload = {
-                "embeds": [embed]
-            }
+        self._update_rate_limit(response)
 
-            # Send to Discord
-            response = requests.post(
-                self.webhook_url,
-                json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=10
-            )
+        if response.status_code == 429:
+            print(f"[Discord] Rate limited, retrying {count} records in "
+                  f"{max(0.0, self.next_send_at - time.monotonic()):.2f}s")
+            return 0
 
-            if response.status_code == 204:
-                print(f"[Discord] Sent death record: {death_data.get('actor', 'Unknown')}")
-            else:
-                print(f"[Discord] Failed to send: {response.status_code} - {response.text}")
+        if response.status_code >= 500:
+            print(f"[Discord] Server error: {response.status_code}")
+            return self._handle_failure(count)
 
-        except requests.exceptions.RequestException as e:
-            print(f"[Discord] Network error sending webhook: {e}")
-        except Exception as e:
-            print(f"[Discord] Error sending webhook: {e}")
+        self.circuit.record_success()
+        self.failed_attempts = 0
+
+        if 200 <= response.status_code < 300:
+            names = ", ".join(record.get('actor', 'Unknown') for record in records[:count])
+            print(f"[Discord] Sent {count} death records: {names}")
+            self.stats.add(sent=count)
+        else:
+            # Other 4xx answers will not change on a retry
+            print(f"[Discord] Failed to send: {response.status_code} - {response.text}")
+            self.stats.add(dropped=count)
+        return count
+
+    def _post(self, payload):
+        """
+        POST a payload to the webhook over the pooled session
+
+        Args:
+            payload: JSON-serializable message body
+
+        Returns:
+            requests.Response
+        """
+        session = self._get_session()
+        began = time.perf_counter()
+        try:
+            return session.post(self.webhook_url, json=payload, timeout=10)
+        finally:
+            self.stats.record_request(time.perf_counter() - began)
+
+    def _get_session(self):
+        """
+        Get the pooled session, creating it on first use
+
+        One pooled keep-alive connection is reused instead of a new TCP+TLS
+        handshake per kill.
+
+        Returns:
+            requests.Session
+        """
+        with self.session_lock:
+            if self.session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                self.session = requests.Session()
+                self.session.headers.update({"Content-Type": "application/json"})
+                self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+                self.session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
+            return self.session
+
+    def _handle_failure(self, count):
+        """
+        Schedule a retry of a batch after a network error or 5xx response
+
+        Args:
+            count: Number of records in the failed request
+
+        Returns:
+            Number of records given up on: count once attempts run out, otherwise 0
+        """
+        self.circuit.record_failure()
+        self.failed_attempts += 1
+
+        if self.failed_attempts >= MAX_SEND_ATTEMPTS:
+            print(f"[Discord] Dropping {count} death records after {self.failed_attempts} attempts")
+            self.failed_attempts = 0
+            self.stats.add(dropped=count)
+            return count
+
+        delay = backoff_delay(self.failed_attempts)
+        self.next_send_at = max(self.next_send_at, time.monotonic() + delay)
+        self.stats.add(retried=count)
+        print(f"[Discord] Retrying {count} records in {delay:.2f}s (attempt {self.failed_attempts + 1})")
+        return 0
+
+    def get_stats(self):
+        """
+        Get delivery statistics
+
+        Returns:
+            Dictionary of counters and latency percentiles, plus whether the circuit is open
+        """
+        stats = self.stats.snapshot()
+        stats["circuit_open"] = self.circuit.is_open
+        return stats
+
+    def _pack_embeds(self, records):
+        """
+        Build the embeds for the longest prefix of records that fits in one message
+
+        Args:
+            records: DeathEvents or dictionaries, at least one
+
+        Returns:
+            List of embeds, at most MAX_EMBEDS_PER_MESSAGE and within MAX_MESSAGE_EMBED_CHARS
+        """
+        embeds = []
+        total_chars = 0
+        for record in records[:MAX_EMBEDS_PER_MESSAGE]:
+            embed = self._create_embed(record)
+            # The JSON length overestimates the counted text, so this stays under the limit
+            chars = len(json.dumps(embed, ensure_ascii=False))
+            if embeds and total_chars + chars > MAX_MESSAGE_EMBED_CHARS:
+                break
+            embeds.append(embed)
+            total_chars += chars
+        return embeds
+
+    def _update_rate_limit(self, response):
+        """
+        Schedule the next request from the rate limit information of a response
+
+        Args:
+            response: Response of the last webhook request
+        """
+        now = time.monotonic()
+        headers = response.headers
+
+        if response.status_code == 429:
+            retry_after = None
+            try:
+                retry_after = float(response.json().get("retry_after"))
+            except (ValueError, TypeError, AttributeError):
+                pass
+            if retry_after is None:
+                retry_after = _header_seconds(headers.get("Retry-After"), DEFAULT_RETRY_AFTER)
+            self.next_send_at = now + retry_after
+            return
+
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is not None and remaining.strip() == "0":
+            # Bucket is empty; the next request may go out once it resets
+            self.next_send_at = now + _header_seconds(headers.get("X-RateLimit-Reset-After"), DEFAULT_RETRY_AFTER)
+        else:
+            self.next_send_at = now
 
     def _create_embed(self, death_data):
         """
         Create a Discord embed from death data
 
         Args:
-            death_data: Dictionary containing death information
+            death_data: DeathEvent or dictionary containing death information
 
         Returns:
             Dictionary representing Discord embed
@@ -201,6 +535,8 @@ class DiscordWebhook:
         if not self.webhook_url:
             return False, "No webhook URL configured"
 
+        import requests
+
         try:
             test_data = {
                 "timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ"),
@@ -220,12 +556,7 @@ class DiscordWebhook:
 
             payload = {"embeds": [embed]}
 
-            response = requests.post(
-                self.webhook_url,
-                json=payload,
-                headers={"Content-Type": "application/json"},
-                timeout=10
-            )
+            response = self._post(payload)
 
             if response.status_code == 204:
                 return True, "Test message sent successfully!"
@@ -0,0 +1,495 @@
+"""
+Event Server
+Local HTTP and WebSocket server that pushes death events to browser-source overlays
+"""
+
+import asyncio
+import base64
+import hashlib
+import socket
+import struct
+import threading
+from collections import deque
+from urllib.parse import parse_qs, urlsplit
+
+from record_exporter import JSON_ENCODER, ndjson_record
+
+DEFAULT_PORT = 8766
+
+# Events kept for GET /recent
+RECENT_EVENTS = 200
+
+# Frames queued per WebSocket client; a slow client loses its oldest frames beyond this
+CLIENT_QUEUE_SIZE = 256
+
+# Bytes the kernel and the transport may hold for a WebSocket client; kept small so a
+# stalled client falls back on its frame queue, which drops the oldest events, instead of
+# building up megabytes of stale ones
+SOCKET_SEND_BUFFER = 64 * 1024
+
+# Largest request head and client frame accepted, in bytes
+MAX_REQUEST_HEAD = 8192
+MAX_CLIENT_FRAME = 64 * 1024
+
+# Seconds a closing client gets to flush its queued frames
+CLOSE_TIMEOUT = 1.0
+
+# Appended to Sec-WebSocket-Key to build the handshake answer (RFC 6455 section 1.3)
+WEBSOCKET_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+OPCODE_TEXT = 0x1
+OPCODE_CLOSE = 0x8
+OPCODE_PING = 0x9
+OPCODE_PONG = 0xA
+
+# Host names a browser page may connect from and requests may be addressed to; other sites are refused
+LOCAL_HOSTS = ("127.0.0.1", "localhost", "::1")
+
+# Minimal overlay for an OBS browser source; lines fade out like the desktop overlay
+OVERLAY_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Game Log Monitor</title>
+<style>
+body { margin: 0; background: transparent; font: 16px Arial, sans-serif; color: #f33; text-shadow: 0 0 3px #000; }
+div { padding: 2px 6px; white-space: nowrap; }
+.killer { color: #fa0; } .weapon { color: #ccc; } .location { color: #8cf; }
+</style></head>
+<body><script>
+const params = new URLSearchParams(location.search);
+const maxLines = Number(params.get("lines") || 5), ttl = Number(params.get("ttl") || 120) * 1000;
+const source = params.get("source");
+function text(parent, value, cls) {
+  const span = document.createElement("span"); span.textContent = value;
+  if (cls) span.className = cls; parent.appendChild(span);
+}
+function show(e) {
+  if (source && e.source !== source) return;
+  const line = document.createElement("div");
+  const time = e.timestamp ? new Date(e.timestamp).toLocaleTimeString() : "";
+  const channel = e.source && e.source !== "LIVE" ? `[${e.source}] ` : "";
+  text(line, `[${time}] ${channel}${e.actor} ☠ by `); text(line, e.killer, "killer");
+  if (e.weapon) text(line, ` (${e.weapon_display})`, "weapon");
+  text(line, ` - ${e.damage}`);
+  if (e.location_display && e.location_display !== e.location) text(line, ` @ ${e.location_display}`, "location");
+  document.body.appendChild(line);
+  while (document.body.querySelectorAll("div").length > maxLines) document.body.querySelector("div").remove();
+  setTimeout(() => line.remove(), ttl);
+}
+function connect() {
+  const socket = new WebSocket(`ws://${location.host}/events`);
+  socket.onmessage = message => show(JSON.parse(message.data));
+  socket.onclose = () => setTimeout(connect, 2000);
+}
+connect();
+</script></body></html>
+"""
+
+
+def websocket_accept(key):
+    """
+    Build the Sec-WebSocket-Accept value for a handshake
+
+    Args:
+        key: Sec-WebSocket-Key sent by the client
+
+    Returns:
+        Base64 SHA-1 of the key and the WebSocket GUID
+    """
+    digest = hashlib.sha1(key.encode('ascii') + WEBSOCKET_GUID).digest()
+    return base64.b64encode(digest).decode('ascii')
+
+
+def encode_frame(payload, opcode=OPCODE_TEXT):
+    """
+    Build one unmasked, unfragmented server frame
+
+    Args:
+        payload: Frame payload bytes
+        opcode: Frame opcode, text by default
+
+    Returns:
+        Frame bytes
+    """
+    length = len(payload)
+    if length < 126:
+        header = struct.pack("!BB", 0x80 | opcode, length)
+    elif length < 65536:
+        header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+    return header + payload
+
+
+def is_local_origin(origin):
+    """
+    Check whether a WebSocket client may connect from the page it was opened on
+
+    Browsers send the Origin of the page with every WebSocket handshake, so
+    without this check any website open in the browser could read the kill
+    feed. Clients outside a browser send no Origin and are allowed.
+
+    Args:
+        origin: Value of the Origin header, or None if there was none
+
+    Returns:
+        True for no Origin or an http(s) page on this machine, False otherwise, including "null"
+    """
+    if origin is None:
+        return True
+    url = urlsplit(origin)
+    try:
+        hostname = url.hostname
+    except ValueError:
+        return False
+    return url.scheme in ("http", "https") and hostname in LOCAL_HOSTS
+
+
+def is_local_host(host, allowed_hosts, port):
+    """
+    Check whether a request was addressed to this server by a local name
+
+    A website can point its own host name at 127.0.0.1 (DNS rebinding) and
+    then read the overlay page and /recent as a same-origin page. Its
+    requests still carry that host name in the Host header, so only local
+    names are answered.
+
+    Args:
+        host: Value of the Host header, or None if there was none
+        allowed_hosts: Host names the server answers to
+        port: Port the server listens on
+
+    Returns:
+        True if the header names one of the allowed hosts and the server's port, False otherwise
+    """
+    if not host:
+        return False
+    url = urlsplit(f"//{host}")
+    try:
+        return url.hostname in allowed_hosts and (url.port or 80) == port
+    except ValueError:
+        return False
+
+
+async def read_frame(reader):
+    """
+    Read one client frame
+
+    Args:
+        reader: asyncio StreamReader of the connection
+
+    Returns:
+        Tuple of (opcode, unmasked payload bytes)
+
+    Raises:
+        ValueError: If the frame is larger than MAX_CLIENT_FRAME
+        asyncio.IncompleteReadError: If the connection closed mid-frame
+    """
+    first, second = await reader.readexactly(2)
+    length = second & 0x7F
+    if length == 126:
+        length, = struct.unpack("!H", await reader.readexactly(2))
+    elif length == 127:
+        length, = struct.unpack("!Q", await reader.readexactly(8))
+    if length > MAX_CLIENT_FRAME:
+        raise ValueError(f"Client frame of {length} bytes is too large")
+
+    mask = await reader.readexactly(4) if second & 0x80 else None
+    payload = await reader.readexactly(length)
+    if mask:
+        # XOR with the repeated mask as one big integer instead of byte by byte
+        repeated = (mask * (length // 4 + 1))[:length]
+        payload = (int.from_bytes(payload, 'big') ^ int.from_bytes(repeated, 'big')).to_bytes(length, 'big')
+    return first & 0x0F, payload
+
+
+class _Client:
+    def __init__(self, writer, queue_size):
+        """
+        Initialize a subscriber
+
+        Args:
+            writer: asyncio StreamWriter of the connection
+            queue_size: Frames kept while the client is not reading
+        """
+        self.writer = writer
+        self.frames = deque(maxlen=queue_size)
+        self.ready = asyncio.Event()
+        self.closing = False
+        self.dropped = 0
+
+    def push(self, frame):
+        """
+        Queue a frame, dropping the oldest one if the queue is full
+
+        Returns:
+            True if a frame was dropped
+        """
+        dropped = len(self.frames) == self.frames.maxlen
+        if dropped:
+            self.dropped += 1
+        self.frames.append(frame)
+        self.ready.set()
+        return dropped
+
+
+class EventServer:
+    def __init__(self, host="127.0.0.1", port=DEFAULT_PORT, recent_size=RECENT_EVENTS,
+                 client_queue_size=CLIENT_QUEUE_SIZE):
+        """
+        Initialize the server
+
+        The server runs its own asyncio loop on a daemon thread. publish()
+        only hands the batch to that loop, so the queue worker never waits
+        for encoding or for any client; each client has a bounded queue
+        and a slow one loses its oldest events instead of holding up the
+        others.
+
+        Routes:
+            GET /         Overlay page for a browser source (?lines=5&ttl=120&source=PTU)
+            GET /recent   JSON array of the latest events (?limit=N)
+            GET /events   WebSocket stream with one JSON text frame per event
+
+        Args:
+            host: Interface to listen on; keep it on localhost
+            port: TCP port, or 0 to pick a free one
+            recent_size: Events kept for /recent
+            client_queue_size: Frames queued per WebSocket client
+        """
+        self.host = host
+        self.port = port
+        self.recent = deque(maxlen=recent_size)
+        self.client_queue_size = client_queue_size
+
+        self.clients = set()
+        self.published = 0  # Events published since start
+        self.dropped = 0  # Frames dropped for slow clients
+
+        self.loop = None
+        self.thread = None
+        self.server = None
+        self.error = None
+        self._started = threading.Event()
+        self._stopping = None  # asyncio.Event created on the server loop
+        self._tasks = set()
+
+    @property
+    def url(self):
+        """Address of the overlay page"""
+        return f"http://{self.host}:{self.port}/"
+
+    def start(self):
+        """
+        Start listening on the server thread
+
+        Raises:
+            OSError: If the port cannot be opened
+        """
+        self.error = None
+        self._started.clear()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self.thread.start()
+        self._started.wait()
+        if self.error:
+            raise self.error
+        print(f"[Server] Serving overlay events at {self.url}")
+
+    def stop(self, timeout=5):
+        """Disconnect every client and stop the server thread"""
+        if self.loop and self.thread and self.thread.is_alive():
+            self.loop.call_soon_threadsafe(self._stopping.set)
+            self.thread.join(timeout)
+        self.loop = None
+
+    def is_running(self):
+        """Return True while the server thread is serving"""
+        return bool(self.thread and self.thread.is_alive() and self.loop)
+
+    def publish(self, events):
+        """
+        Push events to /recent and every WebSocket client; safe to call from any thread
+
+        Args:
+            events: DeathEvents in log order
+        """
+        loop = self.loop
+        if loop and events:
+            try:
+                loop.call_soon_threadsafe(self._broadcast, list(events))
+            except RuntimeError:
+                # The loop closed between the check and the call
+                pass
+
+    def stats(self):
+        """Return a dictionary with the connected clients, published events and dropped frames"""
+        return {"clients": len(self.clients), "published": self.published, "dropped": self.dropped}
+
+    def _run(self):
+        """Run the server loop; runs on the server thread"""
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(self._serve(loop))
+        except OSError as e:
+            self.error = e
+            print(f"[Server] Could not listen on {self.host}:{self.port}: {e}")
+        finally:
+            self.loop = None
+            loop.close()
+            self._started.set()
+
+    async def _serve(self, loop):
+        """Listen until stop() is called, then close every connection"""
+        self._stopping = asyncio.Event()
+        self.server = await asyncio.start_server(self._handle_connection, self.host, self.port,
+                                                 limit=MAX_REQUEST_HEAD)
+        self.port = self.server.sockets[0].getsockname()[1]
+        self.loop = loop
+        self._started.set()
+
+        await self._stopping.wait()
+
+        self.loop = None
+        self.server.close()
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self.server.wait_closed()
+        self.clients.clear()
+
+    def _broadcast(self, events):
+        """Encode each event once and queue the frame for every client; runs on the server loop"""
+        for event in events:
+            record = ndjson_record(event)
+            self.recent.append(record)
+            frame = encode_frame(JSON_ENCODER.encode(record).encode('utf-8'))
+            for client in self.clients:
+                if client.push(frame):
+                    self.dropped += 1
+        self.published += len(events)
+
+    async def _handle_connection(self, reader, writer):
+        """Answer one HTTP request or upgrade it to a WebSocket"""
+        task = asyncio.current_task()
+        self._tasks.add(task)
+        try:
+            try:
+                head = await reader.readuntil(b"\r\n\r\n")
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                return
+
+            lines = head.decode('latin-1').split("\r\n")
+            parts = lines[0].split(" ")
+            if len(parts) != 3:
+                self._respond(writer, 400, "Bad Request")
+                return
+            method, target, _ = parts
+            headers = {}
+            for line in lines[1:]:
+                name, sep, value = line.partition(":")
+                if sep:
+                    headers[name.strip().lower()] = value.strip()
+
+            url = urlsplit(target)
+            if not is_local_host(headers.get("host"), LOCAL_HOSTS + (self.host,), self.port):
+                self._respond(writer, 421, "Misdirected Request")
+            elif method != "GET":
+                self._respond(writer, 405, "Method Not Allowed")
+            elif url.path == "/events" and headers.get("upgrade", "").lower() == "websocket":
+                await self._serve_websocket(reader, writer, headers)
+            elif url.path == "/recent":
+                self._respond_recent(writer, parse_qs(url.query))
+            elif url.path == "/":
+                self._respond(writer, 200, "OK", OVERLAY_PAGE.encode('utf-8'), "text/html; charset=utf-8")
+            else:
+                self._respond(writer, 404, "Not Found")
+            await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self._tasks.discard(task)
+            writer.close()
+
+    def _respond(self, writer, status, reason, body=None, content_type="text/plain; charset=utf-8"):
+        """Write a complete HTTP response and mark the connection for closing"""
+        if body is None:
+            body = reason.encode('utf-8')
+        writer.write(
+            f"HTTP/1.1 {status} {reason}\r\n"
+            f"Content-Type: {content_type}\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Cache-Control: no-store\r\n"
+            "Connection: close\r\n\r\n".encode('latin-1') + body
+        )
+
+    def _respond_recent(self, writer, query):
+        """Write the latest events as a JSON array"""
+        records = list(self.recent)
+        try:
+            limit = int(query.get("limit", [len(records)])[0])
+        except ValueError:
+            self._respond(writer, 400, "Bad Request")
+            return
+        if limit < len(records):
+            records = records[len(records) - max(limit, 0):]
+        body = JSON_ENCODER.encode(records).encode('utf-8')
+        self._respond(writer, 200, "OK", body, "application/json")
+
+    async def _serve_websocket(self, reader, writer, headers):
+        """Complete the handshake, then stream frames until the client goes away"""
+        key = headers.get("sec-websocket-key")
+        if not key or headers.get("sec-websocket-version") != "13":
+            self._respond(writer, 400, "Bad Request")
+            return
+        if not is_local_origin(headers.get("origin")):
+            self._respond(writer, 403, "Forbidden")
+            return
+
+        writer.write(
+            "HTTP/1.1 101 Switching Protocols\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Accept: {websocket_accept(key)}\r\n\r\n".encode('latin-1')
+        )
+
+        sock = writer.get_extra_info('socket')
+        try:
+            if sock is not None:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_SEND_BUFFER)
+        except OSError:
+            pass
+        writer.transport.set_write_buffer_limits(high=SOCKET_SEND_BUFFER)
+
+        client = _Client(writer, self.client_queue_size)
+        self.clients.add(client)
+        sender = asyncio.ensure_future(self._send_frames(client))
+        try:
+            # Clients only send control frames; anything else is read and ignored
+            while True:
+                opcode, payload = await read_frame(reader)
+                if opcode == OPCODE_CLOSE:
+                    client.push(encode_frame(payload[:2], OPCODE_CLOSE))
+                    break
+                if opcode == OPCODE_PING:
+                    client.push(encode_frame(payload, OPCODE_PONG))
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            self.clients.discard(client)
+            client.closing = True
+            client.ready.set()
+            try:
+                await asyncio.wait_for(sender, CLOSE_TIMEOUT)
+            except (asyncio.TimeoutError, ConnectionError):
+                pass
+
+    async def _send_frames(self, client):
+        """Write a client's queued frames as they arrive; waits on the socket, never on publish()"""
+        writer = client.writer
+        while True:
+            await client.ready.wait()
+            client.ready.clear()
+            if client.frames:
+                frames = list(client.frames)
+                client.frames.clear()
+                writer.write(b"".join(frames))
+                await writer.drain()
+            if client.closing:
+                return
@@ -0,0 +1,276 @@
+"""
+Event Store
+Append-only SQLite store for death events that keeps memory flat during long sessions
+"""
+
+import sqlite3
+import threading
+
+from death_event import DeathEvent
+from log_sources import DEFAULT_CHANNEL
+
+# Bumped whenever _migrate learns a new schema step
+SCHEMA_VERSION = 2
+
+EVENT_COLUMNS = DeathEvent._fields
+_SELECT_COLUMNS = ", ".join(EVENT_COLUMNS)
+
+# source_seq numbers the rows of each source 1, 2, 3... It is worked out when
+# the row is inserted, so a duplicate that is ignored does not leave a gap
+_INSERT_SQL = (
+    f"INSERT OR IGNORE INTO deaths (event_key, {_SELECT_COLUMNS}, source_seq) "
+    f"VALUES ({', '.join('?' * (len(EVENT_COLUMNS) + 1))}, "
+    f"(SELECT COALESCE(MAX(source_seq), 0) + 1 FROM deaths WHERE source = ?))"
+)
+
+# Columns find() can filter on; each one has an index
+FILTER_COLUMNS = ("actor", "killer", "weapon", "source")
+
+
+def event_key(event):
+    """
+    Build the key that identifies the same death seen twice
+
+    The same log line read again (a restarted monitor, a backfill of a log
+    that was already tailed) produces the same key, so it is only stored once.
+    Deaths in other channels than LIVE are told apart by their channel; LIVE
+    keys stay as they were before channels were tracked, so records stored
+    back then are still recognised.
+
+    Args:
+        event: DeathEvent or dictionary of its fields
+
+    Returns:
+        Key string, or None for events without a log timestamp, which cannot be
+        told apart by their fields and need an untimed_key() instead
+    """
+    timestamp = event.get('timestamp')
+    if not timestamp:
+        return None
+    key = f"{timestamp}|{event.get('actor')}|{event.get('killer')}|{event.get('damage')}"
+    source = event.get('source')
+    if source and source != DEFAULT_CHANNEL:
+        key += f"|{source}"
+    return key
+
+
+def untimed_key(identity, offset):
+    """
+    Build the key of a death line without a log timestamp from where it was read
+
+    The live pipeline and the backfill both use it, so an old-format death
+    tailed once and imported again later is still only stored once.
+
+    Args:
+        identity: log_identity() of the log the line was read from
+        offset: File offset of the first byte of the line
+
+    Returns:
+        Key string
+    """
+    return f"untimed|{identity}|{offset}"
+
+
+class EventStore:
+    def __init__(self, db_path):
+        """
+        Open the store, creating the database file and schema if needed
+
+        Rows are only ever appended or cleared all at once, so row ids are
+        contiguous and the record at position N has id N + 1. Paging relies
+        on that instead of OFFSET, which would scan every skipped row. The
+        same holds for source_seq within one source, which pages a single
+        source.
+
+        Args:
+            db_path: Path of the SQLite database file, or ":memory:"
+        """
+        self.db_path = str(db_path)
+        self._lock = threading.Lock()
+
+        # Written by the queue worker and paged by the UI thread, so one
+        # connection is shared behind the lock
+        self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self._migrate()
+
+        self._count = self.connection.execute("SELECT COUNT(*) FROM deaths").fetchone()[0]
+        # The last sequence number of each source is also its row count
+        self._source_counts = dict(self.connection.execute(
+            "SELECT source, MAX(source_seq) FROM deaths GROUP BY source").fetchall())
+        print(f"[Store] Opened {self.db_path} with {self._count} records")
+
+    def _migrate(self):
+        """Create or upgrade the schema to SCHEMA_VERSION"""
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        with self.connection:
+            if version < 1:
+                self.connection.execute("""
+                    CREATE TABLE IF NOT EXISTS deaths (
+                        id INTEGER PRIMARY KEY,
+                        event_key TEXT UNIQUE,
+                        timestamp TEXT,
+                        actor TEXT,
+                        killer TEXT,
+                        weapon TEXT,
+                        damage TEXT,
+                        location TEXT,
+                        weapon_display TEXT,
+                        location_display TEXT,
+                        display_time TEXT,
+                        display_datetime TEXT,
+                        raw_line TEXT
+                    )
+                """)
+                for column in ("timestamp", "actor", "killer", "weapon"):
+                    self.connection.execute(
+                        f"CREATE INDEX IF NOT EXISTS idx_deaths_{column} ON deaths ({column})")
+            if version < 2:
+                # Only one log was monitored before, and that was the LIVE channel
+                self.connection.execute("ALTER TABLE deaths ADD COLUMN source TEXT")
+                self.connection.execute("ALTER TABLE deaths ADD COLUMN source_seq INTEGER")
+                self.connection.execute("UPDATE deaths SET source = ?, source_seq = id", (DEFAULT_CHANNEL,))
+                self.connection.execute(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS idx_deaths_source ON deaths (source, source_seq)")
+            self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def append(self, events, keys=None):
+        """
+        Store a batch of events in a single transaction
+
+        Args:
+            events: DeathEvents in log order
+            keys: Keys to store instead of event_key(), one per event; None entries use event_key()
+
+        Returns:
+            Number of events stored; duplicates of stored events are skipped
+        """
+        if keys is None:
+            keys = [None] * len(events)
+        rows = [(key or event_key(event),) + tuple(event) + (event.source,) for event, key in zip(events, keys)]
+        if not rows:
+            return 0
+        sources = {event.source for event in events}
+
+        with self._lock:
+            before = self.connection.total_changes
+            with self.connection:
+                self.connection.executemany(_INSERT_SQL, rows)
+            added = self.connection.total_changes - before
+            self._count += added
+            if added:
+                for source in sources:
+                    self._source_counts[source] = self.connection.execute(
+                        "SELECT MAX(source_seq) FROM deaths WHERE source = ?", (source,)).fetchone()[0]
+        return added
+
+    def count(self, source=None):
+        """
+        Return the number of stored events
+
+        Args:
+            source: Only count the events of this game channel
+        """
+        if source is None:
+            return self._count
+        return self._source_counts.get(source) or 0
+
+    def page(self, offset, limit, source=None):
+        """
+        Get a slice of the stored events in insertion order
+
+        Args:
+            offset: Position of the first event
+            limit: Maximum number of events to return
+            source: Only page through the events of this game channel
+
+        Returns:
+            List of DeathEvents
+        """
+        with self._lock:
+            if source is None:
+                rows = self.connection.execute(
+                    f"SELECT {_SELECT_COLUMNS} FROM deaths WHERE id > ? ORDER BY id LIMIT ?",
+                    (offset, limit)
+                ).fetchall()
+            else:
+                rows = self.connection.execute(
+                    f"SELECT {_SELECT_COLUMNS} FROM deaths WHERE source = ? AND source_seq > ? "
+                    f"ORDER BY source_seq LIMIT ?",
+                    (source, offset, limit)
+                ).fetchall()
+        return [DeathEvent(*row) for row in rows]
+
+    def iter_events(self, batch_size=1000, source=None):
+        """
+        Iterate over all stored events without loading them at once
+
+        Args:
+            batch_size: Number of rows fetched per query
+            source: Only iterate over the events of this game channel
+
+        Yields:
+            DeathEvents in insertion order
+        """
+        offset = 0
+        while True:
+            events = self.page(offset, batch_size, source)
+            if not events:
+                return
+            yield from events
+            offset += len(events)
+
+    def find(self, actor=None, killer=None, weapon=None, since=None, until=None, limit=100, source=None):
+        """
+        Query events by player, weapon or time range using the column indexes
+
+        Args:
+            actor: Only events where this player died
+            killer: Only events with this killer
+            weapon: Only events with this weapon ID
+            since: Only events with a log timestamp at or after this ISO string
+            until: Only events with a log timestamp before this ISO string
+            limit: Maximum number of events to return
+            source: Only events from this game channel
+
+        Returns:
+            List of DeathEvents, newest first
+        """
+        clauses = []
+        params = []
+        for column, value in zip(FILTER_COLUMNS, (actor, killer, weapon, source)):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("timestamp < ?")
+            params.append(until)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        params.append(limit)
+        with self._lock:
+            rows = self.connection.execute(
+                f"SELECT {_SELECT_COLUMNS} FROM deaths {where} ORDER BY id DESC LIMIT ?",
+                params
+            ).fetchall()
+        return [DeathEvent(*row) for row in rows]
+
+    def clear(self):
+        """Delete every stored event"""
+        with self._lock:
+            with self.connection:
+                self.connection.execute("DELETE FROM deaths")
+            self._count = 0
+            self._source_counts = {}
+
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            try:
+                self.connection.close()
+            except sqlite3.Error as e:
+                print(f"[Store] Error closing database: {e}")
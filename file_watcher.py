@@ -0,0 +1,378 @@
+"""
+File Watcher
+Wakes the log monitor when watched files change instead of polling at a fixed rate
+"""
+
+import os
+import select
+import struct
+import sys
+import time
+
+
+class PollingWatcher:
+    """Adaptive polling fallback that works on every platform"""
+
+    name = "polling"
+
+    def __init__(self, paths, min_interval=0.01, max_interval=0.5, backoff=1.5):
+        """
+        Initialize the polling watcher
+
+        The interval drops to min_interval whenever a change is seen and grows by
+        the backoff factor on every idle check, up to max_interval.
+
+        Args:
+            paths: Files to watch
+            min_interval: Seconds between checks during bursts of writes
+            max_interval: Seconds between checks while the files are idle
+            backoff: Factor the interval grows by on each idle check
+        """
+        self.paths = [str(path) for path in paths]
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.interval = min_interval
+        self._signatures = {path: self._signature(path) for path in self.paths}
+
+    def _signature(self, path):
+        """Return a cheap value that changes whenever the file is written or replaced"""
+        try:
+            st = os.stat(path)
+            return (st.st_size, st.st_mtime_ns, st.st_ino)
+        except OSError:
+            return None
+
+    def wait(self, timeout=None):
+        """
+        Block until a watched file changes or the timeout expires
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if a change was detected, False on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            delay = self.interval
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                delay = min(delay, remaining)
+            time.sleep(delay)
+
+            changed = False
+            for path in self.paths:
+                signature = self._signature(path)
+                if signature != self._signatures[path]:
+                    self._signatures[path] = signature
+                    changed = True
+
+            if changed:
+                self.interval = self.min_interval
+                return True
+            self.interval = min(self.interval * self.backoff, self.max_interval)
+
+    def close(self):
+        """Release watcher resources"""
+        pass
+
+
+class InotifyWatcher:
+    """Linux backend built on inotify through ctypes"""
+
+    name = "inotify"
+
+    IN_MODIFY = 0x00000002
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_NONBLOCK = 0x00000800
+    IN_CLOEXEC = 0x00080000
+
+    EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, paths):
+        """
+        Initialize the inotify watcher
+
+        The parent directories are watched rather than the files themselves, so
+        the watch survives the game replacing the log on rotation.
+
+        Args:
+            paths: Files to watch
+        """
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self._fd = libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        mask = (self.IN_MODIFY | self.IN_ATTRIB | self.IN_CLOSE_WRITE | self.IN_MOVED_FROM |
+                self.IN_MOVED_TO | self.IN_CREATE | self.IN_DELETE)
+
+        # Map each watch descriptor to the file names we care about in that directory
+        self._names = {}
+        try:
+            for path in paths:
+                directory, file_name = os.path.split(os.path.abspath(str(path)))
+                wd = libc.inotify_add_watch(self._fd, os.fsencode(directory), mask)
+                if wd < 0:
+                    raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {directory}")
+                self._names.setdefault(wd, set()).add(os.fsencode(file_name))
+        except Exception:
+            os.close(self._fd)
+            raise
+
+        self._poller = select.poll()
+        self._poller.register(self._fd, select.POLLIN)
+
+    def wait(self, timeout=None):
+        """
+        Block until a watched file changes or the timeout expires
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if a change was detected, False on timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            timeout_ms = None
+            if deadline is not None:
+                timeout_ms = max(0, int((deadline - time.monotonic()) * 1000))
+
+            if not self._poller.poll(timeout_ms):
+                return False
+            if self._drain():
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+
+    def _drain(self):
+        """Read all queued events and report whether any of them touched a watched file"""
+        matched = False
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return matched
+            if not data:
+                return matched
+
+            offset = 0
+            header_size = self.EVENT_HEADER.size
+            while offset + header_size <= len(data):
+                wd, _, _, name_length = self.EVENT_HEADER.unpack_from(data, offset)
+                name = data[offset + header_size:offset + header_size + name_length].rstrip(b"\0")
+                offset += header_size + name_length
+                if name in self._names.get(wd, ()):
+                    matched = True
+
+    def close(self):
+        """Release watcher resources"""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class WindowsWatcher:
+    """Windows backend built on ReadDirectoryChangesW through ctypes"""
+
+    name = "ReadDirectoryChangesW"
+
+    FILE_LIST_DIRECTORY = 0x0001
+    FILE_SHARE_ALL = 0x00000001 | 0x00000002 | 0x00000004
+    OPEN_EXISTING = 3
+    FILE_FLAG_BACKUP_SEMANTICS = 0x02000000
+    FILE_FLAG_OVERLAPPED = 0x40000000
+    FILE_NOTIFY_CHANGE_FILE_NAME = 0x00000001
+    FILE_NOTIFY_CHANGE_SIZE = 0x00000008
+    FILE_NOTIFY_CHANGE_LAST_WRITE = 0x00000010
+    WAIT_TIMEOUT = 0x00000102
+    WAIT_OBJECT_0 = 0x00000000
+    INFINITE = 0xFFFFFFFF
+    BUFFER_SIZE = 64 * 1024
+
+    def __init__(self, paths):
+        """
+        Initialize the ReadDirectoryChangesW watcher
+
+        One overlapped directory read is kept pending per watched directory and
+        all of them are waited on together.
+
+        Args:
+            paths: Files to watch
+        """
+        import ctypes
+        from ctypes import wintypes
+
+        self._ctypes = ctypes
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        self._kernel32 = kernel32
+
+        class OVERLAPPED(ctypes.Structure):
+            _fields_ = [
+                ("Internal", ctypes.c_void_p),
+                ("InternalHigh", ctypes.c_void_p),
+                ("Offset", wintypes.DWORD),
+                ("OffsetHigh", wintypes.DWORD),
+                ("hEvent", wintypes.HANDLE),
+            ]
+
+        kernel32.CreateFileW.restype = wintypes.HANDLE
+        kernel32.CreateFileW.argtypes = [wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, wintypes.LPVOID,
+                                         wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE]
+        kernel32.CreateEventW.restype = wintypes.HANDLE
+        kernel32.CreateEventW.argtypes = [wintypes.LPVOID, wintypes.BOOL, wintypes.BOOL, wintypes.LPCWSTR]
+        kernel32.ReadDirectoryChangesW.restype = wintypes.BOOL
+        kernel32.ReadDirectoryChangesW.argtypes = [wintypes.HANDLE, wintypes.LPVOID, wintypes.DWORD, wintypes.BOOL,
+                                                   wintypes.DWORD, ctypes.POINTER(wintypes.DWORD),
+                                                   ctypes.POINTER(OVERLAPPED), wintypes.LPVOID]
+        kernel32.GetOverlappedResult.restype = wintypes.BOOL
+        kernel32.GetOverlappedResult.argtypes = [wintypes.HANDLE, ctypes.POINTER(OVERLAPPED),
+                                                 ctypes.POINTER(wintypes.DWORD), wintypes.BOOL]
+        kernel32.WaitForMultipleObjects.restype = wintypes.DWORD
+        kernel32.WaitForMultipleObjects.argtypes = [wintypes.DWORD, ctypes.POINTER(wintypes.HANDLE),
+                                                    wintypes.BOOL, wintypes.DWORD]
+        kernel32.ResetEvent.argtypes = [wintypes.HANDLE]
+        kernel32.CancelIoEx.argtypes = [wintypes.HANDLE, ctypes.POINTER(OVERLAPPED)]
+        kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+
+        invalid_handle = wintypes.HANDLE(-1).value
+        names_by_directory = {}
+        for path in paths:
+            directory, file_name = os.path.split(os.path.abspath(str(path)))
+            names_by_directory.setdefault(os.path.normcase(directory), set()).add(file_name.lower())
+
+        # One entry per directory: (directory handle, overlapped, buffer, watched names)
+        self._watches = []
+        try:
+            for directory, names in names_by_directory.items():
+                handle = kernel32.CreateFileW(
+                    directory, self.FILE_LIST_DIRECTORY, self.FILE_SHARE_ALL, None, self.OPEN_EXISTING,
+                    self.FILE_FLAG_BACKUP_SEMANTICS | self.FILE_FLAG_OVERLAPPED, None
+                )
+                if handle == invalid_handle:
+                    raise ctypes.WinError(ctypes.get_last_error())
+
+                overlapped = OVERLAPPED()
+                overlapped.hEvent = kernel32.CreateEventW(None, True, False, None)
+                buffer = ctypes.create_string_buffer(self.BUFFER_SIZE)
+                watch = (handle, overlapped, buffer, names)
+                self._watches.append(watch)
+                self._issue_read(watch)
+        except Exception:
+            self.close()
+            raise
+
+        self._events = (wintypes.HANDLE * len(self._watches))(*[watch[1].hEvent for watch in self._watches])
+
+    def _issue_read(self, watch):
+        """Queue the next overlapped directory read"""
+        handle, overlapped, buffer, _ = watch
+        self._kernel32.ResetEvent(overlapped.hEvent)
+        ok = self._kernel32.ReadDirectoryChangesW(
+            handle, buffer, self.BUFFER_SIZE, False,
+            self.FILE_NOTIFY_CHANGE_FILE_NAME | self.FILE_NOTIFY_CHANGE_SIZE | self.FILE_NOTIFY_CHANGE_LAST_WRITE,
+            None, self._ctypes.byref(overlapped), None
+        )
+        if not ok:
+            raise self._ctypes.WinError(self._ctypes.get_last_error())
+
+    def wait(self, timeout=None):
+        """
+        Block until a watched file changes or the timeout expires
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            True if a change was detected, False on timeout
+        """
+        from ctypes import wintypes
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            timeout_ms = self.INFINITE
+            if deadline is not None:
+                timeout_ms = max(0, int((deadline - time.monotonic()) * 1000))
+
+            result = self._kernel32.WaitForMultipleObjects(len(self._watches), self._events, False, timeout_ms)
+            if result == self.WAIT_TIMEOUT:
+                return False
+
+            index = result - self.WAIT_OBJECT_0
+            if not 0 <= index < len(self._watches):
+                raise self._ctypes.WinError(self._ctypes.get_last_error())
+
+            watch = self._watches[index]
+            handle, overlapped, buffer, names = watch
+            transferred = wintypes.DWORD(0)
+            self._kernel32.GetOverlappedResult(handle, self._ctypes.byref(overlapped),
+                                               self._ctypes.byref(transferred), False)
+            # Zero bytes means the buffer overflowed, so treat it as a change
+            matched = transferred.value == 0 or self._matches(buffer.raw[:transferred.value], names)
+            self._issue_read(watch)
+
+            if matched:
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+
+    def _matches(self, data, names):
+        """Check whether a FILE_NOTIFY_INFORMATION chain mentions one of the watched names"""
+        offset = 0
+        while offset + 12 <= len(data):
+            next_offset, _, name_length = struct.unpack_from("III", data, offset)
+            name = data[offset + 12:offset + 12 + name_length].decode("utf-16-le", errors="ignore")
+            if name.lower() in names:
+                return True
+            if not next_offset:
+                break
+            offset += next_offset
+        return False
+
+    def close(self):
+        """Release watcher resources"""
+        for handle, overlapped, _, _ in self._watches:
+            self._kernel32.CancelIoEx(handle, self._ctypes.byref(overlapped))
+            self._kernel32.CloseHandle(overlapped.hEvent)
+            self._kernel32.CloseHandle(handle)
+        self._watches = []
+
+
+def create_watcher(paths, mode="auto"):
+    """
+    Create the best available watcher for this platform
+
+    Args:
+        paths: Files to watch
+        mode: "auto", "inotify", "windows" or "polling"
+
+    Returns:
+        Watcher instance exposing wait(timeout), close() and name
+    """
+    paths = list(paths)
+
+    if mode in ("auto", "inotify") and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(paths)
+        except Exception as e:
+            print(f"[Watcher] inotify unavailable, falling back to polling: {e}")
+
+    if mode in ("auto", "windows") and sys.platform == "win32":
+        try:
+            return WindowsWatcher(paths)
+        except Exception as e:
+            print(f"[Watcher] ReadDirectoryChangesW unavailable, falling back to polling: {e}")
+
+    return PollingWatcher(paths)
@@ -5,85 +5,82 @@ import time
 import tkinter as tk
 from tkinter import filedialog, messagebox, colorchooser, ttk
 from pathlib import Path
-import pystray
-from PIL import Image, ImageDraw, ImageFont
-import queue
-import re
-from datetime import datetime, timezone, timedelta
 import configparser
-import json
-import ctypes
-from ctypes import wintypes
 from discord_webhook import DiscordWebhook
+from account_detection import parse_account_name
+from monitor_pipeline import MonitorPipeline
+import death_parser
+from death_event import create_death_event
+from location_resolver import LocationResolver
+from log_sources import CHANNELS, DEFAULT_CHANNEL, channel_for_path, find_channel_logs, group_by_source
+from weapon_resolver import WeaponResolver, compact_weapon_ids
+from id_table_cache import get_resource_path, load_id_table
+from ui_dispatcher import UIDispatcher
+from overlay_renderer import OverlayRenderer
+from visible_window import VisibleWindow
+from records_view import RecordsView
+from event_store import EventStore
+from combat_stats import CombatStats, format_stats
+from record_exporter import RecordExporter
+from log_backfill import backfill, find_history_logs
+
+# Milliseconds between refreshes of the statistics in the records window, so the rolling windows move on
+STATS_REFRESH_MS = 10000
 
 # Windows API constants for click-through overlay
 GWL_EXSTYLE = -20
 WS_EX_LAYERED = 0x00080000
 WS_EX_TRANSPARENT = 0x00000020
 
-def get_resource_path(relative_path):
-    """Get absolute path to resource, works for dev and for PyInstaller"""
-    try:
-        # PyInstaller creates a temp folder and stores path in _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-
-    return os.path.join(base_path, relative_path)
-
-# Load weapon IDs globally
-WEAPON_IDS = {}
-try:
-    weapon_ids_path = get_resource_path("weapon_ids.json")
-    if os.path.exists(weapon_ids_path):
-        with open(weapon_ids_path, 'r', encoding='utf-8') as file:
-            WEAPON_IDS = json.load(file)
-        print(f"Loaded {len(WEAPON_IDS)} weapon IDs from weapon_ids.json")
-    else:
-        print("weapon_ids.json not found")
-except Exception as e:
-    print(f"Error loading weapon IDs: {e}")
-
-# Load location IDs globally
-LOCATION_IDS = {}
-try:
-    location_ids_path = get_resource_path("location_ids.json")
-    if os.path.exists(location_ids_path):
-        with open(location_ids_path, 'r', encoding='utf-8') as file:
-            LOCATION_IDS = json.load(file)
-        print(f"Loaded {len(LOCATION_IDS)} location IDs from location_ids.json")
-    else:
-        print("location_ids.json not found")
-except Exception as e:
-    print(f"Error loading location IDs: {e}")
-
 class LogMonitorApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Game Log Monitor")
-        self.root.geometry("750x250")  # Height increased to fit Discord frame and account label
+        self.root.geometry("750x350")  # Height increased to fit the channel, Discord and browser overlay frames and account label
         self.root.resizable(False, False)
+
+        # All widget updates from background threads go through the dispatcher
+        self.ui = UIDispatcher(self.root)
+        self.ui.set_event_handler(self.on_death_events)
         
         # Config file path
         self.config_dir = Path.home() / "AppData" / "Local" / "GameLogMonitor"
         self.config_file = self.config_dir / "settings.ini"
         self.config_dir.mkdir(exist_ok=True)
+        self.records_db = self.config_dir / "death_records.db"
         
         # Variables for application state
         self.monitoring = False
-        self.log_file_path = None
-        self.death_lines = []  # Lines shown in overlay
-        self.death_times = []  # Timestamps for each death line
-        self.all_death_records = []  # Store all death records
-        self.line_queue = queue.Queue()
+        self.log_file_paths = {}  # Game.log of each game channel, e.g. {"LIVE": Path}
+        self.enabled_sources = [DEFAULT_CHANNEL]  # Channels monitored together, in CHANNELS order
+        self.records_source = None  # Channel the records window is filtered to, or None for all
+        self.death_lines = VisibleWindow(self.root, self.update_overlay_text)  # DeathEvents shown in overlay
         self.overlay_window = None
+        self.records_window = None
+        self.stats_refresh_job = None
+        self.export_window = None
+        self.exporter = None
+        self.backfill_thread = None
         self.overlay_locked = True
-        self.monitor_thread = None
-        self.account_name = None  # Detected account name from log
-        
-        # Use the statically loaded weapon IDs and location IDs
-        self.weapon_ids = WEAPON_IDS
-        self.location_ids = LOCATION_IDS
+        self.pipeline = None  # MonitorPipeline of the running session
+        self.account_names = {}  # Detected account name of each game channel
+        self.watcher_mode = None  # Name of the active file watcher backend
+        self.last_event_latency = None  # Seconds from file change to overlay update
+        
+        # Weapon and location IDs are loaded on a background thread after the
+        # first frame; parsing waits for id_tables_loaded before resolving names
+        self.weapon_ids = {}
+        self.location_ids = {}
+        self.weapon_resolver = WeaponResolver(self.weapon_ids)
+        self.location_resolver = LocationResolver(self.location_ids)
+        self.id_tables_loaded = threading.Event()
+        self.tray_icon = None
+
+        # Every death event is kept on disk instead of in memory
+        self.event_store = self.open_event_store()
+
+        # Kill, death and streak counters of this session, one set per game channel and its account
+        self.combat_stats = {channel: CombatStats() for channel in CHANNELS}
 
         # Discord webhook settings (hardcoded URL)
         self.discord_webhook_url = "https://discord.com/api/webhooks/1432103994591023195/deu6EG08NMtmVoU8Yjt-wbbLgnGXSsUUfN7qNvjzCMR1y9rKy2hESa69tKMjdhHdaAt2"
@@ -92,7 +89,15 @@ class LogMonitorApp:
         }
 
         # Initialize Discord webhook with hardcoded URL
-        self.discord_webhook = DiscordWebhook(self.discord_webhook_url)
+        self.discord_webhook = DiscordWebhook(self.discord_webhook_url,
+                                              outbox_path=self.config_dir / "discord_outbox.jsonl")
+
+        # Local event server for browser-source overlays, started on demand
+        self.server_settings = {
+            "enabled": False,
+            "port": 8766
+        }
+        self.event_server = None
 
         # Overlay appearance settings with defaults
         self.overlay_settings = {
@@ -106,8 +111,14 @@ class LogMonitorApp:
             "position_y": 100,
             "max_lines": 5,  # Default number of lines to display
             "time_threshold": 2,  # Default time in minutes to keep death lines
+            "source_filter": "All",  # Game channel shown in the overlay, or All
         }
         
+        # Game folders holding a LIVE, PTU and EPTU folder with a Game.log each
+        self.game_install_dirs = [
+            Path(os.getenv('PROGRAMFILES')) / "Roberts Space Industries" / "StarCitizen"
+        ]
+
         # Default game log paths to check
         self.default_game_log_paths = [
             Path(os.getenv('LOCALAPPDATA')) / "Star Citizen" / "Game.log",
@@ -117,21 +128,51 @@ class LogMonitorApp:
         
         # Load settings
         self.load_settings()
+        self.configure_death_lines()
         
         # Setup UI
         self.setup_main_ui()
         
-        # Setup system tray
-        self.setup_system_tray()
-        
         # Minimize to tray instead of taskbar
         self.root.bind("<Unmap>", lambda e: self.withdraw_to_tray() if self.root.state() == 'iconic' else None)
         
         # Window close event
         self.root.protocol("WM_DELETE_WINDOW", self.on_close)
         
-        # Check for Game.log file
-        self.find_game_log()
+        # The tray icon, ID tables and Game.log lookup wait until the main window is drawn
+        self.root.after_idle(self.finish_startup)
+
+    def finish_startup(self):
+        """Start the work deferred until after the first frame of the main window"""
+        # Setup system tray
+        self.setup_system_tray()
+
+        # Serve browser-source overlays if enabled last time
+        if self.server_settings['enabled']:
+            self.start_event_server()
+
+        # Load the ID tables and check for Game.log file
+        threading.Thread(target=self.load_startup_data, daemon=True).start()
+
+    def load_startup_data(self):
+        """Load the ID tables and look for Game.log; runs on a background thread"""
+        try:
+            weapon_ids = load_id_table("weapon_ids.json", self.config_dir, compact_weapon_ids)
+            location_ids = load_id_table("location_ids.json", self.config_dir)
+            self.weapon_resolver = WeaponResolver(weapon_ids)
+            self.location_resolver = LocationResolver(location_ids)
+            self.weapon_ids = weapon_ids
+            self.location_ids = location_ids
+        except Exception as e:
+            print(f"Error building ID lookups: {e}")
+        finally:
+            # Never leave parsing waiting, even if the tables could not be used
+            self.id_tables_loaded.set()
+        self.ui.post('id_tables', self.show_id_table_counts)
+
+        searched_from = dict(self.log_file_paths)
+        found_paths = self.probe_game_log()
+        self.ui.post('game_log', self.find_game_log, searched_from, found_paths)
 
     def load_settings(self):
         """Load settings from config file"""
@@ -140,15 +181,31 @@ class LogMonitorApp:
                 config = configparser.ConfigParser()
                 config.read(self.config_file)
                 
-                # Load log file path
-                if 'General' in config and 'log_file_path' in config['General']:
-                    path = config['General']['log_file_path']
+                # Load the log path and account name of a single log, saved before channels were tracked
+                if 'General' in config:
+                    path = config['General'].get('log_file_path')
+                    channel = channel_for_path(path) if path else DEFAULT_CHANNEL
                     if path and Path(path).exists():
-                        self.log_file_path = Path(path)
-
-                # Load account name
-                if 'General' in config and 'account_name' in config['General']:
-                    self.account_name = config['General']['account_name']
+                        self.log_file_paths[channel] = Path(path)
+                        self.enabled_sources = [channel]
+                    if config['General'].get('account_name'):
+                        self.account_names[channel] = config['General']['account_name']
+
+                # Load the log path of each channel and the channels to monitor
+                if 'Sources' in config:
+                    for channel in CHANNELS:
+                        path = config['Sources'].get(channel.lower())
+                        if path and Path(path).exists():
+                            self.log_file_paths[channel] = Path(path)
+                    if 'enabled' in config['Sources']:
+                        enabled = config['Sources']['enabled'].split(",")
+                        self.enabled_sources = [channel for channel in CHANNELS if channel in enabled]
+
+                # Load the account name of each channel
+                if 'Accounts' in config:
+                    for channel in CHANNELS:
+                        if config['Accounts'].get(channel.lower()):
+                            self.account_names[channel] = config['Accounts'][channel.lower()]
                 
                 # Load overlay settings
                 if 'Overlay' in config:
@@ -167,6 +224,13 @@ class LogMonitorApp:
                     if 'enabled' in config['Discord']:
                         self.discord_settings['enabled'] = config['Discord'].getboolean('enabled')
 
+                # Load event server settings
+                if 'Server' in config:
+                    if 'enabled' in config['Server']:
+                        self.server_settings['enabled'] = config['Server'].getboolean('enabled')
+                    if 'port' in config['Server']:
+                        self.server_settings['port'] = config['Server'].getint('port')
+
             except Exception as e:
                 print(f"Error loading settings: {e}")
 
@@ -175,11 +239,12 @@ class LogMonitorApp:
         try:
             config = configparser.ConfigParser()
             
-            # General settings
-            config['General'] = {
-                'log_file_path': str(self.log_file_path) if self.log_file_path else '',
-                'account_name': self.account_name if self.account_name else ''
-            }
+            # Log path of each channel and the channels to monitor
+            config['Sources'] = {channel.lower(): str(path) for channel, path in self.log_file_paths.items()}
+            config['Sources']['enabled'] = ",".join(self.enabled_sources)
+
+            # Account name of each channel
+            config['Accounts'] = {channel.lower(): name for channel, name in self.account_names.items()}
             
             # Overlay settings
             config['Overlay'] = {k: str(v) for k, v in self.overlay_settings.items()}
@@ -187,6 +252,9 @@ class LogMonitorApp:
             # Discord settings
             config['Discord'] = {k: str(v) for k, v in self.discord_settings.items()}
 
+            # Event server settings
+            config['Server'] = {k: str(v) for k, v in self.server_settings.items()}
+
             # Save to file
             with open(self.config_file, 'w') as f:
                 config.write(f)
@@ -239,6 +307,24 @@ class LogMonitorApp:
         self.records_button = ttk.Button(buttons_frame, text="Show Records", width=15, command=self.show_records_window)
         self.records_button.pack(side=tk.LEFT, padx=5)
 
+        # Game channels frame
+        sources_frame = ttk.LabelFrame(main_frame, text="Game Channels", padding="5")
+        sources_frame.pack(fill=tk.X, pady=5)
+
+        # One checkbox per channel; a channel can be ticked once its Game.log is known
+        self.source_vars = {}
+        self.source_checks = {}
+        for channel in CHANNELS:
+            self.source_vars[channel] = tk.BooleanVar(value=channel in self.enabled_sources)
+            self.source_checks[channel] = ttk.Checkbutton(
+                sources_frame,
+                text=channel,
+                variable=self.source_vars[channel],
+                command=self.toggle_sources
+            )
+            self.source_checks[channel].pack(side=tk.LEFT, padx=5)
+        self.update_source_checks()
+
         # Discord webhook frame
         discord_frame = ttk.LabelFrame(main_frame, text="Discord Integration", padding="5")
         discord_frame.pack(fill=tk.X, pady=5)
@@ -253,7 +339,22 @@ class LogMonitorApp:
         )
         self.discord_check.pack(side=tk.LEFT, padx=5)
 
-        # Display loaded weapon and location count
+        # Browser overlay frame
+        server_frame = ttk.LabelFrame(main_frame, text="Browser Overlay", padding="5")
+        server_frame.pack(fill=tk.X, pady=5)
+
+        # Enable event server checkbox
+        self.server_enabled_var = tk.BooleanVar(value=self.server_settings['enabled'])
+        self.server_check = ttk.Checkbutton(
+            server_frame,
+            text=f"Serve events to OBS browser sources at http://127.0.0.1:{self.server_settings['port']}/",
+            variable=self.server_enabled_var,
+            command=self.toggle_event_server
+        )
+        self.server_check.pack(side=tk.LEFT, padx=5)
+
+    def show_id_table_counts(self):
+        """Display loaded weapon and location count"""
         weapon_count = len(self.weapon_ids)
         location_count = len(self.location_ids)
         
@@ -273,7 +374,7 @@ class LogMonitorApp:
         """Show the settings dialog"""
         settings_window = tk.Toplevel(self.root)
         settings_window.title("Overlay Settings")
-        settings_window.geometry("400x580")  # Increased height for additional settings
+        settings_window.geometry("400x620")  # Increased height for additional settings
         settings_window.resizable(False, False)
         settings_window.transient(self.root)
         settings_window.grab_set()
@@ -385,6 +486,13 @@ class LogMonitorApp:
         time_threshold_var = tk.IntVar(value=self.overlay_settings["time_threshold"])
         time_threshold_spinner = ttk.Spinbox(settings_frame, from_=1, to=60, textvariable=time_threshold_var, width=5)
         time_threshold_spinner.grid(row=9, column=1, sticky=tk.W, pady=5)
+
+        # Game channel shown in the overlay
+        ttk.Label(settings_frame, text="Show Channel:").grid(row=10, column=0, sticky=tk.W, pady=5)
+        source_filter_var = tk.StringVar(value=self.overlay_settings["source_filter"])
+        source_filter_combo = ttk.Combobox(settings_frame, textvariable=source_filter_var,
+                                           values=("All",) + CHANNELS, state="readonly", width=8)
+        source_filter_combo.grid(row=10, column=1, sticky=tk.W, pady=5)
                 
         # Buttons
         buttons_frame = ttk.Frame(settings_window)
@@ -407,6 +515,11 @@ class LogMonitorApp:
             self.overlay_settings["height"] = height_var.get()
             self.overlay_settings["max_lines"] = max_lines_var.get()
             self.overlay_settings["time_threshold"] = time_threshold_var.get()
+            self.overlay_settings["source_filter"] = source_filter_var.get()
+            
+            # Apply the new line limit and time threshold to the lines already shown
+            if self.configure_death_lines():
+                self.update_overlay_text()
             
             # Apply settings to overlay if it exists
             if self.overlay_window:
@@ -545,24 +658,32 @@ class LogMonitorApp:
             self.root.update()
 
     def setup_system_tray(self):
+        """Create and run the tray icon on its own thread, importing pystray and PIL there"""
+        threading.Thread(target=self.run_system_tray, daemon=True).start()
+
+    def run_system_tray(self):
+        """Build the tray icon and run its event loop; runs on the tray thread"""
+        import pystray
+
         # Create icon image
         icon_image = self.create_icon_image()
         
-        # Create system tray menu
+        # Create system tray menu; every action touches Tk, so it is handed to the UI thread
         menu = pystray.Menu(
             pystray.MenuItem('Show', self.show_app, default=True),
-            pystray.MenuItem('Toggle Monitoring', self.toggle_monitoring),
-            pystray.MenuItem('Toggle Overlay Lock', self.toggle_overlay_lock, checked=lambda _: self.overlay_locked),
-            pystray.MenuItem('Exit', self.exit_app)
+            pystray.MenuItem('Toggle Monitoring', lambda: self.root.after(0, self.toggle_monitoring)),
+            pystray.MenuItem('Toggle Overlay Lock', lambda: self.root.after(0, self.toggle_overlay_lock),
+                             checked=lambda _: self.overlay_locked),
+            pystray.MenuItem('Exit', lambda: self.root.after(0, self.exit_app))
         )
         
         # Create tray icon
         self.tray_icon = pystray.Icon("GameLogMonitor", icon_image, "Game Log Monitor", menu)
-        
-        # Start tray icon in a separate thread
-        threading.Thread(target=self.tray_icon.run, daemon=True).start()
+        self.tray_icon.run()
 
     def create_icon_image(self):
+        from PIL import Image, ImageDraw, ImageFont
+
         # Try to load existing icon file
         icon_path = get_resource_path("app_icon.png")
         if os.path.exists(icon_path):
@@ -588,22 +709,49 @@ class LogMonitorApp:
         
         return image
         
-    def find_game_log(self):
-        # If we already have a path from settings and it exists, use it
-        if self.log_file_path and self.log_file_path.exists():
-            self.status_label.config(text=f"Found Game.log: {self.log_file_path}")
-            self.toggle_button.config(state=tk.NORMAL)
-            return
-            
-        # Check common locations for Game.log
-        for path in self.default_game_log_paths:
+    def probe_game_log(self):
+        """
+        Look for the Game.log of each channel without touching any widget; runs on the startup thread
+
+        Returns:
+            Dictionary of channel name to its saved path if that still exists, else the first default path that exists
+        """
+        # Check common locations for the Game.log of each channel
+        found = find_channel_logs(self.game_install_dirs, self.default_game_log_paths)
+
+        # Paths from settings that still exist take precedence
+        for channel, path in self.log_file_paths.items():
             if path.exists():
-                self.log_file_path = path
-                self.status_label.config(text=f"Found Game.log: {path}")
-                self.toggle_button.config(state=tk.NORMAL)
-                # Save the found path
+                found[channel] = path
+        return {channel: found[channel] for channel in CHANNELS if channel in found}
+
+    def find_game_log(self, searched_from, found_paths):
+        """
+        Show the result of probe_game_log
+
+        Args:
+            searched_from: Log paths when the probe started
+            found_paths: Dictionary of channel name to the path the probe found
+        """
+        # The user picked a file or started monitoring while the probe ran
+        if self.log_file_paths != searched_from or self.monitoring:
+            return
+
+        if found_paths:
+            self.log_file_paths = found_paths
+
+            # Monitor the channels found if none of the enabled ones has a log
+            if not self.monitored_sources():
+                self.enabled_sources = list(found_paths)
+            self.update_source_checks()
+
+            found_text = ", ".join(f"{channel} ({path})" for channel, path in found_paths.items())
+            self.status_label.config(text=f"Found Game.log: {found_text}")
+            self.toggle_button.config(state=tk.NORMAL)
+            if found_paths != searched_from:
+                # Save the found paths
                 self.save_settings()
-                return
+            return
                 
         # If not found, prompt the user
         self.status_label.config(text="Game.log not found. Please select file location.")
@@ -616,12 +764,55 @@ class LogMonitorApp:
         )
         
         if file_path:
-            self.log_file_path = Path(file_path)
-            self.status_label.config(text=f"Selected: {self.log_file_path}")
+            # The file replaces the log of the channel folder it is in
+            channel = channel_for_path(file_path)
+            self.log_file_paths[channel] = Path(file_path)
+            if channel not in self.enabled_sources:
+                self.enabled_sources = [name for name in CHANNELS if name in self.enabled_sources or name == channel]
+            self.update_source_checks()
+            self.status_label.config(text=f"Selected {channel}: {self.log_file_paths[channel]}")
             self.toggle_button.config(state=tk.NORMAL)
             # Save the selected path
             self.save_settings()
 
+            if self.monitoring:
+                self.start_pipeline()
+
+    def monitored_sources(self):
+        """
+        Get the logs to follow
+
+        Returns:
+            Dictionary of channel name to Game.log path for each enabled channel whose log exists
+        """
+        return {channel: self.log_file_paths[channel] for channel in self.enabled_sources
+                if channel in self.log_file_paths and self.log_file_paths[channel].exists()}
+
+    def describe_sources(self):
+        """Describe the monitored logs: the path of a single log, or the channel names of several"""
+        sources = self.monitored_sources()
+        if len(sources) == 1:
+            return str(next(iter(sources.values())))
+        return ", ".join(sources) or "none"
+
+    def update_source_checks(self):
+        """Enable the checkbox of each channel whose Game.log is known and tick the monitored ones"""
+        for channel, check in self.source_checks.items():
+            self.source_vars[channel].set(channel in self.enabled_sources)
+            check.config(state=tk.NORMAL if channel in self.log_file_paths else tk.DISABLED)
+
+    def toggle_sources(self):
+        """Monitor the ticked channels; a running session switches over at once"""
+        self.enabled_sources = [channel for channel in CHANNELS if self.source_vars[channel].get()]
+        self.save_settings()
+        self.update_account_display()
+
+        if self.monitoring:
+            if self.monitored_sources():
+                self.start_pipeline()
+            else:
+                self.stop_monitoring()
+
     def toggle_monitoring(self):
         if self.monitoring:
             self.stop_monitoring()
@@ -629,13 +820,13 @@ class LogMonitorApp:
             self.start_monitoring()
 
     def start_monitoring(self):
-        if not self.log_file_path or not self.log_file_path.exists():
+        if not self.monitored_sources():
             messagebox.showerror("Error", "Game.log file not found. Please select a valid file.")
             return
             
         self.monitoring = True
         self.toggle_button.config(text="Stop Monitoring")
-        self.status_label.config(text=f"Monitoring: {self.log_file_path}")
+        self.update_monitor_status()
 
         # Start Discord webhook if enabled
         print(f"[Debug] Starting monitoring - Discord settings enabled: {self.discord_settings['enabled']}, webhook enabled: {self.discord_webhook.enabled}")
@@ -661,21 +852,38 @@ class LogMonitorApp:
             # Schedule visibility check
             self.root.after(500, self.check_overlay_visibility)
             
-        # Start monitoring thread if not already running
-        if not self.monitor_thread or not self.monitor_thread.is_alive():
-            self.monitor_thread = threading.Thread(target=self.monitor_log_file, daemon=True)
-            self.monitor_thread.start()
-            
-        # Start processing queue in a separate thread
-        threading.Thread(target=self.process_queue, daemon=True).start()
-        
-        # Schedule regular cleanup of old death lines
-        self.schedule_death_lines_cleanup()
+        self.start_pipeline()
+
+    def start_pipeline(self):
+        """Start following the monitored logs, replacing the pipeline of a running session"""
+        # A running session being replaced drains its own queue; the new one waits for it on
+        # its monitor thread and continues every log they share where the old one stopped
+        # reading. A session stopped earlier is not continued, its logs start at their end
+        previous = None
+        if self.pipeline and self.pipeline.running:
+            previous = self.pipeline
+            previous.stop()
+
+        # Tail and parse every log on one pair of worker threads
+        self.pipeline = MonitorPipeline(
+            self.monitored_sources(),
+            self.create_death_event,
+            self.handle_death_events,
+            account_names=dict(self.account_names),
+            on_account=self.on_account_detected,
+            on_error=self.set_status,
+            on_watching=self.on_watching,
+            previous=previous
+        )
+        self.pipeline.start()
+        self.update_monitor_status()
 
     def stop_monitoring(self):
         self.monitoring = False
+        if self.pipeline:
+            self.pipeline.stop()
         self.toggle_button.config(text="Start Monitoring")
-        self.status_label.config(text=f"Monitoring stopped. Log file: {self.log_file_path}")
+        self.status_label.config(text=f"Monitoring stopped. Log file: {self.describe_sources()}")
 
         # Stop Discord webhook
         self.discord_webhook.stop()
@@ -787,9 +995,8 @@ class LogMonitorApp:
         self.overlay_window.bind("<B1-Motion>", self.do_drag)
         
         # Show initial message
-        self.death_text.config(state=tk.NORMAL)
-        self.death_text.insert(tk.END, "Waiting for death events...\n", "death_line")
-        self.death_text.config(state=tk.DISABLED)
+        self.overlay_renderer = OverlayRenderer(self.death_text)
+        self.overlay_renderer.render(self.death_lines)
 
         # Set click-through if overlay starts locked
         if self.overlay_locked:
@@ -830,6 +1037,8 @@ class LogMonitorApp:
             return
 
         try:
+            import ctypes
+
             # Get window handle
             hwnd = ctypes.windll.user32.GetParent(self.overlay_window.winfo_id())
 
@@ -873,287 +1082,109 @@ class LogMonitorApp:
             # Enable click-through when locked, disable when unlocked
             self.set_clickthrough(self.overlay_locked)
 
-    def monitor_log_file(self):
-        # Initial file position
-        file_position = 0
+    def on_account_detected(self, source, name):
+        """Remember the account the pipeline detected in a channel's log; runs on the monitor thread"""
+        # Replace the dictionary instead of changing it, so the UI thread never iterates one being modified
+        self.account_names = {**self.account_names, source: name}
+        self.ui.post('account', self.update_account_display)
+        self.ui.post('save_settings', self.save_settings)
 
-        # Try to detect account name from existing log file
-        if not self.account_name and self.log_file_path.exists():
-            try:
-                print("[Info] Scanning entire log file for account name...")
-                with open(self.log_file_path, 'r', encoding='utf-8', errors='ignore') as file:
-                    # Read the entire file
-                    line_count = 0
-                    for line in file:
-                        line_count += 1
-
-                        # Check for account name
-                        detected_name = self.parse_account_name(line)
-                        if detected_name:
-                            self.account_name = detected_name
-                            print(f"[Info] Found account name from log (line {line_count}): {self.account_name}")
-                            self.root.after(0, self.update_account_display)
-                            self.root.after(0, self.save_settings)
-                            break
-
-                    if not self.account_name:
-                        print(f"[Info] Scanned {line_count} lines, account name not found")
-            except Exception as e:
-                print(f"[Warning] Could not scan log for account name: {e}")
+    def on_watching(self, mode):
+        """Show the file watcher the pipeline uses; runs on the monitor thread"""
+        self.watcher_mode = mode
+        self.ui.post('status', self.update_monitor_status)
 
-        if self.log_file_path.exists():
-            file_position = self.log_file_path.stat().st_size
+    def handle_death_events(self, events, detected_at, keys=None):
+        """
+        Forward, store and publish a batch of parsed death events; runs on the pipeline's queue thread
 
-        # Monitor loop
-        while self.monitoring:
-            try:
-                if not self.log_file_path.exists():
-                    self.status_label.config(text=f"Warning: Log file not found. Waiting for file to appear.")
-                    time.sleep(1)
-                    continue
-                    
-                # Check if file size has increased
-                current_size = self.log_file_path.stat().st_size
-                
-                # Handle file truncation (e.g. if the file has been reset)
-                if current_size < file_position:
-                    file_position = 0
-                
-                if current_size > file_position:
-                    try:
-                        with open(self.log_file_path, 'r', encoding='utf-8', errors='ignore') as file:
-                            file.seek(file_position)
-                            new_lines = file.readlines()
-
-                            # Process each line
-                            for line in new_lines:
-                                # Check for account name
-                                if not self.account_name:
-                                    detected_name = self.parse_account_name(line)
-                                    if detected_name:
-                                        self.account_name = detected_name
-                                        print(f"[Info] Detected account name: {self.account_name}")
-                                        # Update UI in main thread
-                                        self.root.after(0, self.update_account_display)
-                                        self.root.after(0, self.save_settings)
-
-                                # Filter lines containing Actor Death
-                                # Both old and new formats are supported:
-                                # Old: <Actor Death> at start of line
-                                # New: Contains [Notice] <Actor Death> in the line
-                                if line.strip().startswith("<Actor Death>") or "<Actor Death>" in line:
-                                    # Add to queue for processing
-                                    self.line_queue.put(line.strip())
-                                    
-                        # Update file position
-                        file_position = current_size
-                    except PermissionError:
-                        self.status_label.config(text=f"Permission denied while reading log file. Retrying...")
-                        time.sleep(1)
-                    except Exception as e:
-                        self.status_label.config(text=f"Error reading log file: {e}")
-                        time.sleep(1)
-                    
-                time.sleep(0.5)
-                
-            except Exception as e:
-                self.status_label.config(text=f"Error monitoring log file: {e}")
-                time.sleep(1)
+        Args:
+            events: DeathEvents in log order
+            detected_at: perf_counter time the oldest of them was read from the log
+            keys: Store key of each event without a log timestamp, else None
+        """
+        # Each channel has its own account
+        groups = group_by_source(events)
+
+        # Store the whole batch in one transaction
+        try:
+            self.event_store.append(events, keys)
+        except Exception as e:
+            print(f"[Store] Error storing events: {e}")
+
+        for source, source_events in groups:
+            self.combat_stats[source].add_events(source_events, self.account_names.get(source))
 
-    def process_queue(self):
-        while self.monitoring:
+        # Only hands the batch to the server thread; slow browser clients never hold up this thread
+        event_server = self.event_server
+        if event_server:
+            event_server.publish(events)
+
+        self.ui.publish_events(events, detected_at)
+
+        # Send to Discord if enabled - ONLY if I killed someone
+        # Last, so nothing Discord does can keep the batch from the overlay and the store
+        if self.discord_settings['enabled'] and self.discord_webhook.enabled:
             try:
-                # Process any new items in the queue
-                if not self.line_queue.empty():
-                    line = self.line_queue.get(block=False)
-                    
-                    # Parse the line to extract details
-                    parsed_data = self.parse_death_line(line)
-
-                    # Add parsed data to all_death_records
-                    if parsed_data:
-                        self.all_death_records.append(parsed_data)
-
-                        # Send to Discord if enabled - ONLY if I killed someone
-                        if self.discord_settings['enabled'] and self.discord_webhook.enabled:
-                            killer = parsed_data.get('killer', '')
-                            victim = parsed_data.get('actor', '')
-
-                            # Only post if I (account_name) am the killer
-                            if self.account_name and killer == self.account_name:
-                                # Add display names
-                                parsed_data['weapon_display'] = self.get_weapon_name(parsed_data.get('weapon'))
-                                parsed_data['location_display'] = self.get_location_name(parsed_data.get('location'))
-                                print(f"[Discord] Posting kill: {self.account_name} killed {victim}")
-                                self.discord_webhook.send_death_record(parsed_data)
-                            else:
-                                print(f"[Debug] Skipping Discord - Killer: {killer}, Victim: {victim}, My account: {self.account_name}")
-                    else:
-                        # If parsing failed, add the raw line
-                        self.all_death_records.append(line)
-                    
-                    # Current timestamp
-                    current_time = datetime.now()
-                    
-                    # Add to death lines list with timestamp
-                    self.death_lines.append(line)
-                    self.death_times.append(current_time)
-                    
-                    # Keep only the specified number of lines for overlay
-                    if len(self.death_lines) > self.overlay_settings["max_lines"]:
-                        self.death_lines.pop(0)
-                        self.death_times.pop(0)
-                        
-                    # Update overlay text
-                    self.update_overlay_text()
-                    
-                    # Update the records list if window is open
-                    if hasattr(self, 'records_window') and self.records_window and self.records_window.winfo_exists():
-                        self.root.after(10, self.update_records_list)
-                
-                # Clean up old death lines (older than the time threshold)
-                self.cleanup_old_death_lines()
-                
-                time.sleep(0.1)
-                
-            except queue.Empty:
-                time.sleep(0.1)
+                for source, source_events in groups:
+                    self.discord_webhook.send_kills(source_events, self.account_names.get(source))
             except Exception as e:
-                print(f"Error processing queue: {e}")
-                time.sleep(0.1)
-                
-    def cleanup_old_death_lines(self):
-        """Remove death lines older than the time threshold from the overlay"""
-        if not self.death_lines:
-            return
-            
-        current_time = datetime.now()
-        # Use the configurable time threshold
-        threshold_minutes = self.overlay_settings.get("time_threshold", 2)
-        cutoff_time = current_time - timedelta(minutes=threshold_minutes)
-        
-        # Check if we have any lines to remove
-        removed = False
-        while self.death_times and self.death_times[0] < cutoff_time:
-            # Remove the oldest line
-            self.death_lines.pop(0)
-            self.death_times.pop(0)
-            removed = True
-            
-        # Update overlay if we removed any lines
-        if removed:
-            self.update_overlay_text()
-
-    def parse_death_line(self, line):
-        """Parse a death line to extract useful information"""
-        # Example of the new format:
-        # <2025-04-25T18:02:17.301Z> [Notice] <Actor Death> CActor::Kill: 'Voisys' [201996731201] in zone 'AEGS_Gladius_2984839923201' 
-        # killed by 'Lsync' [201964490332] using 'KLWE_LaserRepeater_S3_2984839923407' [Class unknown] with damage type 'VehicleDestruction' 
-        # from direction x: 0.000000, y: 0.000000, z: 0.000000 [Team_ActorTech][Actor]
-        
-        # Extract timestamp if present
-        timestamp_match = re.search(r"<(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d+Z)>", line)
-        timestamp = timestamp_match.group(1) if timestamp_match else None
-        
-        # Extract actor (who died)
-        actor_match = re.search(r"'([^']+)'\s+\[\d+\]", line)
-        actor = actor_match.group(1) if actor_match else "Unknown"
-        
-        # Extract killed by
-        killed_by_match = re.search(r"killed by '([^']+)'", line)
-        killer = killed_by_match.group(1) if killed_by_match else "Unknown"
-        
-        # Extract weapon used (if available)
-        weapon_match = re.search(r"using '([^']+)'", line)
-        weapon = weapon_match.group(1) if weapon_match else None
-        
-        # Extract damage type
-        damage_match = re.search(r"damage type '([^']+)'", line)
-        damage = damage_match.group(1) if damage_match else "Unknown"
-        
-        # Extract location/zone
-        location_match = re.search(r"in zone '([^']+)'", line)
-        location = location_match.group(1) if location_match else "Unknown"
-        
-        return {
-            "timestamp": timestamp,
-            "actor": actor, 
-            "killer": killer,
-            "weapon": weapon,
-            "damage": damage, 
-            "location": location
-        }
+                print(f"[Discord] Error queuing kills: {e}")
+
+    def on_death_events(self, events, detected_at):
+        """
+        Show new death events in the overlay and records window; runs on the UI thread
+
+        Args:
+            events: DeathEvents published since the last frame
+            detected_at: perf_counter time the oldest of them was detected
+        """
+        # Show the new lines of the channel picked for the overlay; the window drops
+        # the oldest beyond max_lines and expires each line time_threshold minutes after it arrived
+        source_filter = self.overlay_settings["source_filter"]
+        if source_filter in CHANNELS:
+            self.death_lines.extend(event for event in events if event.source == source_filter)
+        else:
+            self.death_lines.extend(events)
+
+        # Update overlay text
+        self.update_overlay_text()
+
+        # Measure how long the oldest event took to reach the overlay
+        if detected_at is not None:
+            self.last_event_latency = time.perf_counter() - detected_at
+            self.update_monitor_status()
+
+        # Append the new rows if the records window is open
+        self.update_records_list()
+
+    def configure_death_lines(self):
+        """
+        Apply the overlay line limit and time threshold to the visible death lines
+
+        Returns:
+            True if lines were removed
+        """
+        return self.death_lines.configure(
+            max_lines=self.overlay_settings["max_lines"],
+            ttl_seconds=self.overlay_settings["time_threshold"] * 60
+        )
+
+    def create_death_event(self, line, source=DEFAULT_CHANNEL, parsed=None):
+        """Parse a death line of a game channel into a DeathEvent with resolved display names"""
+        # Names resolve against the ID tables, which load in the background at startup
+        self.id_tables_loaded.wait()
+
+        if parsed is None:
+            parsed = death_parser.parse_death_line(line)
+        return create_death_event(line, parsed, self.get_weapon_name, self.get_location_name, source)
 
     def update_overlay_text(self):
         if not self.overlay_window:
             return
-            
-        # Update text widget with latest death lines
-        self.death_text.config(state=tk.NORMAL)
-        self.death_text.delete(1.0, tk.END)
-        
-        if not self.death_lines:
-            # Show waiting message if no death lines are present
-            self.death_text.insert(tk.END, "Waiting for death events...\n", "death_line")
-        else:
-            for line in self.death_lines:
-                try:
-                    # Try to parse the death line
-                    data = self.parse_death_line(line)
-                    
-                    # Format timestamp for display
-                    if data['timestamp']:
-                        # Parse the ISO timestamp (which is in UTC)
-                        utc_time = datetime.strptime(data['timestamp'], "%Y-%m-%dT%H:%M:%S.%fZ")
-                        # Set the timezone to UTC
-                        utc_time = utc_time.replace(tzinfo=timezone.utc)
-                        # Convert to local timezone
-                        system_tz = datetime.now().astimezone().tzinfo
-                        local_time = utc_time.astimezone(system_tz)
-                        # Format for display
-                        display_time = local_time.strftime("%H:%M:%S")
-                    else:
-                        display_time = datetime.now().strftime("%H:%M:%S")
-                                        
-                    # Format the location info
-                    location_name = self.get_location_name(data['location'])
-                    
-                    # Create a nicely formatted line with all available information
-                    # Format: [TIME] PLAYER ☠ by KILLER (WEAPON) - DAMAGE_TYPE @ LOCATION
-                    killer_text = f"{data['killer']}"
-                    damage_text = f"{data['damage']}"
-                    
-                    # First insert timestamp in a neutral color
-                    self.death_text.insert(tk.END, f"[{display_time}] ", "time_tag")
-                    
-                    # Insert player name
-                    self.death_text.insert(tk.END, f"{data['actor']} ", "player_tag")
-                    
-                    # Insert killed by symbol
-                    self.death_text.insert(tk.END, "☠ by ", "symbol_tag")
-                    
-                    # Insert killer name
-                    self.death_text.insert(tk.END, f"{killer_text}", "killer_tag")
-                    
-                    # Insert weapon if available
-                    if data['weapon']:
-                        self.death_text.insert(tk.END, f" ({self.get_weapon_name(data['weapon'])})", "weapon_tag")
-                    
-                    # Insert damage type
-                    self.death_text.insert(tk.END, f" - {damage_text}", "damage_tag")
-                    
-                    # Insert location if available and has a friendly name
-                    if location_name and location_name != data['location']:
-                        self.death_text.insert(tk.END, f" @ {location_name}", "location_tag")
-                    
-                    self.death_text.insert(tk.END, "\n")
-                    
-                except Exception as e:
-                    # If parsing fails, just show the raw line with current timestamp
-                    timestamp = datetime.now().strftime("%H:%M:%S")
-                    self.death_text.insert(tk.END, f"[{timestamp}] {line}\n", "death_line")
-            
-        self.death_text.config(state=tk.DISABLED)
+
+        # Append new death lines and drop expired ones without redrawing the rest
+        self.overlay_renderer.render(self.death_lines)
 
     def show_app(self):
         self.root.after(0, self.root.deiconify)
@@ -1170,9 +1201,17 @@ class LogMonitorApp:
     def exit_app(self):
         # Stop monitoring before exit
         self.monitoring = False
+        if self.pipeline:
+            self.pipeline.stop()
 
-        # Stop Discord webhook
-        self.discord_webhook.stop()
+        # Stop Discord webhook; unsent kills stay in its outbox for the next run
+        self.discord_webhook.close()
+
+        # Disconnect browser overlays
+        self.stop_event_server()
+
+        # Close the records database
+        self.event_store.close()
 
         # Save settings
         if self.overlay_window and self.overlay_window.winfo_exists():
@@ -1182,7 +1221,8 @@ class LogMonitorApp:
         self.save_settings()
 
         # Stop tray icon
-        self.tray_icon.stop()
+        if self.tray_icon:
+            self.tray_icon.stop()
         
         # Destroy windows
         if self.overlay_window and self.overlay_window.winfo_exists():
@@ -1205,99 +1245,26 @@ class LogMonitorApp:
             if self.monitoring:
                 self.root.after(2000, self.check_overlay_visibility)
 
+    def open_event_store(self):
+        """Open the records database, falling back to memory if the file is unusable"""
+        try:
+            return EventStore(self.records_db)
+        except Exception as e:
+            print(f"[Store] Could not open {self.records_db}: {e}")
+            return EventStore(":memory:")
+
     def get_weapon_name(self, weapon_id):
         """Get friendly weapon name from ID"""
-        if not weapon_id:
-            return None
-            
-        # Try direct match
-        if weapon_id in self.weapon_ids:
-            return self.weapon_ids[weapon_id]
-            
-        # Normalize ID for matching
-        weapon_id_lower = weapon_id.lower()
-        
-        # Try lowercase match
-        if weapon_id_lower in self.weapon_ids:
-            return self.weapon_ids[weapon_id_lower]
-
-        # Remove numeric suffix (e.g., '_200000056755', '_3013639860880')
-        base_id = re.sub(r'_\d+$', '', weapon_id)
-        if base_id in self.weapon_ids:
-            return self.weapon_ids[base_id]
-        
-        return weapon_id
+        return self.weapon_resolver.resolve(weapon_id)
         
     def get_location_name(self, location_id):
         """Get friendly location name from ID"""
-        if not location_id:
-            return None
-            
-        # Try to match by exact ID first
-        if location_id in self.location_ids:
-            return self.location_ids[location_id]
-            
-        # Try to match by lowercase ID
-        location_id_lower = location_id.lower()
-        if location_id_lower in self.location_ids:
-            return self.location_ids[location_id_lower]
-        
-        # Remove the numeric ID at the end (e.g., '2984839923407')
-        clean_id = re.sub(r'_\d+$', '', location_id_lower)
-        if clean_id in self.location_ids:
-            return self.location_ids[clean_id]
-            
-        # Try to match by partial match (keywords in the ID)
-        if len(self.location_ids) > 0:
-            # Extract manufacturer prefix if present (AEGS_, DRAK_, MISC_, etc.)
-            manufacturer_match = re.match(r'^([a-zA-Z]+)_', location_id_lower)
-            if manufacturer_match:
-                manufacturer = manufacturer_match.group(1).upper()
-                # Look for keys with this manufacturer code
-                for key, value in self.location_ids.items():
-                    if key.upper().startswith(manufacturer):
-                        # Check if the rest of the key matches parts of the location ID
-                        key_parts = key.lower().split('_')[1:]  # Skip manufacturer
-                        loc_parts = location_id_lower.split('_')[1:]  # Skip manufacturer
-                        
-                        if any(part in loc_parts for part in key_parts):
-                            return value
-            
-            # Extract words from the location ID
-            words = re.findall(r'[a-z]+', location_id_lower)
-            
-            # Look for location IDs that contain these words
-            for key, value in self.location_ids.items():
-                # Check if any meaningful words from the ID appear in the key
-                for word in words:
-                    # Skip very short words or common prefixes
-                    if len(word) < 4 or word in ['the', 'and', 'ship', 'area', 'zone']:
-                        continue
-                    
-                    # Make sure we don't skip important manufacturer names
-                    if word in ['aegs', 'aegis', 'misc', 'drak', 'anvl']:
-                        if word in key.lower():
-                            return value
-                        
-                    if word in key.lower():
-                        return value
-        
-        # If no match found, use a cleaned-up version of the original ID
-        display_name = location_id
-        
-        # Format the ID nicer if it has underscores
-        if '_' in display_name:
-            # Remove the numeric part
-            display_name = re.sub(r'_\d+$', '', display_name)
-            # Replace underscores with spaces and capitalize words
-            display_name = ' '.join(word.capitalize() for word in display_name.split('_'))
-        
-        return display_name
+        return self.location_resolver.resolve(location_id)
 
     def show_records_window(self):
         """Show a window with all death records"""
         # Create new window if it doesn't exist or was closed
-        if not hasattr(self, 'records_window') or not self.records_window or not self.records_window.winfo_exists():
+        if not self.records_window or not self.records_window.winfo_exists():
             self.records_window = tk.Toplevel(self.root)
             self.records_window.title("Death Records")
             self.records_window.geometry("800x600")
@@ -1311,30 +1278,30 @@ class LogMonitorApp:
             title_label = ttk.Label(main_frame, text="Death Records", font=("Arial", 14, "bold"))
             title_label.pack(pady=(0, 10))
             
-            # Add records listbox with scrollbar inside a frame
-            list_frame = ttk.Frame(main_frame)
-            list_frame.pack(fill=tk.BOTH, expand=True, pady=5)
+            # Session statistics above the table
+            self.stats_label = ttk.Label(main_frame, text="", justify=tk.LEFT)
+            self.stats_label.pack(fill=tk.X, pady=(0, 5))
             
-            # Create scrollbars
-            y_scrollbar = ttk.Scrollbar(list_frame)
-            y_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            # Game channel filter
+            filter_frame = ttk.Frame(main_frame)
+            filter_frame.pack(fill=tk.X, pady=(0, 5))
+            ttk.Label(filter_frame, text="Channel:").pack(side=tk.LEFT, padx=(0, 5))
+            self.records_source_var = tk.StringVar(value=self.records_source or "All")
+            source_combo = ttk.Combobox(filter_frame, textvariable=self.records_source_var,
+                                        values=("All",) + CHANNELS, state="readonly", width=8)
+            source_combo.pack(side=tk.LEFT)
+            source_combo.bind("<<ComboboxSelected>>", lambda e: self.filter_records())
             
-            x_scrollbar = ttk.Scrollbar(list_frame, orient=tk.HORIZONTAL)
-            x_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+            # Add the records table inside a frame
+            list_frame = ttk.Frame(main_frame)
+            list_frame.pack(fill=tk.BOTH, expand=True, pady=5)
             
-            # Create the list with fixed-width font for better readability
-            self.records_list = tk.Listbox(
-                list_frame, 
-                font=("Consolas", 10),
-                selectmode=tk.EXTENDED,
-                yscrollcommand=y_scrollbar.set,
-                xscrollcommand=x_scrollbar.set
+            # Virtualized table that only formats the rows on screen, of the filtered channel only
+            self.records_view = RecordsView(
+                list_frame,
+                row_count=lambda: self.event_store.count(self.records_source),
+                fetch_rows=lambda offset, limit: self.event_store.page(offset, limit, self.records_source)
             )
-            self.records_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-            
-            # Configure scrollbars
-            y_scrollbar.config(command=self.records_list.yview)
-            x_scrollbar.config(command=self.records_list.xview)
             
             # Add buttons frame
             buttons_frame = ttk.Frame(main_frame)
@@ -1350,13 +1317,19 @@ class LogMonitorApp:
                                      command=self.export_records)
             export_button.pack(side=tk.LEFT, padx=5)
             
+            # Add import button for deaths already in the logs
+            import_button = ttk.Button(buttons_frame, text="Import Log History",
+                                     command=self.start_backfill)
+            import_button.pack(side=tk.LEFT, padx=5)
+            
             # Add close button
             close_button = ttk.Button(buttons_frame, text="Close", 
                                     command=self.records_window.destroy)
             close_button.pack(side=tk.RIGHT, padx=5)
             
-            # Populate the list with existing records
+            # Populate the table with existing records
             self.update_records_list()
+            self.schedule_stats_refresh()
         else:
             # If window exists, just bring it to front
             self.records_window.lift()
@@ -1364,111 +1337,195 @@ class LogMonitorApp:
             # Update the list in case new records were added
             self.update_records_list()
     
+    def filter_records(self):
+        """Show only the records of the channel picked in the records window"""
+        source = self.records_source_var.get()
+        self.records_source = source if source in CHANNELS else None
+
+        # Jump to the newest records of the new selection
+        self.records_view.follow = True
+        self.update_records_list()
+
     def update_records_list(self):
-        """Update the records list with all death records"""
-        if hasattr(self, 'records_list'):
-            # Clear the list
-            self.records_list.delete(0, tk.END)
-            
-            # Add each record
-            for record in self.all_death_records:
-                # Format record for display
-                if isinstance(record, dict):
-                    # Format timestamp
-                    timestamp = record.get('timestamp', 'Unknown')
-                    if timestamp and timestamp != 'Unknown':
-                        try:
-                            # Parse ISO timestamp to local time
-                            utc_time = datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S.%fZ")
-                            utc_time = utc_time.replace(tzinfo=timezone.utc)
-                            local_time = utc_time.astimezone()
-                            formatted_time = local_time.strftime("%Y-%m-%d %H:%M:%S")
-                        except:
-                            formatted_time = timestamp
-                    else:
-                        formatted_time = 'Unknown'
-                    
-                    # Get weapon and location names
-                    weapon_name = self.get_weapon_name(record.get('weapon', '')) or 'Unknown'
-                    location_name = self.get_location_name(record.get('location', '')) or 'Unknown'
-                    
-                    # Format: [TIME] PLAYER killed by KILLER using WEAPON - DAMAGE @ LOCATION
-                    display_text = f"[{formatted_time}] {record.get('actor', 'Unknown')} killed by {record.get('killer', 'Unknown')} "
-                    if weapon_name != 'Unknown':
-                        display_text += f"using {weapon_name} "
-                    display_text += f"- {record.get('damage', 'Unknown')} @ {location_name}"
-                    
-                    self.records_list.insert(tk.END, display_text)
-                else:
-                    # If not a parsed record, just add the raw line
-                    self.records_list.insert(tk.END, str(record))
+        """Show records added since the last refresh in the records table"""
+        if self.records_window and self.records_window.winfo_exists():
+            self.records_view.refresh()
+            self.update_stats_display()
+
+    def update_stats_display(self):
+        """Show the session statistics of the channel selected in the records window"""
+        if self.records_source:
+            text = format_stats(self.combat_stats[self.records_source].snapshot())
+        else:
+            # Every channel with events, each counted for its own account
+            snapshots = [(channel, self.combat_stats[channel].snapshot()) for channel in CHANNELS]
+            snapshots = [(channel, snapshot) for channel, snapshot in snapshots if snapshot["events"]]
+            if len(snapshots) > 1:
+                text = "\n".join(f"{channel} {format_stats(snapshot)}" for channel, snapshot in snapshots)
+            else:
+                text = format_stats(snapshots[0][1] if snapshots else self.combat_stats[DEFAULT_CHANNEL].snapshot())
+        self.stats_label.config(text=text)
+
+    def schedule_stats_refresh(self):
+        """Refresh the statistics periodically while the records window is open, so old kills leave the rolling windows"""
+        if self.stats_refresh_job:
+            self.root.after_cancel(self.stats_refresh_job)
+            self.stats_refresh_job = None
+        if self.records_window and self.records_window.winfo_exists():
+            self.stats_refresh_job = self.root.after(STATS_REFRESH_MS, self.refresh_stats)
+
+    def refresh_stats(self):
+        """Timer callback of schedule_stats_refresh"""
+        self.stats_refresh_job = None
+        if self.records_window and self.records_window.winfo_exists():
+            self.update_stats_display()
+            self.schedule_stats_refresh()
     
     def clear_records(self):
         """Clear all death records"""
-        if hasattr(self, 'records_list'):
+        if self.records_window and self.records_window.winfo_exists():
             # Confirm before clearing
             if messagebox.askyesno("Clear Records", "Are you sure you want to clear all records?"):
-                self.all_death_records.clear()
+                self.event_store.clear()
+                for stats in self.combat_stats.values():
+                    stats.reset()
                 self.update_records_list()
     
     def export_records(self):
-        """Export records to a file"""
-        if not self.all_death_records:
+        """Export records to a file on a background thread"""
+        # Only one export at a time
+        if self.exporter and self.exporter.thread and self.exporter.thread.is_alive():
+            self.export_window.lift()
+            return
+
+        # Export the records of the channel the records window shows
+        source = self.records_source
+        total = self.event_store.count(source)
+        if not total:
             messagebox.showinfo("Export", "No records to export")
             return
             
         # Ask for file location
         file_path = filedialog.asksaveasfilename(
             defaultextension=".csv",
-            filetypes=[("CSV Files", "*.csv"), ("Text Files", "*.txt"), ("All Files", "*.*")]
+            filetypes=[
+                ("CSV Files", "*.csv"),
+                ("Compressed CSV Files", "*.csv.gz"),
+                ("NDJSON Files", "*.ndjson"),
+                ("Compressed NDJSON Files", "*.ndjson.gz"),
+                ("Text Files", "*.txt"),
+                ("All Files", "*.*")
+            ]
         )
         
         if not file_path:
             return
-            
+
+        self.exporter = RecordExporter(
+            self.event_store.iter_events(source=source),
+            file_path,
+            total=total,
+            on_progress=lambda written, total: self.ui.post('export_progress', self.update_export_progress, written, total),
+            on_done=lambda written, error, cancelled: self.ui.post('export_done', self.finish_export, file_path, written, error, cancelled)
+        )
+        self.show_export_progress(file_path, total)
+        self.exporter.start()
+
+    def show_export_progress(self, file_path, total):
+        """Show a small window with the export progress and a cancel button"""
+        parent = self.records_window if self.records_window and self.records_window.winfo_exists() else self.root
+        self.export_window = tk.Toplevel(parent)
+        self.export_window.title("Exporting Records")
+        self.export_window.resizable(False, False)
+        self.export_window.transient(parent)
+
+        frame = ttk.Frame(self.export_window, padding="10")
+        frame.pack(fill=tk.BOTH, expand=True)
+
+        ttk.Label(frame, text=f"Exporting to {os.path.basename(file_path)}").pack(anchor=tk.W)
+
+        self.export_progress = ttk.Progressbar(frame, length=300, mode="determinate", maximum=total)
+        self.export_progress.pack(fill=tk.X, pady=5)
+
+        self.export_label = ttk.Label(frame, text=f"0 / {total} records")
+        self.export_label.pack(anchor=tk.W)
+
+        ttk.Button(frame, text="Cancel", command=self.exporter.cancel).pack(side=tk.RIGHT, pady=(5, 0))
+
+        # Closing the window cancels the export
+        self.export_window.protocol("WM_DELETE_WINDOW", self.exporter.cancel)
+
+    def update_export_progress(self, written, total):
+        """Show how many records have been exported so far"""
+        if self.export_window and self.export_window.winfo_exists():
+            self.export_progress.config(value=written)
+            self.export_label.config(text=f"{written} / {total} records")
+
+    def finish_export(self, file_path, written, error, cancelled):
+        """Close the progress window and report how the export ended"""
+        if self.export_window and self.export_window.winfo_exists():
+            self.export_window.destroy()
+        self.export_window = None
+
+        if error:
+            messagebox.showerror("Export Error", f"Error exporting records: {error}")
+        elif cancelled:
+            messagebox.showinfo("Export", "Export cancelled")
+        else:
+            messagebox.showinfo("Export", f"{written} records exported to {file_path}")
+
+    def start_backfill(self):
+        """Import the deaths in Game.log and its backups on a background thread"""
+        if self.backfill_thread and self.backfill_thread.is_alive():
+            messagebox.showinfo("Import", "Log history is already being imported")
+            return
+
+        sources = self.monitored_sources()
+        if not sources:
+            messagebox.showinfo("Import", "Select a Game.log file first")
+            return
+
+        # History of every monitored channel, each tagged with its channel
+        history = {channel: find_history_logs(path) for channel, path in sources.items()}
+        history = {channel: logs for channel, logs in history.items() if logs}
+        if not history:
+            messagebox.showinfo("Import", "No log files found")
+            return
+
+        file_count = sum(len(logs) for logs in history.values())
+        self.set_status(f"Importing deaths from {file_count} log files...")
+        self.backfill_thread = threading.Thread(target=self.run_backfill, args=(history,), daemon=True)
+        self.backfill_thread.start()
+
+    def run_backfill(self, history):
+        """
+        Parse the given logs into the event store; runs on the backfill thread
+
+        Args:
+            history: Dictionary of channel name to its log files
+        """
+        def report_progress(channel, done, total):
+            percent = done * 100 // total if total else 100
+            self.set_status(f"Importing {channel} log history... {percent}%")
+
         try:
-            with open(file_path, 'w', encoding='utf-8', newline='') as f:
-                # If CSV file, use CSV writer
-                if file_path.lower().endswith('.csv'):
-                    import csv
-                    writer = csv.writer(f)
-                    # Write header
-                    writer.writerow(["Timestamp", "Player", "Killer", "Weapon", "Damage Type", "Location"])
-                    
-                    # Write records
-                    for record in self.all_death_records:
-                        if isinstance(record, dict):
-                            writer.writerow([
-                                record.get('timestamp', ''),
-                                record.get('actor', ''),
-                                record.get('killer', ''),
-                                self.get_weapon_name(record.get('weapon', '')),
-                                record.get('damage', ''),
-                                self.get_location_name(record.get('location', ''))
-                            ])
-                        else:
-                            # Raw line
-                            writer.writerow([str(record), '', '', '', '', ''])
-                else:
-                    # For text files, just write lines
-                    for record in self.all_death_records:
-                        if isinstance(record, dict):
-                            # Format similar to display
-                            weapon_name = self.get_weapon_name(record.get('weapon', '')) or 'Unknown'
-                            location_name = self.get_location_name(record.get('location', '')) or 'Unknown'
-                            
-                            line = f"[{record.get('timestamp', 'Unknown')}] {record.get('actor', 'Unknown')} killed by {record.get('killer', 'Unknown')}"
-                            if weapon_name != 'Unknown':
-                                line += f" using {weapon_name}"
-                            line += f" - {record.get('damage', 'Unknown')} @ {location_name}\n"
-                            f.write(line)
-                        else:
-                            # Raw line
-                            f.write(f"{str(record)}\n")
-                            
-            messagebox.showinfo("Export", f"Records exported to {file_path}")
+            stored = files = 0
+            seconds = 0.0
+            for channel, logs in history.items():
+                summary = backfill(
+                    logs, self.event_store,
+                    lambda line, parsed, channel=channel: self.create_death_event(line, channel, parsed),
+                    on_progress=lambda done, total, channel=channel: report_progress(channel, done, total)
+                )
+                stored += summary.stored
+                files += summary.files
+                seconds += summary.seconds
+            self.set_status(f"Imported {stored} new deaths from {files} log files in {seconds:.1f}s")
         except Exception as e:
-            messagebox.showerror("Export Error", f"Error exporting records: {e}")
+            print(f"[Backfill] Error importing log history: {e}")
+            self.set_status(f"Error importing log history: {e}")
+
+        self.ui.post('records', self.update_records_list)
 
     def toggle_overlay_lock_from_ui(self):
         """Toggle overlay lock state from UI button"""
@@ -1491,16 +1548,80 @@ class LogMonitorApp:
         else:
             self.discord_webhook.stop()
             if self.monitoring:
-                self.status_label.config(text=f"Monitoring: {self.log_file_path}")
+                self.update_monitor_status()
 
         # Save to config
         self.save_settings()
 
+    def toggle_event_server(self):
+        """Toggle the browser overlay event server on/off"""
+        self.server_settings['enabled'] = self.server_enabled_var.get()
+
+        if self.server_settings['enabled']:
+            self.start_event_server()
+        else:
+            self.stop_event_server()
+            if self.monitoring:
+                self.update_monitor_status()
+
+        # Save to config
+        self.save_settings()
+
+    def start_event_server(self):
+        """Start serving events to browser sources; turns the setting off again if the port is taken"""
+        if self.event_server:
+            return
+
+        # asyncio is only imported once the server is wanted
+        from event_server import EventServer
+
+        server = EventServer(port=self.server_settings['port'])
+        try:
+            server.start()
+        except OSError as e:
+            self.server_settings['enabled'] = False
+            self.server_enabled_var.set(False)
+            self.status_label.config(text=f"Browser overlay server could not start: {e}")
+            return
+
+        self.event_server = server
+        self.status_label.config(text=f"Browser overlay server running at {server.url}")
+
+    def stop_event_server(self):
+        """Stop the event server and disconnect every browser source"""
+        server = self.event_server
+        self.event_server = None
+        if server:
+            server.stop()
+
+    def set_status(self, text):
+        """Show a message in the status label; safe to call from any thread"""
+        self.ui.post('status', self.status_label.config, text=text)
+
+    def update_monitor_status(self):
+        """Show the monitored file, watcher mode and last event latency in the status label"""
+        if not self.monitoring:
+            return
+
+        status_text = f"Monitoring: {self.describe_sources()}"
+        if self.watcher_mode:
+            status_text += f" | Watcher: {self.watcher_mode}"
+        if self.last_event_latency is not None:
+            status_text += f" | Latency: {self.last_event_latency * 1000:.1f} ms"
+        self.status_label.config(text=status_text)
+
     def update_account_display(self):
-        """Update the account name label"""
-        if self.account_name:
+        """Update the account name label with the accounts of the monitored channels"""
+        accounts = {channel: self.account_names[channel] for channel in self.enabled_sources
+                    if channel in self.account_names}
+        if accounts:
+            # Channels usually share one account, which is then shown once
+            if len(set(accounts.values())) == 1:
+                text = f"Account: {next(iter(accounts.values()))}"
+            else:
+                text = "Accounts: " + ", ".join(f"{channel} {name}" for channel, name in accounts.items())
             self.account_label.config(
-                text=f"Account: {self.account_name}",
+                text=text,
                 foreground="#0066CC",
                 font=("Arial", 10, "bold")
             )
@@ -1511,40 +1632,11 @@ class LogMonitorApp:
         """
         Parse account name from log line
 
-        Example line:
-        <2025-10-26T18:45:08.760Z> [Notice] <AccountLoginCharacterStatus_Character> Character: createdAt 1760624040745 - updatedAt 1760624048129 - geid 201996731201 - accountId 4624674 - name Voisys - state STATE_CURRENT [Team_GameServices][Login]
-
         Returns:
             Account name if found, None otherwise
         """
-        if "<AccountLoginCharacterStatus_Character>" in line:
-            # Try multiple patterns to extract the name
-            patterns = [
-                r'- name ([^\s-]+) -',  # Match: - name Voisys -
-                r'- name ([^\s-]+)\s',  # Match: - name Voisys (space)
-                r' name ([^\s-]+) -',   # Match: name Voisys -
-                r' name ([^\s-]+)\s',   # Match: name Voisys (space)
-            ]
-
-            for pattern in patterns:
-                match = re.search(pattern, line)
-                if match:
-                    name = match.group(1)
-                    print(f"[Debug] Account name detected with pattern '{pattern}': {name}")
-                    return name
+        return parse_account_name(line)
 
-            # Debug: print the line if no pattern matched
-            print(f"[Debug] Could not extract name from line: {line[:200]}")
-        return None
-
-
-    def schedule_death_lines_cleanup(self):
-        """Schedule regular cleanup of old death lines"""
-        if self.monitoring:
-            # Clean up old death lines
-            self.cleanup_old_death_lines()
-            # Schedule next cleanup
-            self.root.after(10000, self.schedule_death_lines_cleanup)  # Check every 10 seconds
 
 def main():
     # Set up exception handling to show error messages in dialogs
@@ -1570,4 +1662,7 @@ def main():
     root.mainloop()
 
 if __name__ == "__main__":
+    # Needed for the backfill worker processes in a frozen executable
+    import multiprocessing
+    multiprocessing.freeze_support()
     main() 
\ No newline at end of file
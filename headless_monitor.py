@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Headless Monitor
+Follows a Game.log without any window and writes one NDJSON object per death event
+"""
+
+import argparse
+import signal
+import sys
+import threading
+import time
+from pathlib import Path
+
+import death_parser
+from death_event import create_death_event
+from id_table_cache import load_id_table
+from location_resolver import LocationResolver
+from log_sources import channel_for_path, group_by_source
+from monitor_pipeline import MonitorPipeline
+from record_exporter import ndjson_line
+from weapon_resolver import WeaponResolver, compact_weapon_ids
+
+# Same folder the desktop app keeps its settings, caches and outbox in
+DEFAULT_STATE_DIR = Path.home() / "AppData" / "Local" / "GameLogMonitor"
+
+
+class HeadlessMonitor:
+    def __init__(self, sources, output, state_dir=DEFAULT_STATE_DIR, account_name=None,
+                 webhook=None, store=None, follow=True):
+        """
+        Initialize the monitor
+
+        Args:
+            sources: Dictionary of game channel to the path of the Game.log to follow
+            output: Text file the NDJSON lines are written to
+            state_dir: Folder for the ID table caches
+            account_name: Account whose kills are forwarded in every channel; detected from each log if None
+            webhook: DiscordWebhook the account's kills are forwarded to, or None
+            store: EventStore the events are also stored in, or None
+            follow: Keep following the log; if False stop at its end and read it from the start
+        """
+        self.output = output
+        self.webhook = webhook
+        self.store = store
+        self.events_written = 0
+
+        weapon_ids = load_id_table("weapon_ids.json", state_dir, compact_weapon_ids)
+        location_ids = load_id_table("location_ids.json", state_dir)
+        self.weapon_resolver = WeaponResolver(weapon_ids)
+        self.location_resolver = LocationResolver(location_ids)
+
+        self.pipeline = MonitorPipeline(
+            sources,
+            self.create_death_event,
+            self.handle_death_events,
+            account_names={source: account_name for source in sources} if account_name else None,
+            start_at_end=follow,
+            follow=follow
+        )
+
+    def start(self):
+        """Start following the log"""
+        self.pipeline.start()
+
+    def stop(self):
+        """Stop following the log; events already read are still written"""
+        self.pipeline.stop()
+
+    def join(self, timeout=None):
+        """Wait until the pipeline has exited"""
+        self.pipeline.join(timeout)
+
+    def is_running(self):
+        """Return True while the pipeline is still reading or writing events"""
+        threads = (self.pipeline.monitor_thread, self.pipeline.queue_thread)
+        return any(thread and thread.is_alive() for thread in threads)
+
+    def create_death_event(self, line, source):
+        """Parse a death line of a game channel into a DeathEvent with resolved display names"""
+        parsed = death_parser.parse_death_line(line)
+        return create_death_event(line, parsed, self.weapon_resolver.resolve, self.location_resolver.resolve, source)
+
+    def handle_death_events(self, events, detected_at, keys=None):
+        """
+        Write, forward and store a batch of events; runs on the pipeline's queue thread
+
+        Args:
+            events: DeathEvents in log order
+            detected_at: perf_counter time the oldest of them was read from the log
+            keys: Store key of each event without a log timestamp, else None
+        """
+        try:
+            self.output.write("".join(ndjson_line(event) for event in events))
+            self.output.flush()
+        except OSError as e:
+            # The reader went away, e.g. a closed pipe; nothing more can be delivered
+            print(f"[Headless] Error writing events: {e}")
+            self.stop()
+            return
+        self.events_written += len(events)
+
+        if self.store:
+            try:
+                self.store.append(events, keys)
+            except Exception as e:
+                print(f"[Store] Error storing events: {e}")
+
+        # Last, so nothing Discord does can keep the batch from the store
+        if self.webhook and self.webhook.enabled:
+            account_names = self.pipeline.account_names
+            try:
+                for source, source_events in group_by_source(events):
+                    self.webhook.send_kills(source_events, account_names.get(source))
+            except Exception as e:
+                print(f"[Discord] Error queuing kills: {e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Follow Game.log files without a window and write death events as NDJSON")
+    parser.add_argument("log", nargs="+", help="Path of a Game.log to follow; give one per channel to follow "
+                                               "LIVE, PTU and EPTU together")
+    parser.add_argument("--output", default="-", help="NDJSON file to append to, or - for stdout (default)")
+    parser.add_argument("--account", help="Account whose kills are posted to Discord; detected from each log if omitted")
+    parser.add_argument("--discord-url", help="Discord webhook URL the account's kills are posted to")
+    parser.add_argument("--outbox", help="Journal of kills waiting for Discord (default: headless_discord_outbox.jsonl "
+                                         "in the state folder)")
+    parser.add_argument("--db", help="Also store the events in this SQLite records database")
+    parser.add_argument("--state-dir", default=str(DEFAULT_STATE_DIR), help="Folder for the ID table caches")
+    parser.add_argument("--once", action="store_true", help="Read the whole log from the start and exit at its end")
+    args = parser.parse_args()
+
+    # Each log is tagged with the channel folder it is in
+    sources = {}
+    for path in args.log:
+        channel = channel_for_path(path)
+        if channel in sources:
+            parser.error(f"{sources[channel]} and {path} both belong to the {channel} channel")
+        sources[channel] = Path(path)
+
+    # Events go to stdout, so every log message goes to stderr
+    if args.output == "-":
+        output = sys.stdout
+        sys.stdout = sys.stderr
+    else:
+        output = open(args.output, 'a', encoding='utf-8', newline='\n')
+
+    state_dir = Path(args.state_dir)
+    state_dir.mkdir(parents=True, exist_ok=True)
+
+    webhook = None
+    if args.discord_url:
+        from discord_webhook import DiscordWebhook
+        outbox_path = args.outbox or state_dir / "headless_discord_outbox.jsonl"
+        webhook = DiscordWebhook(args.discord_url, outbox_path=outbox_path)
+        webhook.start()
+
+    store = None
+    if args.db:
+        from event_store import EventStore
+        store = EventStore(args.db)
+
+    monitor = HeadlessMonitor(sources, output, state_dir, args.account, webhook, store, follow=not args.once)
+
+    stop_requested = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop_requested.set())
+
+    began = time.perf_counter()
+    monitor.start()
+    try:
+        while monitor.is_running() and not stop_requested.wait(0.5):
+            pass
+    except KeyboardInterrupt:
+        pass
+    finally:
+        monitor.stop()
+        monitor.join(timeout=5)
+        print(f"[Headless] Wrote {monitor.events_written} events in {time.perf_counter() - began:.1f}s")
+        if webhook:
+            webhook.close()
+        if store:
+            store.close()
+        if output is not sys.__stdout__:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
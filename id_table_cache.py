@@ -0,0 +1,121 @@
+"""
+ID Table Cache
+Keeps a marshal copy of each JSON ID table that is rebuilt whenever the JSON file changes
+"""
+
+import marshal
+import os
+import sys
+
+# Bumped whenever the cache layout or a compact function changes, so old caches are rebuilt
+CACHE_VERSION = 1
+
+
+def load_table(json_path, cache_path, compact=None):
+    """
+    Load an ID table from its cache, or from the JSON file when the cache is stale
+
+    The cache records the size, modification time and SHA-256 of the JSON
+    file it was built from. A matching size and modification time is
+    trusted without reading the JSON. Otherwise the JSON is hashed, and a
+    matching hash (a copied or re-extracted file with a new modification
+    time) still reuses the cached table instead of parsing.
+
+    Args:
+        json_path: Path of the JSON table
+        cache_path: Path of the cache file, created or replaced as needed
+        compact: Optional callable that normalizes a freshly parsed table before it is cached
+
+    Returns:
+        Dictionary mapping IDs to friendly names
+    """
+    stat = os.stat(json_path)
+    cached = _read_cache(cache_path)
+    if cached and cached[1] == stat.st_mtime_ns and cached[2] == stat.st_size:
+        return cached[4]
+
+    # Only needed when the cache is stale, so a warm start does not import them
+    import hashlib
+    import json
+
+    with open(json_path, 'rb') as file:
+        data = file.read()
+    digest = hashlib.sha256(data).hexdigest()
+
+    if cached and cached[3] == digest:
+        table = cached[4]
+    else:
+        table = json.loads(data)
+        if compact:
+            table = compact(table)
+
+    _write_cache(cache_path, (CACHE_VERSION, stat.st_mtime_ns, stat.st_size, digest, table))
+    return table
+
+
+def get_resource_path(relative_path):
+    """Get absolute path to resource, works for dev and for PyInstaller"""
+    try:
+        # PyInstaller creates a temp folder and stores path in _MEIPASS
+        base_path = sys._MEIPASS
+    except Exception:
+        base_path = os.path.abspath(".")
+
+    return os.path.join(base_path, relative_path)
+
+
+def load_id_table(filename, cache_dir, compact=None):
+    """
+    Load an ID-to-name table shipped next to the application
+
+    Args:
+        filename: Name of the JSON file, e.g. weapon_ids.json
+        cache_dir: Folder that keeps the compiled cache of the table
+        compact: Optional callable that normalizes the table before it is cached
+
+    Returns:
+        Dictionary mapping IDs to friendly names; empty if the file is missing or invalid
+    """
+    try:
+        table_path = get_resource_path(filename)
+        if os.path.exists(table_path):
+            cache_path = os.path.join(cache_dir, f"{os.path.splitext(filename)[0]}.cache")
+            table = load_table(table_path, cache_path, compact)
+            print(f"Loaded {len(table)} IDs from {filename}")
+            return table
+        print(f"{filename} not found")
+    except Exception as e:
+        print(f"Error loading {filename}: {e}")
+    return {}
+
+
+def _read_cache(cache_path):
+    """
+    Read a cache file
+
+    Returns:
+        Tuple of (version, mtime_ns, size, sha256, table), or None if missing, damaged or outdated
+    """
+    try:
+        # marshal.load() on a file object reads value by value; one read is much faster
+        with open(cache_path, 'rb') as file:
+            cached = marshal.loads(file.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+    if (not isinstance(cached, tuple) or len(cached) != 5 or cached[0] != CACHE_VERSION
+            or not isinstance(cached[4], dict)):
+        return None
+    return cached
+
+
+def _write_cache(cache_path, cached):
+    """Write a cache file through a temporary file so a crash never leaves half of one"""
+    temp_path = f"{cache_path}.tmp"
+    try:
+        with open(temp_path, 'wb') as file:
+            marshal.dump(cached, file)
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        # Only the next launch gets slower
+        print(f"[Cache] Could not write {cache_path}: {e}")
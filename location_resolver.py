@@ -0,0 +1,155 @@
+"""
+Location Resolver
+Maps zone IDs from the log to friendly location names using prebuilt indexes
+"""
+
+import bisect
+import re
+from functools import lru_cache
+
+NUMERIC_SUFFIX_PATTERN = re.compile(r'_\d+$')
+MANUFACTURER_PATTERN = re.compile(r'^([a-zA-Z]+)_')
+WORD_PATTERN = re.compile(r'[a-z]+')
+
+# Words too short or too generic to identify a location
+IGNORED_WORDS = {'the', 'and', 'ship', 'area', 'zone'}
+
+
+class LocationResolver:
+    def __init__(self, location_ids, cache_size=2048):
+        """
+        Initialize the resolver and build its lookup indexes
+
+        The answers match a linear scan of location_ids in file order: whenever
+        several keys could match, the one that appears first wins.
+
+        Args:
+            location_ids: Dictionary mapping location IDs to friendly names
+            cache_size: Number of resolved zone IDs to remember
+        """
+        self.location_ids = location_ids
+        self._values = list(location_ids.values())
+        lower_keys = [key.lower() for key in location_ids]
+
+        # Manufacturer lookup: uppercased keys by position, plus a sorted copy in
+        # which all keys sharing a prefix form one contiguous range
+        self._upper_keys = [key.upper() for key in location_ids]
+        self._sorted_upper_keys = sorted(self._upper_keys)
+
+        # Inverted index from each key token after the manufacturer to the keys containing it
+        self._token_index = {}
+        for index, lower_key in enumerate(lower_keys):
+            for part in lower_key.split('_')[1:]:
+                self._token_index.setdefault(part, []).append(index)
+
+        # All keys joined in order, so the first key containing a word is one str.find() away
+        self._joined_keys = "\n".join(lower_keys)
+        self._key_offsets = []
+        offset = 0
+        for lower_key in lower_keys:
+            self._key_offsets.append(offset)
+            offset += len(lower_key) + 1
+
+        self._cached_resolve = lru_cache(maxsize=cache_size)(self._resolve)
+
+    def resolve(self, location_id):
+        """
+        Get friendly location name from ID
+
+        Args:
+            location_id: Zone ID from the log
+
+        Returns:
+            Friendly name, or a cleaned-up version of the ID if nothing matches
+        """
+        if not location_id:
+            return None
+        return self._cached_resolve(location_id)
+
+    def cache_info(self):
+        """Return hit and miss statistics of the resolution cache"""
+        return self._cached_resolve.cache_info()
+
+    def _resolve(self, location_id):
+        """Resolve a zone ID without consulting the cache"""
+        location_ids = self.location_ids
+
+        # Try to match by exact ID first
+        if location_id in location_ids:
+            return location_ids[location_id]
+
+        # Try to match by lowercase ID
+        location_id_lower = location_id.lower()
+        if location_id_lower in location_ids:
+            return location_ids[location_id_lower]
+
+        # Remove the numeric ID at the end (e.g., '2984839923407')
+        clean_id = NUMERIC_SUFFIX_PATTERN.sub('', location_id_lower)
+        if clean_id in location_ids:
+            return location_ids[clean_id]
+
+        if location_ids:
+            index = self._match_manufacturer(location_id_lower)
+            if index is None:
+                index = self._match_words(location_id_lower)
+            if index is not None:
+                return self._values[index]
+
+        # If no match found, use a cleaned-up version of the original ID
+        display_name = location_id
+
+        # Format the ID nicer if it has underscores
+        if '_' in display_name:
+            # Remove the numeric part
+            display_name = NUMERIC_SUFFIX_PATTERN.sub('', display_name)
+            # Replace underscores with spaces and capitalize words
+            display_name = ' '.join(word.capitalize() for word in display_name.split('_'))
+
+        return display_name
+
+    def _match_manufacturer(self, location_id_lower):
+        """
+        Find the first key with the same manufacturer prefix sharing a token with the ID
+
+        Returns:
+            Index of the matching key, or None
+        """
+        manufacturer_match = MANUFACTURER_PATTERN.match(location_id_lower)
+        if not manufacturer_match:
+            return None
+        manufacturer = manufacturer_match.group(1).upper()
+
+        # Skip the token lookups when no key starts with the manufacturer code
+        start = bisect.bisect_left(self._sorted_upper_keys, manufacturer)
+        if start >= len(self._sorted_upper_keys) or not self._sorted_upper_keys[start].startswith(manufacturer):
+            return None
+
+        best = None
+        for part in set(location_id_lower.split('_')[1:]):
+            for index in self._token_index.get(part, ()):
+                if best is not None and index >= best:
+                    break
+                if self._upper_keys[index].startswith(manufacturer):
+                    best = index
+                    break
+        return best
+
+    def _match_words(self, location_id_lower):
+        """
+        Find the first key containing any meaningful word of the ID
+
+        Returns:
+            Index of the matching key, or None
+        """
+        best_offset = None
+        for word in WORD_PATTERN.findall(location_id_lower):
+            # Skip very short words or common prefixes
+            if len(word) < 4 or word in IGNORED_WORDS:
+                continue
+            offset = self._joined_keys.find(word)
+            if offset >= 0 and (best_offset is None or offset < best_offset):
+                best_offset = offset
+
+        if best_offset is None:
+            return None
+        return bisect.bisect_right(self._key_offsets, best_offset) - 1
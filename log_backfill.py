@@ -0,0 +1,256 @@
+"""
+Log Backfill
+Imports the deaths already written to Game.log and its rotated backups into the event store
+"""
+
+import gc
+import heapq
+import os
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+from death_parser import DEATH_MARKER, parse_death_line
+from event_store import untimed_key
+from log_tailer import IDENTITY_BYTES, log_identity
+
+# Bytes handed to one worker process at a time
+DEFAULT_CHUNK_SIZE = 32 * 1024 * 1024
+
+# Folder next to Game.log where the game moves the log of each previous session
+BACKUP_DIR_NAME = "logbackups"
+
+
+class BackfillSummary(NamedTuple):
+    """Totals reported when a backfill finishes"""
+    files: int
+    bytes_read: int
+    deaths: int
+    stored: int  # Deaths not already in the store
+    seconds: float
+
+
+def find_history_logs(log_path):
+    """
+    Find the current log and the game's backups of previous sessions
+
+    Args:
+        log_path: Path to the current Game.log
+
+    Returns:
+        List of log paths, oldest session first and the current log last
+    """
+    log_path = Path(log_path)
+    backup_dir = log_path.parent / BACKUP_DIR_NAME
+
+    logs = []
+    if backup_dir.is_dir():
+        logs = sorted((path for path in backup_dir.glob("*.log") if path.is_file()),
+                      key=lambda path: path.stat().st_mtime)
+    if log_path.is_file():
+        logs.append(log_path)
+    return logs
+
+
+def file_identity(path):
+    """
+    Identify a log by its first line, which stays the same when the game moves it to the backups
+
+    Args:
+        path: Log file
+
+    Returns:
+        Hex digest of the first line
+    """
+    with open(path, 'rb') as file:
+        header = file.readline(IDENTITY_BYTES)
+    return log_identity(header)
+
+
+def split_ranges(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Split a file into byte ranges that start and end on line boundaries
+
+    Args:
+        path: File to split
+        chunk_size: Approximate size of each range
+
+    Returns:
+        List of (start, end) byte offsets covering the whole file in order
+    """
+    size = os.path.getsize(path)
+    ranges = []
+    start = 0
+    with open(path, 'rb') as file:
+        while start < size:
+            end = min(start + chunk_size, size)
+            if end < size:
+                # Extend the range to the end of the line it stops in
+                file.seek(end)
+                end += len(file.readline())
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def scan_range(path, start, end):
+    """
+    Parse the death lines in one byte range of a log; runs in a worker process
+
+    Only the bytes around each death marker are decoded, the rest of the
+    range is skipped with bytes.find().
+
+    Args:
+        path: Log file to read
+        start: Offset of the first byte, at the start of a line
+        end: Offset just past the last byte, at the end of a line
+
+    Returns:
+        List of (offset, line, ParsedDeath) tuples in file order, offset being where the line starts in the file
+    """
+    with open(path, 'rb') as file:
+        file.seek(start)
+        data = file.read(end - start)
+
+    results = []
+    position = data.find(DEATH_MARKER)
+    while position != -1:
+        line_start = data.rfind(b"\n", 0, position) + 1
+        line_end = data.find(b"\n", position)
+        if line_end == -1:
+            line_end = len(data)
+
+        line = data[line_start:line_end].decode('utf-8', errors='ignore').strip()
+        results.append((start + line_start, line, parse_death_line(line)))
+        position = data.find(DEATH_MARKER, line_end)
+    return results
+
+
+def _file_deaths(path, ranges, futures, report_range):
+    """
+    Yield the deaths of one file in order, range by range, as the merge asks for them
+
+    Args:
+        path: Log file the ranges belong to
+        ranges: (start, end) byte ranges of the file in order
+        futures: Futures of scan_range for each range, or None to scan inline; each is
+                 dropped from the list once taken, so merged results can be freed
+        report_range: Callable taking the size of each range once it is parsed
+    """
+    for index, (start, end) in enumerate(ranges):
+        if futures is None:
+            deaths = scan_range(path, start, end)
+        else:
+            deaths = futures[index].result()
+            futures[index] = None
+        report_range(end - start)
+        yield from deaths
+
+
+def _sort_keys(identity, deaths):
+    """
+    Pair each death of one file with the timestamp it sorts by
+
+    Old-format lines carry no timestamp and take the one of the death before them.
+    The store cannot tell them apart by their fields, so they get a key made of
+    the file identity and their offset, which a second import or the live
+    pipeline reproduces.
+
+    Args:
+        identity: file_identity() of the log
+        deaths: (offset, line, parsed) tuples in file order
+
+    Yields:
+        (timestamp, key, line, parsed) tuples in file order, key being None for timestamped deaths
+    """
+    last_timestamp = ""
+    for offset, line, parsed in deaths:
+        key = None
+        if parsed.timestamp:
+            last_timestamp = parsed.timestamp
+        else:
+            key = untimed_key(identity, offset)
+        yield last_timestamp, key, line, parsed
+
+
+def backfill(paths, store, make_event, workers=None, chunk_size=DEFAULT_CHUNK_SIZE,
+             batch_size=5000, on_progress=None):
+    """
+    Parse every death in the given logs and add them to the store in timestamp order
+
+    Ranges are parsed in parallel across processes. Each file keeps its
+    line order and the files are merged by timestamp, so the history reads
+    in the order the deaths happened. Deaths the store already holds are
+    skipped, so running a backfill twice is harmless.
+
+    Args:
+        paths: Log files to import
+        store: EventStore receiving the events
+        make_event: Callable taking (line, parsed) and returning a DeathEvent
+        workers: Number of worker processes; None uses every core, 1 parses inline
+        chunk_size: Approximate bytes per parsed range
+        batch_size: Events stored per transaction
+        on_progress: Callable taking (bytes_done, bytes_total), called as ranges are merged
+
+    Returns:
+        BackfillSummary
+    """
+    began = time.perf_counter()
+    paths = [str(path) for path in paths]
+    file_ranges = [split_ranges(path, chunk_size) for path in paths]
+    total_bytes = sum(end - start for ranges in file_ranges for start, end in ranges)
+    done_bytes = 0
+
+    def report_range(size):
+        nonlocal done_bytes
+        done_bytes += size
+        if on_progress:
+            on_progress(done_bytes, total_bytes)
+
+    executor = None
+    file_futures = []
+    if workers != 1 and sum(len(ranges) for ranges in file_ranges) > 1:
+        # Imported here so the app does not load multiprocessing at startup
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Workers only build acyclic tuples, so the cyclic garbage collector
+        # would spend its time rescanning their growing result lists
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=gc.disable)
+
+    try:
+        # Every range is queued up front and the merge consumes the results in
+        # file order, so only the ranges not merged yet are held in memory
+        per_file = []
+        for path, ranges in zip(paths, file_ranges):
+            futures = None
+            if executor:
+                futures = [executor.submit(scan_range, path, start, end) for start, end in ranges]
+                file_futures.append(futures)
+            per_file.append(_sort_keys(file_identity(path), _file_deaths(path, ranges, futures, report_range)))
+
+        deaths = 0
+        stored = 0
+        batch = []
+        keys = []
+        for _, key, line, parsed in heapq.merge(*per_file, key=lambda item: item[0]):
+            batch.append(make_event(line, parsed))
+            keys.append(key)
+            deaths += 1
+            if len(batch) >= batch_size:
+                stored += store.append(batch, keys)
+                batch = []
+                keys = []
+        stored += store.append(batch, keys)
+    finally:
+        if executor:
+            # Drop the ranges still queued if the merge stopped on an error
+            for futures in file_futures:
+                for future in futures:
+                    if future:
+                        future.cancel()
+            executor.shutdown()
+
+    summary = BackfillSummary(len(paths), total_bytes, deaths, stored, time.perf_counter() - began)
+    print(f"[Backfill] {summary.deaths} deaths in {summary.files} files "
+          f"({summary.bytes_read / (1024 * 1024):.1f} MB), {summary.stored} new, {summary.seconds:.2f}s")
+    return summary
@@ -0,0 +1,75 @@
+"""
+Log Sources
+Game channels (LIVE, PTU, EPTU) and the Game.log each of them writes
+"""
+
+from pathlib import Path
+
+# Channels the game can be installed as, each in its own folder with its own Game.log
+CHANNELS = ("LIVE", "PTU", "EPTU")
+
+# Channel of logs outside any channel folder, and of records stored before channels were tracked
+DEFAULT_CHANNEL = "LIVE"
+
+
+def channel_for_path(path):
+    """
+    Work out which channel a log belongs to from its folders
+
+    Both StarCitizen/PTU/Game.log and StarCitizen/PTU/logbackups/<name>.log
+    belong to PTU.
+
+    Args:
+        path: Path of a Game.log or one of its backups
+
+    Returns:
+        Channel name, or DEFAULT_CHANNEL if no folder names a channel
+    """
+    for folder in reversed(Path(path).parts[:-1]):
+        if folder.upper() in CHANNELS:
+            return folder.upper()
+    return DEFAULT_CHANNEL
+
+
+def find_channel_logs(install_dirs, fallback_paths=()):
+    """
+    Find the Game.log of every installed channel
+
+    Args:
+        install_dirs: Game folders holding one sub folder per channel
+        fallback_paths: Further Game.log locations to check for channels not found in install_dirs
+
+    Returns:
+        Dictionary of channel name to the first existing Game.log path, in CHANNELS order
+    """
+    found = {}
+    for channel in CHANNELS:
+        for install_dir in install_dirs:
+            path = Path(install_dir) / channel / "Game.log"
+            if path.exists():
+                found[channel] = path
+                break
+
+    for path in fallback_paths:
+        path = Path(path)
+        channel = channel_for_path(path)
+        if channel not in found and path.exists():
+            found[channel] = path
+
+    return {channel: found[channel] for channel in CHANNELS if channel in found}
+
+
+def group_by_source(events):
+    """
+    Split a batch into the events of each game channel
+
+    Args:
+        events: DeathEvents in log order
+
+    Returns:
+        List of (source, events) tuples, each list keeping log order
+    """
+    groups = {}
+    for event in events:
+        groups.setdefault(event.source, []).append(event)
+    return list(groups.items())
@@ -0,0 +1,347 @@
+"""
+Log Tailer
+Incrementally reads new lines appended to a growing log file
+"""
+
+import hashlib
+import os
+import sys
+import time
+
+# Most bytes of the first line used to recognise a log after the game moved it to the backups
+IDENTITY_BYTES = 256
+
+
+def log_identity(first_line):
+    """
+    Identify a log by its first line, which stays the same when the game moves it to the backups
+
+    Args:
+        first_line: Up to IDENTITY_BYTES bytes of the first line of the log
+
+    Returns:
+        Hex digest of the line
+    """
+    return hashlib.sha1(first_line).hexdigest()
+
+
+class LogTailer:
+    def __init__(self, path, chunk_size=64 * 1024, start_at_end=True,
+                 fingerprint_size=256, fingerprint_interval=2.0, resume_at=None):
+        """
+        Initialize the tailer
+
+        The file handle is kept open in binary mode between reads, so each poll
+        only costs a stat() call and a read of the bytes that were appended.
+
+        Args:
+            path: Path of the log file to follow
+            chunk_size: Number of bytes requested per read call
+            start_at_end: Skip content that already exists when the file is first opened
+            fingerprint_size: Number of header bytes used to recognise a replaced file
+            fingerprint_interval: Minimum seconds between header fingerprint checks
+            resume_at: resume_point() of an earlier tailer of the same file; reading continues
+                       there if the file was not replaced since, instead of following start_at_end
+        """
+        self.path = str(path)
+        self.chunk_size = chunk_size
+        self.start_at_end = start_at_end
+        self.fingerprint_size = fingerprint_size
+        self.fingerprint_interval = fingerprint_interval
+
+        self.position = 0
+        self.rotations = 0
+        self._file = None
+        self._inode = None
+        self._stat_key = None  # (size, mtime) of the file when it was last checked for rotation
+        self._fingerprint = b""
+        self._last_fingerprint_check = 0.0
+        self._pending = bytearray()
+        self._first_open = True
+        self._resume_at = resume_at
+        self._identity = None
+        self._lines = b""  # Bytes the lines being yielded were split from
+        self._lines_start = 0  # File offset of the first byte of _lines
+        self._line_search = 0  # Index in _lines where line_offset() resumes
+
+    def close(self):
+        """Close the underlying file handle"""
+        if self._file:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+        self._file = None
+        self._pending.clear()
+
+    def resume_point(self):
+        """
+        Get where another tailer should continue reading this file
+
+        Returns:
+            Tuple of (offset of the first line not yielded yet, header fingerprint), the
+            resume_at it was given if it never opened the file, or None
+        """
+        if self._file is None:
+            return self._resume_at
+        return self.position - len(self._pending), self._fingerprint
+
+    def read_lines(self, markers=None):
+        """
+        Yield complete lines appended since the previous call
+
+        Lines are yielded lazily as raw bytes without the trailing line ending.
+        A partial line at the end of the file is held back until the rest of it
+        has been written.
+
+        Args:
+            markers: Byte strings to look for; if given, only lines containing one
+                     of them are yielded and the rest are skipped with bytes.find()
+
+        Raises:
+            FileNotFoundError: If the log file does not exist
+        """
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            # A file that appears later is new, so read it from the start
+            self._first_open = False
+            raise
+
+        if self._file is None:
+            self._open(st, seek_end=self.start_at_end and self._first_open)
+        elif self._is_rotated(st):
+            print(f"[Tailer] Log rotation detected for {self.path}, reading from start")
+            self.rotations += 1
+            self.close()
+            self._open(st, seek_end=False)
+
+        if st.st_size <= self.position:
+            return
+
+        read = self._file.read
+        while True:
+            chunk = read(self.chunk_size)
+            if not chunk:
+                break
+            self.position += len(chunk)
+
+            end = chunk.rfind(b"\n")
+            if end < 0:
+                self._pending += chunk
+                continue
+
+            # splitlines() also drops the \r of Windows line endings
+            if self._pending:
+                self._lines_start = self.position - len(chunk) - len(self._pending)
+                self._pending += chunk[:end]
+                self._lines = bytes(self._pending)
+                self._pending = bytearray(chunk[end + 1:])
+            else:
+                self._lines_start = self.position - len(chunk)
+                self._lines = chunk[:end]
+                self._pending += chunk[end + 1:]
+            self._line_search = 0
+
+            if markers is None:
+                yield from self._lines.splitlines()
+            else:
+                yield from self._marked_lines(markers)
+
+            if len(chunk) < self.chunk_size:
+                break
+
+    def _marked_lines(self, markers):
+        """Yield the lines of the current chunk that contain one of the markers, in file order"""
+        lines = self._lines
+        find = lines.find
+        rfind = lines.rfind
+        if len(markers) == 1:
+            marker = markers[0]
+            index = find(marker)
+            while index >= 0:
+                start = rfind(b"\n", 0, index) + 1
+                end = find(b"\n", index)
+                if end < 0:
+                    end = len(lines)
+                index = find(marker, end)
+                # line_offset() finds the line right where it starts
+                self._line_search = start
+                yield lines[start:end - 1] if lines[end - 1] == 13 else lines[start:end]
+            return
+
+        bounds = set()
+        for marker in markers:
+            index = find(marker)
+            while index >= 0:
+                start = rfind(b"\n", 0, index) + 1
+                end = find(b"\n", index)
+                if end < 0:
+                    end = len(lines)
+                bounds.add((start, end))
+                index = find(marker, end)
+        # A line holding several markers is only yielded once
+        for start, end in sorted(bounds):
+            self._line_search = start
+            yield lines[start:end - 1] if lines[end - 1] == 13 else lines[start:end]
+
+    @property
+    def identity(self):
+        """log_identity() of the file being read, or None if its first line cannot be read"""
+        if self._identity is None and self._file:
+            try:
+                self._file.seek(0)
+                first_line = self._file.readline(IDENTITY_BYTES)
+                self._file.seek(self.position)
+            except OSError:
+                return None
+            self._identity = log_identity(first_line)
+        return self._identity
+
+    def line_offset(self, line):
+        """
+        Find the file offset of a line just yielded by read_lines()
+
+        Lines have to be looked up in the order they were yielded and before
+        the next one is requested. The search resumes after the last line
+        found, so the lookup only costs a scan of the bytes in between.
+
+        Args:
+            line: Raw line as yielded
+
+        Returns:
+            Offset of the first byte of the line, or None if it was not found
+        """
+        lines = self._lines
+        index = lines.find(line, self._line_search)
+        while index >= 0:
+            end = index + len(line)
+            # Only a match spanning a whole line counts
+            if (index == 0 or lines[index - 1] in b"\r\n") and (end == len(lines) or lines[end] in b"\r\n"):
+                self._line_search = end
+                return self._lines_start + index
+            index = lines.find(line, index + 1)
+        return None
+
+    def _open(self, st, seek_end):
+        """Open the log file and position the handle"""
+        self._file = _open_shared(self.path)
+        self._identity = None
+        self._inode = st.st_ino
+        self._stat_key = (st.st_size, st.st_mtime_ns)
+        self._fingerprint = self._file.read(self.fingerprint_size)
+        self._last_fingerprint_check = time.monotonic()
+        self._pending.clear()
+        self._first_open = False
+
+        resume_at, self._resume_at = self._resume_at, None
+        if resume_at:
+            # Only the same file, still at least as long, is continued
+            position, fingerprint = resume_at
+            if fingerprint and self._fingerprint.startswith(fingerprint) and position <= st.st_size:
+                self.position = self._file.seek(position)
+                return
+
+        if seek_end:
+            self.position = self._file.seek(0, os.SEEK_END)
+        else:
+            self.position = self._file.seek(0)
+
+    def _is_rotated(self, st):
+        """Check whether the file at our path is no longer the one we are reading"""
+        # A different inode means the file was replaced
+        if st.st_ino and self._inode and st.st_ino != self._inode:
+            return True
+
+        # A smaller file means it was truncated or recreated
+        if st.st_size < self.position:
+            return True
+
+        # Some filesystems report no inode, so compare the header bytes instead
+        if not st.st_ino or not self._inode:
+            now = time.monotonic()
+            if now - self._last_fingerprint_check >= self.fingerprint_interval:
+                self._last_fingerprint_check = now
+                return self._read_fingerprint() != self._fingerprint
+            return False
+
+        # Truncated in place and written past our offset again between two polls:
+        # same inode and no smaller, but the header was rewritten. Reading the
+        # header costs two seeks, so like above it is checked at most once per
+        # interval however often the log grows
+        stat_key = (st.st_size, st.st_mtime_ns)
+        if stat_key != self._stat_key:
+            now = time.monotonic()
+            if now - self._last_fingerprint_check >= self.fingerprint_interval:
+                self._stat_key = stat_key
+                self._last_fingerprint_check = now
+                return self._read_own_fingerprint() != self._fingerprint
+
+        return False
+
+    def _read_own_fingerprint(self):
+        """Read the header bytes through our own handle, which still points at the same inode"""
+        try:
+            self._file.seek(0)
+            header = self._file.read(self.fingerprint_size)
+            self._file.seek(self.position)
+        except OSError:
+            return self._fingerprint
+        return self._match_header(header)
+
+    def _read_fingerprint(self):
+        """Read the header bytes of the file currently at our path"""
+        try:
+            with open(self.path, "rb") as file:
+                header = file.read(self.fingerprint_size)
+        except OSError:
+            return self._fingerprint
+        return self._match_header(header)
+
+    def _match_header(self, header):
+        """Return the part of a header comparable with our fingerprint"""
+        # The header of a young file may still be growing
+        if len(header) > len(self._fingerprint) and header.startswith(self._fingerprint):
+            self._fingerprint = header
+        return header[:len(self._fingerprint)]
+
+
+def _open_shared(path):
+    """
+    Open a file for binary reading without blocking rename or delete
+
+    On Windows a regular open() locks the file against renaming, which would
+    stop the game from moving Game.log into its backup folder while we hold
+    the handle. There we open it with FILE_SHARE_DELETE instead.
+    """
+    if sys.platform != "win32":
+        return open(path, "rb")
+
+    try:
+        import ctypes
+        import msvcrt
+        from ctypes import wintypes
+
+        GENERIC_READ = 0x80000000
+        FILE_SHARE_ALL = 0x00000001 | 0x00000002 | 0x00000004
+        OPEN_EXISTING = 3
+        FILE_ATTRIBUTE_NORMAL = 0x80
+        INVALID_HANDLE_VALUE = wintypes.HANDLE(-1).value
+
+        create_file = ctypes.windll.kernel32.CreateFileW
+        create_file.restype = wintypes.HANDLE
+        create_file.argtypes = [wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, wintypes.LPVOID,
+                                wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE]
+
+        handle = create_file(path, GENERIC_READ, FILE_SHARE_ALL, None,
+                             OPEN_EXISTING, FILE_ATTRIBUTE_NORMAL, None)
+        if handle == INVALID_HANDLE_VALUE:
+            raise ctypes.WinError()
+
+        fd = msvcrt.open_osfhandle(handle, os.O_RDONLY | os.O_BINARY)
+        return os.fdopen(fd, "rb")
+    except FileNotFoundError:
+        raise
+    except Exception as e:
+        print(f"[Tailer] Shared open failed, falling back to regular open: {e}")
+        return open(path, "rb")
@@ -0,0 +1,266 @@
+"""
+Monitor Pipeline
+Tails the Game.log of one or more game channels, detects their accounts and turns death lines
+into DeathEvents on two worker threads, without any UI
+"""
+
+import queue
+import threading
+import time
+from pathlib import Path
+
+import death_parser
+from account_detection import ACCOUNT_MARKER, find_account_name, parse_account_name
+from file_watcher import create_watcher
+from event_store import untimed_key
+from log_tailer import LogTailer
+
+# Seconds the watcher may sleep before the log is checked anyway
+WATCH_TIMEOUT = 1.0
+
+# Queued by stop() to wake process_queue and make it exit
+QUEUE_STOP = object()
+
+# Markers of the lines read from a log whose account is known, and of one still being detected
+DEATH_MARKERS = (death_parser.DEATH_MARKER,)
+DETECTING_MARKERS = (death_parser.DEATH_MARKER, ACCOUNT_MARKER)
+
+# Most lines parsed per batch, so reading a long log from the start does not build one huge batch
+MAX_BATCH_LINES = 5000
+
+
+class LogSource:
+    def __init__(self, name, path, account_name=None):
+        """
+        Initialize the state of one followed log
+
+        Args:
+            name: Game channel the log belongs to, e.g. "LIVE"
+            path: Path of its Game.log
+            account_name: Account already known for this channel, or None to detect it
+        """
+        self.name = name
+        self.path = Path(path)
+        self.account_name = account_name
+        self.tailer = None  # LogTailer holding this log's read offset
+        self.resume_at = None  # resume_point() of the tailer once the pipeline stopped
+        self.error = None  # Last error reported for this log, so it is not repeated
+
+
+class MonitorPipeline:
+    def __init__(self, sources, make_event, on_events, account_names=None, on_account=None,
+                 on_error=None, on_watching=None, start_at_end=True, follow=True, previous=None):
+        """
+        Initialize the pipeline
+
+        The monitor thread reads new lines from every log and queues the
+        death lines; the queue thread drains everything pending at once,
+        parses it and hands the batch to on_events. One file watcher covers
+        all logs, and each log keeps its own read offset and account. All
+        callbacks run on these worker threads.
+
+        Args:
+            sources: Dictionary of channel name to the path of its Game.log
+            make_event: Callable taking (line, source) and building a DeathEvent from a death line
+            on_events: Callable taking (events, detected_at, keys) for each parsed batch, where
+                       detected_at is the perf_counter time the oldest line was read and keys
+                       holds the untimed_key() of each event without a log timestamp, else None
+            account_names: Dictionary of channel name to an account already known; detection is skipped for those
+            on_account: Callable taking (source, account name) when an account is detected
+            on_error: Callable taking a message when reading a log fails
+            on_watching: Callable taking the file watcher name once watching starts
+            start_at_end: Skip the existing content of the logs and only follow new lines
+            follow: Keep waiting for new lines; if False the pipeline stops once it reached the end of every log
+            previous: Stopped pipeline this one replaces; its threads are waited for on the
+                      monitor thread, and logs both follow continue where it stopped reading
+        """
+        account_names = account_names or {}
+        self.sources = [LogSource(name, path, account_names.get(name)) for name, path in sources.items()]
+        self.make_event = make_event
+        self.on_events = on_events
+        self.on_account = on_account
+        self.on_error = on_error or (lambda message: print(f"[Monitor] {message}"))
+        self.on_watching = on_watching
+        self.start_at_end = start_at_end
+        self.follow = follow
+        self.previous = previous
+
+        self.running = False
+        self.watcher_mode = None  # Name of the active file watcher backend
+        self.line_queue = queue.Queue()
+        self.monitor_thread = None
+        self.queue_thread = None
+
+    def start(self):
+        """Start the monitor and queue threads"""
+        self.running = True
+        self.monitor_thread = threading.Thread(target=self.monitor_log_file, daemon=True)
+        self.monitor_thread.start()
+        self.queue_thread = threading.Thread(target=self.process_queue, daemon=True)
+        self.queue_thread.start()
+
+    def stop(self):
+        """Ask both threads to exit; lines already queued are still processed"""
+        self.running = False
+        self.line_queue.put(QUEUE_STOP)
+
+    def join(self, timeout=None):
+        """Wait for both threads to exit"""
+        for thread in (self.monitor_thread, self.queue_thread):
+            if thread:
+                thread.join(timeout)
+
+    @property
+    def account_names(self):
+        """Dictionary of channel name to its detected or known account"""
+        return {source.name: source.account_name for source in self.sources if source.account_name}
+
+    def set_account(self, source, name):
+        """Record the account detected for a log and report it"""
+        source.account_name = name
+        if self.on_account:
+            self.on_account(source.name, name)
+
+    def monitor_log_file(self):
+        """Follow every log and queue their death lines; runs on the monitor thread"""
+        # Try to detect the account names from the existing log files
+        for source in self.sources:
+            if source.account_name:
+                continue
+            try:
+                print(f"[Info] Searching {source.name} log file for the most recent account login...")
+                detected_name = find_account_name(source.path)
+                if detected_name:
+                    print(f"[Info] Found {source.name} account name from log: {detected_name}")
+                    self.set_account(source, detected_name)
+                else:
+                    print(f"[Info] Account name not found in existing {source.name} log")
+            except Exception as e:
+                print(f"[Warning] Could not scan {source.name} log for account name: {e}")
+
+        # Let the replaced pipeline finish first, so no line is skipped or read twice
+        resume_points = {}
+        if self.previous:
+            self.previous.join()
+            resume_points = {(source.name, source.path): source.resume_at for source in self.previous.sources}
+            self.previous = None
+
+        # Follow each log from its current end, or from where the replaced pipeline stopped
+        for source in self.sources:
+            source.tailer = LogTailer(source.path, start_at_end=self.start_at_end,
+                                      resume_at=resume_points.get((source.name, source.path)))
+
+        # Wake up when any log changes instead of polling at a fixed rate
+        watcher = create_watcher([source.path for source in self.sources])
+        self.watcher_mode = watcher.name
+        print(f"[Info] Watching {len(self.sources)} log file(s) with {self.watcher_mode}")
+        if self.on_watching:
+            self.on_watching(self.watcher_mode)
+
+        # Monitor loop
+        try:
+            while self.running:
+                detected_at = time.perf_counter()
+                for source in self.sources:
+                    self.read_source(source, detected_at)
+
+                if not self.follow:
+                    self.stop()
+                    break
+
+                watcher.wait(timeout=WATCH_TIMEOUT)
+        finally:
+            watcher.close()
+            for source in self.sources:
+                source.resume_at = source.tailer.resume_point()
+                source.tailer.close()
+
+    def read_source(self, source, detected_at):
+        """
+        Queue the death lines appended to one log since the last read
+
+        A log that cannot be read is retried on the next pass without
+        holding up the others; its error is only reported once.
+
+        Args:
+            source: LogSource to read
+            detected_at: perf_counter time this pass over the logs started
+        """
+        try:
+            # Only the lines the pipeline acts on are split out of what was read
+            markers = DEATH_MARKERS if source.account_name else DETECTING_MARKERS
+            for raw_line in source.tailer.read_lines(markers):
+                # Filter lines containing Actor Death before decoding them
+                # Both old and new formats are supported:
+                # Old: <Actor Death> at start of line
+                # New: Contains [Notice] <Actor Death> in the line
+                if death_parser.is_death_line(raw_line):
+                    # Add to queue for processing, with where it was read in case it has no timestamp
+                    line = raw_line.decode('utf-8', errors='ignore').strip()
+                    tailer = source.tailer
+                    self.line_queue.put((line, detected_at, source.name, tailer.identity, tailer.line_offset(raw_line)))
+
+                # Check for account name
+                elif not source.account_name and ACCOUNT_MARKER in raw_line:
+                    detected_name = parse_account_name(raw_line.decode('utf-8', errors='ignore') + "\n")
+                    if detected_name:
+                        print(f"[Info] Detected {source.name} account name: {detected_name}")
+                        self.set_account(source, detected_name)
+            source.error = None
+
+        except FileNotFoundError:
+            self.report_error(source, f"Warning: {source.name} log file not found. Waiting for file to appear.")
+        except PermissionError:
+            self.report_error(source, f"Permission denied while reading {source.name} log file. Retrying...")
+        except Exception as e:
+            self.report_error(source, f"Error monitoring {source.name} log file: {e}")
+
+    def report_error(self, source, message):
+        """Report a read error of a log unless it is the same one as last time"""
+        if message != source.error:
+            source.error = message
+            self.on_error(message)
+
+    def process_queue(self):
+        """Parse queued death lines in batches; runs on the queue thread"""
+        while True:
+            # Block until a line arrives, then drain everything else that is pending
+            item = self.line_queue.get()
+            if item is QUEUE_STOP:
+                break
+
+            batch = [item]
+            stop_requested = False
+            while len(batch) < MAX_BATCH_LINES:
+                try:
+                    item = self.line_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is QUEUE_STOP:
+                    stop_requested = True
+                    break
+                batch.append(item)
+
+            try:
+                self.process_batch(batch)
+            except Exception as e:
+                print(f"Error processing queue: {e}")
+
+            # Checked even if the batch failed, so a stop is never lost
+            if stop_requested:
+                break
+
+    def process_batch(self, batch):
+        """
+        Parse a batch of queued death lines and hand the events to on_events
+
+        Args:
+            batch: List of (line, detected_at, source, identity, offset) tuples in log order
+        """
+        events = []
+        keys = []
+        for line, _, source, identity, offset in batch:
+            event = self.make_event(line, source)
+            events.append(event)
+            keys.append(untimed_key(identity, offset) if not event.timestamp and offset is not None else None)
+        self.on_events(events, batch[0][1], keys)
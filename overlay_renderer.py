@@ -0,0 +1,149 @@
+"""
+Overlay Renderer
+Keeps the overlay Text widget in sync with the visible death events by applying only the changes
+"""
+
+import tkinter as tk
+
+from log_sources import DEFAULT_CHANNEL
+
+PLACEHOLDER_TEXT = "Waiting for death events...\n"
+
+
+def overlay_segments(event):
+    """
+    Build the tagged text segments for one overlay line
+
+    Format: [TIME] PLAYER ☠ by KILLER (WEAPON) - DAMAGE_TYPE @ LOCATION
+    Events from a channel other than LIVE start with [CHANNEL] after the time.
+
+    Args:
+        event: DeathEvent to format
+
+    Returns:
+        Tuple of alternating text and tag values ending with the newline, ready for Text.insert
+    """
+    segments = [f"[{event.display_time}] ", "time_tag"]
+
+    # Channel if not the default one
+    if event.source != DEFAULT_CHANNEL:
+        segments += [f"[{event.source}] ", "time_tag"]
+
+    segments += [
+        f"{event.actor} ", "player_tag",
+        "☠ by ", "symbol_tag",
+        f"{event.killer}", "killer_tag",
+    ]
+
+    # Weapon if available
+    if event.weapon:
+        segments += [f" ({event.weapon_display})", "weapon_tag"]
+
+    # Damage type
+    segments += [f" - {event.damage}", "damage_tag"]
+
+    # Location if available and has a friendly name
+    if event.location_display and event.location_display != event.location:
+        segments += [f" @ {event.location_display}", "location_tag"]
+
+    segments.append("\n")
+    return tuple(segments)
+
+
+class OverlayRenderer:
+    def __init__(self, text_widget):
+        """
+        Initialize the renderer
+
+        Each event occupies exactly one logical line of the widget, so expired
+        events are removed by deleting lines from the top and new events are
+        appended at the bottom without touching the lines in between.
+
+        Args:
+            text_widget: Tk Text widget of the overlay, with its tags configured
+        """
+        self.text = text_widget
+        self._rendered = []
+        self._showing_placeholder = False
+
+    def reset(self):
+        """Forget the rendered state so the next render redraws everything"""
+        self._rendered = []
+        self._showing_placeholder = False
+
+    def render(self, events):
+        """
+        Update the widget to show the given events, oldest first
+
+        Args:
+            events: DeathEvents that should be visible
+
+        Returns:
+            True if the widget was modified, False if it was already up to date
+        """
+        events = list(events)
+
+        if not events:
+            if self._showing_placeholder:
+                return False
+            self._redraw(events)
+            return True
+
+        removed, added = self._diff(events)
+        if removed is None:
+            self._redraw(events)
+            return True
+        if not removed and not added:
+            return False
+
+        self.text.config(state=tk.NORMAL)
+        if removed:
+            self.text.delete("1.0", f"{removed + 1}.0")
+        for event in added:
+            self.text.insert(tk.END, *overlay_segments(event))
+        self.text.config(state=tk.DISABLED)
+
+        self._rendered = events
+        return True
+
+    def _diff(self, events):
+        """
+        Work out how many lines to drop from the top and which events to append
+
+        Returns:
+            Tuple of (lines removed, events added), or (None, None) if the new
+            events are not a continuation of what is shown and need a full redraw
+        """
+        if self._showing_placeholder or not self._rendered:
+            return None, None
+
+        # Find where the first visible event sits among the rendered ones
+        first = events[0]
+        removed = None
+        for index, rendered in enumerate(self._rendered):
+            if rendered is first:
+                removed = index
+                break
+
+        if removed is None:
+            # Every rendered event has expired; only new events remain
+            return None, None
+
+        kept = self._rendered[removed:]
+        if len(kept) > len(events) or any(a is not b for a, b in zip(kept, events)):
+            return None, None
+        return removed, events[len(kept):]
+
+    def _redraw(self, events):
+        """Clear the widget and draw every visible event"""
+        self.text.config(state=tk.NORMAL)
+        self.text.delete("1.0", tk.END)
+        if events:
+            for event in events:
+                self.text.insert(tk.END, *overlay_segments(event))
+        else:
+            self.text.insert(tk.END, PLACEHOLDER_TEXT, "death_line")
+        self.text.config(state=tk.DISABLED)
+
+        self._rendered = events
+        self._showing_placeholder = not events
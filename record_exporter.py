@@ -0,0 +1,177 @@
+"""
+Record Exporter
+Streams death records to CSV, NDJSON or text files on a worker thread
+"""
+
+import csv
+import gzip
+import json
+import os
+import threading
+from itertools import islice
+
+CSV_HEADER = ["Timestamp", "Player", "Killer", "Weapon", "Damage Type", "Location", "Source"]
+
+# DeathEvent fields written to each NDJSON object
+NDJSON_FIELDS = ("timestamp", "actor", "killer", "weapon", "weapon_display",
+                 "damage", "location", "location_display", "source")
+
+# Shared encoder; json.dumps would build a new one per call for non-default options
+JSON_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
+# Bytes buffered before the file object writes to disk
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+def export_format(path):
+    """
+    Work out the export format from a file name
+
+    Args:
+        path: Output file path; a trailing .gz selects gzip compression
+
+    Returns:
+        Tuple of (format, compressed) where format is "csv", "ndjson" or "text"
+    """
+    name = str(path).lower()
+    compressed = name.endswith(".gz")
+    if compressed:
+        name = name[:-3]
+
+    if name.endswith(".csv"):
+        return "csv", compressed
+    if name.endswith(".ndjson") or name.endswith(".jsonl"):
+        return "ndjson", compressed
+    return "text", compressed
+
+
+def csv_row(event):
+    """Build the CSV row for one event"""
+    return [
+        event.timestamp or '',
+        event.actor,
+        event.killer,
+        event.weapon_display,
+        event.damage,
+        event.location_display,
+        event.source
+    ]
+
+
+def ndjson_record(event):
+    """Build the dictionary written as the NDJSON object of one event"""
+    return {field: getattr(event, field) for field in NDJSON_FIELDS}
+
+
+def ndjson_line(event):
+    """Build the NDJSON line for one event"""
+    return JSON_ENCODER.encode(ndjson_record(event)) + "\n"
+
+
+def text_line(event):
+    """Build the plain text line for one event, formatted like the records window"""
+    line = f"[{event.timestamp or 'Unknown'}] {event.actor} killed by {event.killer}"
+    if event.weapon_display:
+        line += f" using {event.weapon_display}"
+    line += f" - {event.damage} @ {event.location_display or 'Unknown'}\n"
+    return line
+
+
+class RecordExporter:
+    def __init__(self, events, path, total=None, on_progress=None, on_done=None, chunk_rows=2000):
+        """
+        Initialize the exporter
+
+        The file is written to a temporary name next to path and only renamed
+        into place once every record was written, so a cancelled or failed
+        export never leaves a partial file behind.
+
+        Args:
+            events: Iterable of DeathEvents, pulled lazily as the export runs
+            path: Output file path; the format comes from its extension
+            total: Expected number of events, used for progress reporting
+            on_progress: Callable taking (written, total), called after every chunk
+            on_done: Callable taking (written, error, cancelled), called once at the end
+            chunk_rows: Number of events formatted and written together
+        """
+        self.events = events
+        self.path = str(path)
+        self.total = total
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.chunk_rows = chunk_rows
+        self.format, self.compressed = export_format(self.path)
+
+        self.written = 0
+        self.thread = None
+        self._cancel_event = threading.Event()
+
+    @property
+    def cancelled(self):
+        """True once cancel() was called"""
+        return self._cancel_event.is_set()
+
+    def start(self):
+        """Run the export on a daemon worker thread"""
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def cancel(self):
+        """Ask the export to stop after the current chunk"""
+        self._cancel_event.set()
+
+    def run(self):
+        """
+        Write every event to the output file; runs on the calling thread
+
+        Returns:
+            Number of events written
+        """
+        temp_path = self.path + ".part"
+        error = None
+
+        try:
+            with self._open(temp_path) as output:
+                self._write_all(output)
+            if self.cancelled:
+                os.remove(temp_path)
+            else:
+                os.replace(temp_path, self.path)
+        except Exception as e:
+            error = e
+            print(f"[Export] Error exporting records: {e}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+        if self.on_done:
+            self.on_done(self.written, error, self.cancelled)
+        return self.written
+
+    def _open(self, path):
+        """Open the output stream for text writes with a large buffer"""
+        if self.compressed:
+            return gzip.open(path, 'wt', encoding='utf-8', newline='', compresslevel=6)
+        return open(path, 'w', encoding='utf-8', newline='', buffering=WRITE_BUFFER_SIZE)
+
+    def _write_all(self, output):
+        """Write the header and then the events chunk by chunk until done or cancelled"""
+        if self.format == "csv":
+            writer = csv.writer(output)
+            writer.writerow(CSV_HEADER)
+            write_chunk = lambda chunk: writer.writerows(map(csv_row, chunk))
+        elif self.format == "ndjson":
+            write_chunk = lambda chunk: output.write("".join(map(ndjson_line, chunk)))
+        else:
+            write_chunk = lambda chunk: output.write("".join(map(text_line, chunk)))
+
+        events = iter(self.events)
+        while not self.cancelled:
+            chunk = list(islice(events, self.chunk_rows))
+            if not chunk:
+                break
+            write_chunk(chunk)
+            self.written += len(chunk)
+            if self.on_progress:
+                self.on_progress(self.written, self.total)
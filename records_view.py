@@ -0,0 +1,188 @@
+"""
+Records View
+Virtualized table for the Death Records window that only formats the rows on screen
+"""
+
+import tkinter as tk
+from tkinter import ttk
+from functools import lru_cache
+
+# Column id, heading and initial width
+RECORD_COLUMNS = (
+    ("time", "Time", 140),
+    ("player", "Player", 130),
+    ("killer", "Killer", 130),
+    ("weapon", "Weapon", 160),
+    ("damage", "Damage", 110),
+    ("location", "Location", 200),
+    ("source", "Source", 60),
+)
+
+DEFAULT_ROW_HEIGHT = 20
+
+
+@lru_cache(maxsize=4096)
+def record_values(event):
+    """
+    Build the cell values of one records row
+
+    Args:
+        event: DeathEvent to format
+
+    Returns:
+        Tuple of strings, one per column of RECORD_COLUMNS
+    """
+    return (
+        event.display_datetime,
+        event.actor,
+        event.killer,
+        event.weapon_display or "",
+        event.damage,
+        event.location_display or "Unknown",
+        event.source,
+    )
+
+
+class RecordsView:
+    def __init__(self, parent, row_count, fetch_rows):
+        """
+        Initialize the view inside the given parent frame
+
+        The Treeview only ever holds as many items as fit in the viewport.
+        Scrolling moves a window over the records and rewrites the values of
+        those few items, so the cost of a refresh does not grow with the
+        number of records.
+
+        Args:
+            parent: Frame the table and its scrollbars are packed into
+            row_count: Callable returning the total number of records
+            fetch_rows: Callable taking (offset, limit) and returning that slice of records
+        """
+        self.row_count = row_count
+        self.fetch_rows = fetch_rows
+
+        self.first = 0
+        self.total = 0
+        self.follow = True  # Stick to the newest records while scrolled to the bottom
+        self._items = []
+        self._shown = []
+
+        style = ttk.Style(parent)
+        self.row_height = style.lookup("Treeview", "rowheight") or DEFAULT_ROW_HEIGHT
+        try:
+            self.row_height = int(self.row_height)
+        except (TypeError, ValueError):
+            self.row_height = DEFAULT_ROW_HEIGHT
+
+        self.y_scrollbar = ttk.Scrollbar(parent, command=self.yview)
+        self.y_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.x_scrollbar = ttk.Scrollbar(parent, orient=tk.HORIZONTAL)
+        self.x_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+
+        self.tree = ttk.Treeview(
+            parent,
+            columns=[column for column, _, _ in RECORD_COLUMNS],
+            show="headings",
+            selectmode="none",
+            xscrollcommand=self.x_scrollbar.set
+        )
+        for column, heading, width in RECORD_COLUMNS:
+            self.tree.heading(column, text=heading, anchor=tk.W)
+            self.tree.column(column, width=width, minwidth=60, anchor=tk.W, stretch=True)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.x_scrollbar.config(command=self.tree.xview)
+
+        # Recompute the viewport whenever the window is resized
+        self.tree.bind("<Configure>", self._on_resize)
+
+        # Mouse wheel scrolling (Windows/macOS and X11)
+        self.tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.tree.bind("<Button-4>", lambda e: self.scroll(-3))
+        self.tree.bind("<Button-5>", lambda e: self.scroll(3))
+
+    @property
+    def visible_rows(self):
+        """Number of rows the viewport currently shows"""
+        return len(self._items)
+
+    def refresh(self):
+        """
+        Pick up new or removed records and redraw the viewport
+
+        New records are appended below the current window; if the view was
+        scrolled to the bottom it keeps following the newest record.
+        """
+        self.total = self.row_count()
+        if self.follow:
+            self.first = max(0, self.total - self.visible_rows)
+        self._draw()
+
+    def scroll(self, rows):
+        """
+        Move the viewport by a number of rows
+
+        Args:
+            rows: Rows to move; negative values scroll up
+        """
+        self._move_to(self.first + rows)
+
+    def yview(self, *args):
+        """Scrollbar command handler for 'moveto' and 'scroll' requests"""
+        if not args:
+            return
+        if args[0] == "moveto":
+            self._move_to(int(round(float(args[1]) * self.total)))
+        elif args[0] == "scroll":
+            amount = int(args[1])
+            if len(args) > 2 and args[2] == "pages":
+                amount *= max(1, self.visible_rows - 1)
+            self.scroll(amount)
+
+    def _move_to(self, first):
+        """Place the given record at the top of the viewport"""
+        last_start = max(0, self.total - self.visible_rows)
+        self.first = min(max(0, first), last_start)
+        self.follow = self.first >= last_start
+        self._draw()
+
+    def _on_mousewheel(self, event):
+        """Scroll three rows per wheel notch"""
+        if event.delta:
+            self.scroll(-3 if event.delta > 0 else 3)
+        return "break"
+
+    def _on_resize(self, event):
+        """Resize the pool of Treeview items to the new viewport height"""
+        # One row is taken by the column headings
+        rows = max(1, event.height // self.row_height - 1)
+        if rows == len(self._items):
+            return
+
+        while len(self._items) < rows:
+            self._items.append(self.tree.insert("", tk.END, values=()))
+            self._shown.append(None)
+        while len(self._items) > rows:
+            self.tree.delete(self._items.pop())
+            self._shown.pop()
+
+        self.refresh()
+
+    def _draw(self):
+        """Write the records in the viewport into the item pool"""
+        rows = self.fetch_rows(self.first, self.visible_rows) if self.total else []
+
+        for index, item in enumerate(self._items):
+            event = rows[index] if index < len(rows) else None
+            # Leave items that already show this record untouched
+            if event == self._shown[index]:
+                continue
+            self._shown[index] = event
+            self.tree.item(item, values=record_values(event) if event is not None else ())
+
+        if self.total:
+            start = self.first / self.total
+            end = min(self.total, self.first + self.visible_rows) / self.total
+            self.y_scrollbar.set(start, end)
+        else:
+            self.y_scrollbar.set(0.0, 1.0)
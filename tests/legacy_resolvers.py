@@ -0,0 +1,116 @@
+"""
+Legacy Resolvers
+The lookups get_weapon_name and get_location_name used to perform, and queries covering every table entry;
+test_resolvers.py checks the resolvers against them and benchmarks/bench_resolvers.py times them
+"""
+
+import random
+import re
+
+from test_log_generator import LOCATIONS, WEAPONS
+from weapon_resolver import weapon_aliases
+
+
+def legacy_get_weapon_name(weapon_ids, weapon_id):
+    """The lookup get_weapon_name used to perform"""
+    if not weapon_id:
+        return None
+    if weapon_id in weapon_ids:
+        return weapon_ids[weapon_id]
+    weapon_id_lower = weapon_id.lower()
+    if weapon_id_lower in weapon_ids:
+        return weapon_ids[weapon_id_lower]
+    base_id = re.sub(r'_\d+$', '', weapon_id)
+    if base_id in weapon_ids:
+        return weapon_ids[base_id]
+    return weapon_id
+
+
+def legacy_expand_weapon_ids(weapon_ids):
+    """Rebuild the duplicated table update_weapon_ids used to write"""
+    expanded = {}
+    for code_name, display_name in weapon_ids.items():
+        expanded[code_name] = display_name
+        for alias in weapon_aliases(code_name):
+            expanded.setdefault(alias, display_name)
+    return expanded
+
+
+def weapon_queries(weapon_ids, seed=1234):
+    """
+    Build weapon IDs covering every key with the instance suffixes seen in real logs
+
+    Returns:
+        List of weapon IDs
+    """
+    random.seed(seed)
+    queries = list(WEAPONS) + ["", "unknown_weapon", "unknown_weapon_123"]
+    for key in weapon_ids:
+        suffix = str(random.randint(100000000000, 9999999999999))
+        queries.extend([key, key.upper(), f"{key}_{suffix}", f"{key.lower()}_{suffix}", f"{key.upper()}_{suffix}"])
+    return queries
+
+
+def legacy_get_location_name(location_ids, location_id):
+    """The linear-scan lookup get_location_name used to perform"""
+    if not location_id:
+        return None
+    if location_id in location_ids:
+        return location_ids[location_id]
+    location_id_lower = location_id.lower()
+    if location_id_lower in location_ids:
+        return location_ids[location_id_lower]
+    clean_id = re.sub(r'_\d+$', '', location_id_lower)
+    if clean_id in location_ids:
+        return location_ids[clean_id]
+    if len(location_ids) > 0:
+        manufacturer_match = re.match(r'^([a-zA-Z]+)_', location_id_lower)
+        if manufacturer_match:
+            manufacturer = manufacturer_match.group(1).upper()
+            for key, value in location_ids.items():
+                if key.upper().startswith(manufacturer):
+                    key_parts = key.lower().split('_')[1:]
+                    loc_parts = location_id_lower.split('_')[1:]
+                    if any(part in loc_parts for part in key_parts):
+                        return value
+        words = re.findall(r'[a-z]+', location_id_lower)
+        for key, value in location_ids.items():
+            for word in words:
+                if len(word) < 4 or word in ['the', 'and', 'ship', 'area', 'zone']:
+                    continue
+                if word in ['aegs', 'aegis', 'misc', 'drak', 'anvl']:
+                    if word in key.lower():
+                        return value
+                if word in key.lower():
+                    return value
+    display_name = location_id
+    if '_' in display_name:
+        display_name = re.sub(r'_\d+$', '', display_name)
+        display_name = ' '.join(word.capitalize() for word in display_name.split('_'))
+    return display_name
+
+
+def location_queries(location_ids, seed=1234):
+    """
+    Build zone IDs covering every key plus the variants seen in real logs
+
+    Returns:
+        List of zone IDs
+    """
+    random.seed(seed)
+    queries = list(LOCATIONS) + ["", "Unknown", "zone", "XXXX_unmatched_0001"]
+    for key in location_ids:
+        suffix = str(random.randint(100000000000, 9999999999999))
+        parts = key.split('_')
+        random.shuffle(parts)
+        queries.extend([
+            key,
+            key.upper(),
+            f"{key}_{suffix}",
+            f"{key.upper()}_{suffix}",
+            "_".join(parts),
+            f"MISC_{parts[-1]}_{suffix}",
+            f"{parts[0]}_Unlisted_Variant_{suffix}",
+            f"Hangar_{key}_Interior",
+        ])
+    return queries
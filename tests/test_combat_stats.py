@@ -0,0 +1,45 @@
+"""
+Combat Statistics Tests
+Checks what CombatStats keeps when the account is detected or changes
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from combat_stats import CombatStats
+from death_event import DeathEvent
+
+
+def death(actor, killer, damage="Bullet"):
+    """Build a DeathEvent with only the fields the statistics read"""
+    return DeathEvent("2025-01-01T00:00:00.000Z", actor, killer, "Gun", damage, "Zone", "Gun", "Zone",
+                      "00:00:00", "2025-01-01 00:00:00", "", "LIVE")
+
+
+class AccountChangeTest(unittest.TestCase):
+    def test_events_before_detection_are_kept_but_not_classified(self):
+        stats = CombatStats()
+        stats.add_events([death("Pilot", "Other"), death("Other", "Pilot")], None)
+        stats.add_events([death("Other", "Pilot")], "Pilot")
+
+        snapshot = stats.snapshot()
+        self.assertEqual(snapshot["account"], "Pilot")
+        self.assertEqual(snapshot["events"], 3)
+        self.assertEqual((snapshot["kills"], snapshot["deaths"]), (1, 0))
+
+    def test_other_account_restarts_the_counters(self):
+        stats = CombatStats()
+        stats.add_events([death("Other", "Pilot"), death("Pilot", "Other")], "Pilot")
+        stats.add_events([death("Pilot", "Second")], "Second")
+
+        snapshot = stats.snapshot()
+        self.assertEqual(snapshot["account"], "Second")
+        self.assertEqual(snapshot["events"], 1)
+        self.assertEqual((snapshot["kills"], snapshot["deaths"]), (1, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+Discord Outbox Tests
+Checks that the journal compacts while it is open for appending, the way Windows requires
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import discord_outbox
+from discord_outbox import COMPACT_AFTER_LINES, DiscordOutbox
+
+
+def death_record(index):
+    """Build a journal record with a unique event key"""
+    return {"timestamp": f"2025-01-01T00:{index // 60:02d}:{index % 60:02d}.000Z",
+            "actor": f"Victim{index}", "killer": "Pilot", "damage": "Bullet"}
+
+
+class OutboxCompactionTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "discord_outbox.jsonl")
+        self.outbox = DiscordOutbox(self.path)
+        self.replace = os.replace
+        discord_outbox.print = lambda *args, **kwargs: None
+
+    def tearDown(self):
+        self.outbox.close()
+        del discord_outbox.print
+        self.temp_dir.cleanup()
+
+    def windows_replace(self, source, target):
+        """os.replace that fails like Windows while the journal is still open"""
+        journal = self.outbox._journal
+        if journal is not None and not journal.closed:
+            raise PermissionError(13, "The process cannot access the file because it is being used")
+        self.replace(source, target)
+
+    def send(self, count, first=0):
+        """Queue records and acknowledge them one at a time, like the sender does"""
+        for index in range(first, first + count):
+            self.outbox.add(death_record(index))
+            self.outbox.ack([key for key, _ in self.outbox.peek(1)])
+
+    def journal_lines(self):
+        with open(self.path, 'r', encoding='utf-8') as file:
+            return sum(1 for _ in file)
+
+    def test_compacts_while_journal_is_open(self):
+        # Each sent record writes an add and a done line, so this crosses the threshold once
+        sent = COMPACT_AFTER_LINES // 2 + 10
+        with mock.patch.object(discord_outbox.os, "replace", self.windows_replace):
+            self.send(sent)
+            self.outbox.add(death_record(sent))
+
+        # The compacted journal dropped the add lines of the records sent before it ran
+        self.assertLess(self.journal_lines(), 2 * sent)
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+        # The reopened journal keeps working and replays to the same state
+        self.outbox.close()
+        reopened = DiscordOutbox(self.path)
+        try:
+            self.assertEqual([record for _, record in reopened.peek(10)], [death_record(sent)])
+        finally:
+            reopened.close()
+
+    def test_failed_replace_is_not_retried_on_every_ack(self):
+        calls = []
+
+        def failing_replace(source, target):
+            calls.append(target)
+            raise PermissionError(13, "Access is denied")
+
+        # Crosses the threshold once, then acks another 100 records
+        with mock.patch.object(discord_outbox.os, "replace", failing_replace):
+            self.send(COMPACT_AFTER_LINES // 2 + 100)
+
+        self.assertEqual(len(calls), 1)
+        self.assertFalse(os.path.exists(self.path + ".tmp"))
+
+        # The journal is still appended to after the failed compaction
+        self.outbox.add(death_record(COMPACT_AFTER_LINES))
+        self.outbox.close()
+        reopened = DiscordOutbox(self.path)
+        try:
+            self.assertEqual(len(reopened), 1)
+        finally:
+            reopened.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+"""
+Event Server Tests
+Checks that the overlay server only answers requests addressed to it by a local host name
+"""
+
+import socket
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import event_server
+from event_server import EventServer
+
+
+class HostHeaderTest(unittest.TestCase):
+    def setUp(self):
+        event_server.print = lambda *args, **kwargs: None
+        self.server = EventServer(port=0)
+        self.server.start()
+
+    def tearDown(self):
+        self.server.stop()
+        del event_server.print
+
+    def request(self, path, host):
+        """Send a GET request with the given Host header and return the status code"""
+        with socket.create_connection(("127.0.0.1", self.server.port), timeout=5) as sock:
+            sock.sendall(f"GET {path} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode('ascii'))
+            response = b""
+            while b"\r\n" not in response:
+                chunk = sock.recv(4096)
+                if not chunk:
+                    break
+                response += chunk
+        return int(response.split(b" ", 2)[1])
+
+    def test_local_hosts_are_answered(self):
+        port = self.server.port
+        for host in (f"localhost:{port}", f"127.0.0.1:{port}", f"[::1]:{port}", f"LocalHost:{port}"):
+            self.assertEqual(self.request("/", host), 200, host)
+            self.assertEqual(self.request("/recent", host), 200, host)
+
+    def test_foreign_host_is_refused(self):
+        # A rebound DNS name resolves to 127.0.0.1 but keeps its own name in the Host header
+        port = self.server.port
+        for host in (f"attacker.example:{port}", "attacker.example", f"localhost:{port + 1}", "localhost"):
+            self.assertEqual(self.request("/", host), 421, host)
+            self.assertEqual(self.request("/recent", host), 421, host)
+
+
+if __name__ == "__main__":
+    unittest.main()
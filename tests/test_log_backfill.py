@@ -0,0 +1,108 @@
+"""
+Log Backfill Tests
+Checks that backfilling a log the monitor already tailed stores none of its deaths twice,
+including old-format deaths that carry no timestamp
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import death_parser
+import log_backfill
+import monitor_pipeline
+from death_event import create_death_event
+from event_store import EventStore
+from log_backfill import backfill
+from log_tailer import LogTailer
+from monitor_pipeline import MonitorPipeline
+
+NEW_DEATH = ("<2025-04-25T18:02:{second:02d}.301Z> [Notice] <Actor Death> CActor::Kill: 'Voisys' [201996731201] "
+             "in zone 'AEGS_Gladius_2984839923201' killed by 'Lsync' [201964490332] using "
+             "'KLWE_LaserRepeater_S3_2984839923407' [Class unknown] with damage type 'VehicleDestruction' "
+             "from direction x: 0.000000, y: 0.000000, z: 0.000000 [Team_ActorTech][Actor]")
+OLD_DEATH = "<Actor Death> 'Player' [12345] in zone 'Location' killed by 'Killer' with damage type 'Bullet'"
+
+
+def write_log(path, newline="\n"):
+    """Write a log mixing both formats, with the same old-format death repeated"""
+    lines = ["<2025-04-25T18:00:00.000Z> Log started on Tuesday", "<2025-04-25T18:00:01.000Z> Loading"]
+    for second in range(3):
+        lines += [OLD_DEATH, NEW_DEATH.format(second=second), "<2025-04-25T18:02:30.000Z> Unrelated line"]
+    with open(path, 'w', encoding='utf-8', newline="") as file:
+        file.write(newline.join(lines) + newline)
+    return lines
+
+
+def make_event(line, source="LIVE"):
+    """Build a DeathEvent without resolving names"""
+    return create_death_event(line, death_parser.parse_death_line(line), str, str, source)
+
+
+class TailThenBackfillTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "Game.log")
+        self.store = EventStore(os.path.join(self.temp_dir.name, "events.db"))
+        for module in (log_backfill, monitor_pipeline):
+            module.print = lambda *args, **kwargs: None
+
+    def tearDown(self):
+        self.store.close()
+        for module in (log_backfill, monitor_pipeline):
+            del module.print
+        self.temp_dir.cleanup()
+
+    def tail(self):
+        """Read the whole log through the pipeline into the store, the way the monitor does"""
+        pipeline = MonitorPipeline({"LIVE": self.path}, make_event,
+                                   lambda events, detected_at, keys: self.store.append(events, keys),
+                                   account_names={"LIVE": "Voisys"}, start_at_end=False, follow=False)
+        pipeline.start()
+        pipeline.join(10)
+        return self.store.count()
+
+    def check_tail_then_backfill(self, newline):
+        write_log(self.path, newline)
+
+        # Every death is stored, the repeated old-format ones told apart by their offset
+        self.assertEqual(self.tail(), 6)
+
+        summary = backfill([self.path], self.store, lambda line, parsed: make_event(line), workers=1)
+        self.assertEqual(summary.deaths, 6)
+        self.assertEqual(summary.stored, 0)
+        self.assertEqual(self.store.count(), 6)
+
+    def test_backfill_after_tailing(self):
+        self.check_tail_then_backfill("\n")
+
+    def test_backfill_after_tailing_windows_line_endings(self):
+        self.check_tail_then_backfill("\r\n")
+
+
+class TailerLineOffsetTest(unittest.TestCase):
+    def test_offsets_across_chunks(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "Game.log")
+            lines = write_log(path, "\r\n")
+            expected = []
+            offset = 0
+            for line in lines:
+                expected.append(offset)
+                offset += len(line) + 2
+
+            # Small chunks split most lines, so many are joined from the pending bytes
+            tailer = LogTailer(path, chunk_size=37, start_at_end=False)
+            try:
+                offsets = [tailer.line_offset(raw_line) for raw_line in tailer.read_lines()]
+            finally:
+                tailer.close()
+            self.assertEqual(offsets, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
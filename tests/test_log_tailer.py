@@ -0,0 +1,98 @@
+"""
+Log Tailer Tests
+Checks that LogTailer notices a log rewritten in place, how often it reads the header to do so,
+and that it picks out the lines holding a marker
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import log_tailer
+from log_tailer import LogTailer
+
+
+class TailerRotationTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "Game.log")
+        log_tailer.print = lambda *args, **kwargs: None
+
+    def tearDown(self):
+        del log_tailer.print
+        self.temp_dir.cleanup()
+
+    def write(self, text, mode='a'):
+        with open(self.path, mode, encoding='utf-8') as file:
+            file.write(text)
+
+    def test_rewritten_log_is_read_from_the_start(self):
+        self.write("<2025-01-01T00:00:00.000Z> First session\nold line\n", 'w')
+        tailer = LogTailer(self.path, start_at_end=False, fingerprint_interval=0.0)
+        try:
+            self.assertEqual(list(tailer.read_lines()), [b"<2025-01-01T00:00:00.000Z> First session", b"old line"])
+
+            # Truncated and written past our offset before the next poll
+            self.write("<2025-01-02T00:00:00.000Z> Second session\nnew line\n", 'w')
+            self.assertEqual(list(tailer.read_lines()), [b"<2025-01-02T00:00:00.000Z> Second session", b"new line"])
+            self.assertEqual(tailer.rotations, 1)
+        finally:
+            tailer.close()
+
+    def test_header_is_read_once_per_interval(self):
+        self.write("<2025-01-01T00:00:00.000Z> Session\n", 'w')
+        tailer = LogTailer(self.path, start_at_end=False, fingerprint_interval=60.0)
+        try:
+            list(tailer.read_lines())
+            with mock.patch.object(tailer, "_read_own_fingerprint", wraps=tailer._read_own_fingerprint) as header:
+                for index in range(50):
+                    self.write(f"line {index}\n")
+                    self.assertEqual(list(tailer.read_lines()), [f"line {index}".encode()])
+                self.assertEqual(header.call_count, 0)
+
+                # Once the interval has passed, the next growth compares the header again
+                tailer._last_fingerprint_check -= 60.0
+                self.write("last line\n")
+                list(tailer.read_lines())
+                self.assertEqual(header.call_count, 1)
+        finally:
+            tailer.close()
+
+
+class TailerMarkerTest(unittest.TestCase):
+    def test_marked_lines_match_a_full_read(self):
+        markers = (b"<Actor Death>", b"<AccountLogin")
+        lines = [b"<2025-01-01T00:00:00.000Z> Log started"]
+        for index in range(40):
+            lines += [f"<Actor Death> 'Victim{index}' killed".encode(), b"unrelated",
+                      b"<AccountLogin> <Actor Death> both markers", b"", b"<Actor Death> last"]
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "Game.log")
+            with open(path, 'wb') as file:
+                file.write(b"\r\n".join(lines) + b"\r\n")
+
+            # Small chunks split most lines between reads
+            tailer = LogTailer(path, chunk_size=29, start_at_end=False)
+            try:
+                marked = [(raw_line, tailer.line_offset(raw_line)) for raw_line in tailer.read_lines(markers)]
+            finally:
+                tailer.close()
+
+        offsets = []
+        offset = 0
+        for line in lines:
+            offsets.append(offset)
+            offset += len(line) + 2
+        expected = [(line, offset) for line, offset in zip(lines, offsets)
+                    if any(marker in line for marker in markers)]
+        self.assertEqual(marked, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Monitor Pipeline Tests
+Checks that a pipeline replacing a running one continues its logs without skipping or repeating lines
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import death_parser
+import monitor_pipeline
+from monitor_pipeline import MonitorPipeline
+
+DEATH_LINE = ("<2025-04-25T18:02:17.301Z> [Notice] <Actor Death> CActor::Kill: 'Victim{index}' [201996731201] "
+              "in zone 'Zone' killed by 'Pilot' [201964490332] using 'Gun' [Class unknown] with damage type 'Bullet'")
+
+
+class ReplacePipelineTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "Game.log")
+        with open(self.path, 'w', encoding='utf-8') as file:
+            file.write("<2025-04-25T18:00:00.000Z> Log started\n")
+        self.actors = []
+        self.received = threading.Condition()
+        self.written = 0
+        monitor_pipeline.print = lambda *args, **kwargs: None
+
+    def tearDown(self):
+        del monitor_pipeline.print
+        self.temp_dir.cleanup()
+
+    def on_events(self, events, detected_at, keys):
+        with self.received:
+            self.actors.extend(event.actor for event in events)
+            self.received.notify_all()
+
+    def pipeline(self, previous=None):
+        pipeline = MonitorPipeline({"LIVE": self.path}, lambda line, source: death_parser.parse_death_line(line),
+                                   self.on_events, account_names={"LIVE": "Pilot"}, previous=previous)
+        pipeline.start()
+        return pipeline
+
+    def write_deaths(self, count):
+        with open(self.path, 'a', encoding='utf-8') as file:
+            for _ in range(count):
+                file.write(DEATH_LINE.format(index=self.written) + "\n")
+                self.written += 1
+
+    def wait_for_all(self):
+        with self.received:
+            self.received.wait_for(lambda: len(self.actors) >= self.written, timeout=10)
+
+    def test_replacement_continues_where_the_old_pipeline_stopped(self):
+        first = self.pipeline()
+        # Let the first pipeline open the log at its end before anything is written
+        while first.sources[0].tailer is None or first.sources[0].tailer.resume_point() is None:
+            time.sleep(0.01)
+        self.write_deaths(5)
+        self.wait_for_all()
+
+        # Lines written while the session switches over are read by the new pipeline
+        first.stop()
+        self.write_deaths(5)
+        second = self.pipeline(previous=first)
+        self.write_deaths(5)
+        self.wait_for_all()
+        second.stop()
+        second.join(5)
+
+        self.assertEqual(self.actors, [f"Victim{index}" for index in range(15)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+"""
+Resolver Parity Tests
+Checks that LocationResolver and WeaponResolver give the same names as the old linear lookups
+over every entry of location_ids.json and weapon_ids.json
+"""
+
+import json
+import sys
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from legacy_resolvers import (legacy_expand_weapon_ids, legacy_get_location_name, legacy_get_weapon_name,
+                              location_queries, weapon_queries)
+from location_resolver import LocationResolver
+from weapon_resolver import WeaponResolver
+
+
+def load_table(name):
+    """Load one of the shipped ID tables"""
+    with open(ROOT / name, 'r', encoding='utf-8') as file:
+        return json.load(file)
+
+
+class LocationResolverTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.location_ids = load_table("location_ids.json")
+        cls.queries = location_queries(cls.location_ids)
+
+    def test_matches_legacy_lookup(self):
+        resolver = LocationResolver(self.location_ids)
+        for query in self.queries:
+            if query:
+                self.assertEqual(resolver._resolve(query), legacy_get_location_name(self.location_ids, query), query)
+
+    def test_cached_answers_match_legacy_lookup(self):
+        resolver = LocationResolver(self.location_ids)
+        for query in self.queries:
+            resolver.resolve(query)
+        for query in self.queries:
+            self.assertEqual(resolver.resolve(query), legacy_get_location_name(self.location_ids, query), query)
+
+
+class WeaponResolverTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.weapon_ids = load_table("weapon_ids.json")
+        cls.expanded = legacy_expand_weapon_ids(cls.weapon_ids)
+        cls.queries = weapon_queries(cls.weapon_ids)
+
+    def test_matches_legacy_lookup(self):
+        resolver = WeaponResolver(self.weapon_ids)
+        for query in self.queries:
+            if query:
+                self.assertEqual(resolver._resolve(query), legacy_get_weapon_name(self.expanded, query), query)
+
+    def test_cached_answers_match_legacy_lookup(self):
+        resolver = WeaponResolver(self.weapon_ids)
+        for query in self.queries:
+            resolver.resolve(query)
+        for query in self.queries:
+            self.assertEqual(resolver.resolve(query), legacy_get_weapon_name(self.expanded, query), query)
+
+
+if __name__ == "__main__":
+    unittest.main()
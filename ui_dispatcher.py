@@ -0,0 +1,114 @@
+"""
+UI Dispatcher
+Marshals updates from background threads onto the Tk main loop at a bounded frame rate
+"""
+
+import threading
+import time
+
+
+class UIDispatcher:
+    def __init__(self, root, max_fps=30):
+        """
+        Initialize the dispatcher
+
+        Background threads never touch Tk widgets. They publish immutable events
+        or post keyed updates here, and everything pending is applied together
+        in one root.after callback per frame. Keyed updates are coalesced, so
+        only the latest update for each key runs.
+
+        Args:
+            root: Tk root window whose main loop applies the updates
+            max_fps: Maximum number of flushes per second
+        """
+        self.root = root
+        self.frame_interval = 1.0 / max_fps
+        self.event_handler = None
+
+        self._lock = threading.Lock()
+        self._events = []
+        self._oldest_detected_at = None
+        self._updates = {}
+        self._scheduled = False
+        self._last_flush = 0.0
+
+        # Time spent applying updates on the UI thread
+        self.busy_seconds = 0.0
+        self.flush_count = 0
+
+    def set_event_handler(self, handler):
+        """
+        Set the callback that receives published events on the UI thread
+
+        Args:
+            handler: Callable taking (events, detected_at) where detected_at is the
+                     perf_counter time the oldest event was detected, or None
+        """
+        self.event_handler = handler
+
+    def publish_events(self, events, detected_at=None):
+        """
+        Queue immutable events for the UI thread; safe to call from any thread
+
+        Args:
+            events: List of immutable event objects
+            detected_at: perf_counter time the events were detected in the log
+        """
+        with self._lock:
+            self._events.extend(events)
+            if detected_at is not None and (self._oldest_detected_at is None or
+                                            detected_at < self._oldest_detected_at):
+                self._oldest_detected_at = detected_at
+            self._schedule()
+
+    def post(self, key, callback, *args, **kwargs):
+        """
+        Run a callback on the UI thread, replacing any pending update with the same key
+
+        Args:
+            key: Name used to coalesce repeated updates
+            callback: Callable run on the UI thread
+        """
+        with self._lock:
+            self._updates[key] = (callback, args, kwargs)
+            self._schedule()
+
+    def _schedule(self):
+        """Arm a single flush for the next frame; caller must hold the lock"""
+        if self._scheduled:
+            return
+        self._scheduled = True
+
+        wait = self.frame_interval - (time.perf_counter() - self._last_flush)
+        delay_ms = max(0, int(wait * 1000))
+        try:
+            self.root.after(delay_ms, self._flush)
+        except RuntimeError:
+            # The main loop has already shut down
+            self._scheduled = False
+
+    def _flush(self):
+        """Apply everything pending; runs on the UI thread"""
+        began = time.perf_counter()
+
+        with self._lock:
+            events, self._events = self._events, []
+            detected_at, self._oldest_detected_at = self._oldest_detected_at, None
+            updates, self._updates = self._updates, {}
+            self._scheduled = False
+            self._last_flush = began
+
+        if events and self.event_handler:
+            try:
+                self.event_handler(events, detected_at)
+            except Exception as e:
+                print(f"[UI] Error handling events: {e}")
+
+        for callback, args, kwargs in updates.values():
+            try:
+                callback(*args, **kwargs)
+            except Exception as e:
+                print(f"[UI] Error applying update: {e}")
+
+        self.busy_seconds += time.perf_counter() - began
+        self.flush_count += 1
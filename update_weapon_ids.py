@@ -68,7 +68,7 @@ def generate_weapon_mapping(weapons):
         weapons: List of weapon dictionaries from API
 
     Returns:
-        Dictionary mapping weapon codes to friendly names
+        Dictionary mapping weapon codes to friendly names, one entry per code name
     """
     if not weapons:
         return {}
@@ -89,18 +89,9 @@ def generate_weapon_mapping(weapons):
         display_name = clean_weapon_name(friendly_name) if friendly_name else code_name
 
         # Store the mapping - use code name as key
+        # Lowercase and base-name variants are derived by WeaponResolver at load time
         weapon_mapping[code_name] = display_name
 
-        # Also store lowercase version for case-insensitive matching
-        weapon_mapping[code_name.lower()] = display_name
-
-        # Extract base name without variant suffixes for matching log entries
-        # Example: KLWE_LaserRepeater_S3_Banu -> KLWE_LaserRepeater_S3
-        base_name = re.sub(r'_[A-Z][a-z]+\d*$', '', code_name)
-        if base_name != code_name and base_name:
-            weapon_mapping[base_name] = display_name
-            weapon_mapping[base_name.lower()] = display_name
-
     print(f"[OK] Generated {len(weapon_mapping)} weapon ID mappings")
     return weapon_mapping
 
@@ -0,0 +1,126 @@
+"""
+Visible Window
+The death events currently shown in the overlay, expired by a single timer set for the next deadline
+"""
+
+import time
+from collections import deque
+
+
+class VisibleWindow:
+    def __init__(self, root, on_expire, max_lines=5, ttl_seconds=120.0):
+        """
+        Initialize an empty window
+
+        Events are kept in arrival order, so the oldest one always expires
+        first. Only one root.after timer is armed, for the moment the oldest
+        event expires; there is no periodic polling.
+
+        Args:
+            root: Tk root whose main loop runs the expiry timer
+            on_expire: Callable run on the UI thread after events expired
+            max_lines: Maximum number of events kept
+            ttl_seconds: Seconds an event stays visible
+        """
+        self.root = root
+        self.on_expire = on_expire
+        self.max_lines = max_lines
+        self.ttl_seconds = ttl_seconds
+
+        self._entries = deque()  # (added_at, event), oldest first
+        self._timer = None
+        self._timer_deadline = None
+
+    def __iter__(self):
+        return (event for _, event in self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def configure(self, max_lines=None, ttl_seconds=None):
+        """
+        Change the limits; they apply to the events already shown as well
+
+        Args:
+            max_lines: New maximum number of events, or None to keep the current one
+            ttl_seconds: New visibility time in seconds, or None to keep the current one
+
+        Returns:
+            True if events were removed
+        """
+        if max_lines is not None:
+            self.max_lines = max_lines
+        if ttl_seconds is not None:
+            self.ttl_seconds = ttl_seconds
+
+        removed = self._trim()
+        removed = self._expire(time.monotonic()) or removed
+        self._schedule()
+        return removed
+
+    def extend(self, events):
+        """
+        Show new events, dropping the oldest ones beyond max_lines
+
+        Args:
+            events: DeathEvents in arrival order
+        """
+        now = time.monotonic()
+        self._entries.extend((now, event) for event in events)
+        self._trim()
+        self._schedule()
+
+    def clear(self):
+        """Remove every event and cancel the expiry timer"""
+        self._entries.clear()
+        self._cancel()
+
+    def _trim(self):
+        """Drop the oldest events beyond max_lines; returns True if any were dropped"""
+        removed = False
+        while len(self._entries) > self.max_lines:
+            self._entries.popleft()
+            removed = True
+        return removed
+
+    def _expire(self, now):
+        """Drop the events whose time is up; returns True if any were dropped"""
+        cutoff = now - self.ttl_seconds
+        removed = False
+        while self._entries and self._entries[0][0] <= cutoff:
+            self._entries.popleft()
+            removed = True
+        return removed
+
+    def _schedule(self):
+        """Arm the timer for the oldest event's deadline, replacing a timer set for another deadline"""
+        if not self._entries:
+            self._cancel()
+            return
+
+        deadline = self._entries[0][0] + self.ttl_seconds
+        if self._timer is not None and self._timer_deadline == deadline:
+            return
+
+        self._cancel()
+        delay_ms = max(0, int((deadline - time.monotonic()) * 1000) + 1)
+        self._timer = self.root.after(delay_ms, self._on_timer)
+        self._timer_deadline = deadline
+
+    def _cancel(self):
+        """Cancel the pending expiry timer"""
+        if self._timer is not None:
+            try:
+                self.root.after_cancel(self._timer)
+            except Exception:
+                pass
+        self._timer = None
+        self._timer_deadline = None
+
+    def _on_timer(self):
+        """Expire the due events and arm the timer for the next deadline; runs on the UI thread"""
+        self._timer = None
+        self._timer_deadline = None
+        if self._expire(time.monotonic()):
+            self.on_expire()
+        self._schedule()
@@ -0,0 +1,151 @@
+"""
+Weapon Resolver
+Maps weapon IDs from the log to friendly weapon names with a bounded cache
+"""
+
+import re
+from functools import lru_cache
+
+# Variant suffix on a code name, e.g. KLWE_LaserRepeater_S3_Banu -> KLWE_LaserRepeater_S3
+VARIANT_SUFFIX_PATTERN = re.compile(r'_[A-Z][a-z]+\d*$')
+
+
+def weapon_aliases(code_name):
+    """
+    Get the alternative keys a weapon code name should also be found under
+
+    Args:
+        code_name: Weapon code name as stored in weapon_ids.json
+
+    Returns:
+        List of alias keys: the lowercase name and the name without its variant suffix
+    """
+    aliases = [code_name.lower()]
+
+    # Extract base name without variant suffixes for matching log entries
+    base_name = VARIANT_SUFFIX_PATTERN.sub('', code_name)
+    if base_name != code_name and base_name:
+        aliases.append(base_name)
+        aliases.append(base_name.lower())
+
+    return aliases
+
+
+def build_weapon_lookup(weapon_ids):
+    """
+    Build the lookup table used by WeaponResolver
+
+    Args:
+        weapon_ids: Dictionary mapping weapon code names to friendly names
+
+    Returns:
+        Dictionary with every entry of weapon_ids plus the aliases not already present
+    """
+    lookup = dict(weapon_ids)
+    for code_name, display_name in weapon_ids.items():
+        for alias in weapon_aliases(code_name):
+            lookup.setdefault(alias, display_name)
+    return lookup
+
+
+def compact_weapon_ids(weapon_ids):
+    """
+    Drop entries that only repeat an alias derived from an earlier code name
+
+    Older weapon_ids.json files stored the lowercase and base-name aliases
+    as entries of their own. The result resolves every ID exactly like the
+    input; if it would not, the input is returned unchanged.
+
+    Args:
+        weapon_ids: Dictionary mapping weapon code names to friendly names
+
+    Returns:
+        Dictionary with one entry per code name
+    """
+    derived = {}
+    compact = {}
+    for code_name, display_name in weapon_ids.items():
+        if code_name in derived and derived[code_name] == display_name:
+            continue
+        compact[code_name] = display_name
+        for alias in weapon_aliases(code_name):
+            derived.setdefault(alias, display_name)
+
+    if len(compact) == len(weapon_ids) or build_weapon_lookup(compact) != build_weapon_lookup(weapon_ids):
+        return dict(weapon_ids)
+    return compact
+
+
+def strip_instance_suffix(weapon_id):
+    """
+    Remove the numeric instance suffix from a weapon ID
+
+    Example: KLWE_LaserRepeater_S3_2984839923407 -> KLWE_LaserRepeater_S3
+
+    Args:
+        weapon_id: Weapon ID from the log
+
+    Returns:
+        The ID without its trailing _<digits> part
+    """
+    base_id, separator, suffix = weapon_id.rpartition('_')
+    if separator and suffix.isdigit():
+        return base_id
+    return weapon_id
+
+
+class WeaponResolver:
+    def __init__(self, weapon_ids, cache_size=1024):
+        """
+        Initialize the resolver and fold variant aliases into one lookup table
+
+        weapon_ids only needs one entry per code name; the lowercase and
+        base-name aliases are derived here. Entries present in weapon_ids
+        always take precedence over derived aliases.
+
+        Args:
+            weapon_ids: Dictionary mapping weapon code names to friendly names
+            cache_size: Number of resolved weapon IDs to remember
+        """
+        self.weapon_ids = weapon_ids
+        self._lookup = build_weapon_lookup(weapon_ids)
+
+        self._cached_resolve = lru_cache(maxsize=cache_size)(self._resolve)
+
+    def resolve(self, weapon_id):
+        """
+        Get friendly weapon name from ID
+
+        Args:
+            weapon_id: Weapon ID from the log
+
+        Returns:
+            Friendly name, or the ID itself if it is unknown
+        """
+        if not weapon_id:
+            return None
+        return self._cached_resolve(weapon_id)
+
+    def cache_info(self):
+        """Return hits, misses and size of the resolution cache"""
+        return self._cached_resolve.cache_info()
+
+    def _resolve(self, weapon_id):
+        """Resolve a weapon ID without consulting the cache"""
+        lookup = self._lookup
+
+        # Try direct match
+        if weapon_id in lookup:
+            return lookup[weapon_id]
+
+        # Try lowercase match
+        weapon_id_lower = weapon_id.lower()
+        if weapon_id_lower in lookup:
+            return lookup[weapon_id_lower]
+
+        # Remove numeric suffix (e.g., '_200000056755', '_3013639860880')
+        base_id = strip_instance_suffix(weapon_id)
+        if base_id != weapon_id and base_id in lookup:
+            return lookup[base_id]
+
+        return weapon_id